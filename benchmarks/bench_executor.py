@@ -0,0 +1,49 @@
+"""Compare thread and process executors on independent CPU-bound branches.
+
+Run:  python benchmarks/bench_executor.py [rows] [branches]
+"""
+import sys
+import time
+
+import pandas as pd
+from processpipe import ProcessPipe
+
+
+def build(rows: int, branches: int, **kwargs) -> ProcessPipe:
+    pipe = ProcessPipe(**kwargs)
+    for b in range(branches):
+        src = f"events{b}"
+        frame = pd.DataFrame(
+            {"id": list(range(rows)), "v": [i % 97 for i in range(rows)]}
+        )
+        pipe.add_dataframe(src, frame)
+        pipe.case(
+            src,
+            conditions=["v > 80", "v > 40", "v > 10"],
+            choices=["high", "mid", "low"],
+            default="none",
+            output_col="band",
+            output=f"banded{b}",
+        )
+        pipe.partition_agg(
+            f"banded{b}", groupby=["band"], agg_map={"v": "mean"}, output=f"agg{b}"
+        )
+    return pipe
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    branches = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    for label, kwargs in [
+        ("sequential", {}),
+        ("thread", {"max_workers": branches}),
+        ("process", {"max_workers": branches, "executor": "process"}),
+    ]:
+        pipe = build(rows, branches, **kwargs)
+        start = time.perf_counter()
+        pipe.run()
+        print(f"{label:>10}: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,29 @@ from functools import wraps
 def command():
     """Decorator to mark a function as a command."""
     def decorator(func):
+        options = getattr(func, "__click_options__", [])
+
         @wraps(func)
         def wrapper(*args):
             if args and args[0] in {"--help", "-h"}:
                 echo(func.__doc__ or "")
                 return
-            return func(*args)
+            flags = {flag: opt for opt in options for flag in opt["decls"]}
+            kwargs = {
+                opt["dest"]: [] if opt["multiple"] else opt["default"]
+                for opt in options
+            }
+            positional = []
+            rest = iter(args)
+            for arg in rest:
+                opt = flags.get(arg)
+                if opt is None:
+                    positional.append(arg)
+                elif opt["multiple"]:
+                    kwargs[opt["dest"]].append(next(rest))
+                else:
+                    kwargs[opt["dest"]] = next(rest)
+            return func(*positional, **kwargs)
 
         return wrapper
     return decorator
@@ -26,6 +43,21 @@ def argument(name):  # noqa: ARG001 - name kept for compatibility
     return decorator
 
 
+def option(*decls, default=None, multiple=False, **_ignored):
+    """Decorator for ``--name VALUE`` options."""
+    def decorator(func):
+        dest = max(decls, key=len).lstrip("-").replace("-", "_")
+        spec = {
+            "decls": decls,
+            "dest": dest,
+            "default": default,
+            "multiple": multiple,
+        }
+        func.__click_options__ = [spec, *getattr(func, "__click_options__", [])]
+        return func
+    return decorator
+
+
 def group():
     """Decorator to create a command group."""
     def decorator(func):
@@ -164,10 +164,10 @@ class _GroupBy:
         if func != "size":
             raise ValueError(f"Unsupported transform '{func}'")
         counts = {}
-        for row in self._df._rows:
-            key = tuple(row.get(c) for c in self._by)
+        keys = [tuple(row.get(c) for c in self._by) for row in self._df._rows]
+        for key in keys:
             counts[key] = counts.get(key, 0) + 1
-        return [counts[tuple(row.get(c) for c in self._by)] for row in self._df._rows]
+        return [counts[key] for key in keys]
 
 
 # Submodule for testing
@@ -1,4 +1,6 @@
+from .core.cache import ResultCache
 from .core.pipe import ProcessPipe
+from .core.profiling import RunHook
 from .core.sql import sql_query
 from .plans.loader import load_plan
 from .operators import (
@@ -21,10 +23,13 @@ from .operators import (
     DeleteOperator,
     UpdateOperator,
     CaseOperator,
+    WindowOperator,
 )
 
 __all__ = [
     "ProcessPipe",
+    "ResultCache",
+    "RunHook",
     "JoinOperator",
     "UnionOperator",
     "AggregationOperator",
@@ -44,6 +49,7 @@ __all__ = [
     "DeleteOperator",
     "UpdateOperator",
     "CaseOperator",
+    "WindowOperator",
     "load_plan",
     "sql_query",
 ]
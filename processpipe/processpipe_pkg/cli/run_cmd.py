@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 import click
 
+from ..core.cache import ResultCache
 from ..plans.loader import load_plan
 
 
 @click.command()
 @click.argument("plan")
-def run_cmd(plan: str) -> None:
+@click.option(
+    "--cache-dir",
+    default=None,
+    help="Reuse operator results cached in this directory.",
+)
+@click.option(
+    "--target",
+    multiple=True,
+    help="Only compute this output (repeatable); prints the last one.",
+)
+def run_cmd(
+    plan: str, cache_dir: str | None = None, target: Sequence[str] = ()
+) -> None:
     """Execute a pipeline plan file."""
     pipe = load_plan(plan)
-    result = pipe.run()
+    if cache_dir:
+        pipe.cache = ResultCache(cache_dir)
+    result = pipe.run(targets=list(target) or None)
     click.echo(result)
+    if pipe.cache is not None:
+        click.echo(f"cache: {pipe.cache.stats()}")
@@ -0,0 +1,359 @@
+"""Mergeable aggregate functions and grouping sets.
+
+Every aggregate is an :class:`Accumulator`: it folds in a group's values a
+batch at a time and can absorb another accumulator of the same kind, so the
+partial results of fine groups roll up into coarser ones without revisiting
+the rows.  ``AggregationOperator`` uses this to answer ``grouping_sets``,
+``rollup`` and ``cube`` from a single hash pass over its input.
+
+Aggregates are looked up by name in :data:`AGGREGATES`; extensions add
+theirs with :func:`register_aggregate`.  The ``approx_*`` aggregates wrap the
+constant-size sketches of :mod:`.sketches` (see there for error bounds).
+"""
+from __future__ import annotations
+
+import abc
+from itertools import combinations
+from operator import methodcaller
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+import pandas as pd
+
+from .index import GroupIndex
+from .sketches import CountMinSketch, HyperLogLog, KLLSketch
+
+
+def _present(values: Sequence[Any]) -> Sequence[Any]:
+    return [v for v in values if v is not None] if None in values else values
+
+
+class Accumulator(abc.ABC):
+    """Partial aggregate of one group.
+
+    With ``rows_only`` set, :meth:`update` receives the group's row
+    positions instead of its values (for aggregates such as ``count`` that
+    never look at them).
+    """
+
+    rows_only = False
+
+    @abc.abstractmethod
+    def update(self, values: Sequence[Any]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def merge(self, other: "Accumulator") -> None:
+        ...
+
+    @abc.abstractmethod
+    def result(self) -> Any:
+        ...
+
+
+class Count(Accumulator):
+    """Number of rows, nulls included."""
+
+    rows_only = True
+
+    def __init__(self) -> None:
+        self.n = 0
+
+    def update(self, values: Sequence[Any]) -> None:
+        self.n += len(values)
+
+    def merge(self, other: "Count") -> None:
+        self.n += other.n
+
+    def result(self) -> int:
+        return self.n
+
+
+class Sum(Accumulator):
+    def __init__(self) -> None:
+        self.total: Any = None
+
+    def update(self, values: Sequence[Any]) -> None:
+        values = _present(values)
+        if values:
+            part = sum(values)
+            self.total = part if self.total is None else self.total + part
+
+    def merge(self, other: "Sum") -> None:
+        if other.total is not None:
+            self.update([other.total])
+
+    def result(self) -> Any:
+        return self.total
+
+
+class Mean(Accumulator):
+    def __init__(self) -> None:
+        self.total: Any = 0
+        self.n = 0
+
+    def update(self, values: Sequence[Any]) -> None:
+        values = _present(values)
+        self.total += sum(values)
+        self.n += len(values)
+
+    def merge(self, other: "Mean") -> None:
+        self.total += other.total
+        self.n += other.n
+
+    def result(self) -> Any:
+        return self.total / self.n if self.n else None
+
+
+class Min(Accumulator):
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def update(self, values: Sequence[Any]) -> None:
+        values = _present(values)
+        if values:
+            best = min(values)
+            if self.value is None or best < self.value:
+                self.value = best
+
+    def merge(self, other: "Min") -> None:
+        if other.value is not None:
+            self.update([other.value])
+
+    def result(self) -> Any:
+        return self.value
+
+
+class Max(Min):
+    def update(self, values: Sequence[Any]) -> None:
+        values = _present(values)
+        if values:
+            best = max(values)
+            if self.value is None or best > self.value:
+                self.value = best
+
+
+class SketchAggregate(Accumulator):
+    """Accumulator feeding the non-null values to a mergeable sketch."""
+
+    def __init__(self, sketch: Any, answer: Callable[[Any], Any]) -> None:
+        self.sketch = sketch
+        self.answer = answer
+
+    def update(self, values: Sequence[Any]) -> None:
+        self.sketch.update(_present(values))
+
+    def merge(self, other: "SketchAggregate") -> None:
+        self.sketch.merge(other.sketch)
+
+    def result(self) -> Any:
+        return self.answer(self.sketch)
+
+
+def _distinct() -> SketchAggregate:
+    return SketchAggregate(HyperLogLog(), methodcaller("estimate"))
+
+
+def _quantile(q: float) -> Callable[[], SketchAggregate]:
+    def factory() -> SketchAggregate:
+        return SketchAggregate(KLLSketch(), methodcaller("quantile", q))
+
+    return factory
+
+
+def _top_k() -> SketchAggregate:
+    return SketchAggregate(CountMinSketch(), methodcaller("top"))
+
+
+AGGREGATES: Dict[str, Callable[[], Accumulator]] = {
+    "count": Count,
+    "sum": Sum,
+    "mean": Mean,
+    "avg": Mean,
+    "average": Mean,
+    "min": Min,
+    "max": Max,
+    "approx_count_distinct": _distinct,
+    "approx_median": _quantile(0.5),
+    "approx_p90": _quantile(0.9),
+    "approx_p95": _quantile(0.95),
+    "approx_p99": _quantile(0.99),
+    "approx_top_k": _top_k,
+}
+
+
+def register_aggregate(name: str, factory: Callable[[], Accumulator]) -> None:
+    """Make ``factory`` available in ``agg_map`` under ``name``."""
+    AGGREGATES[name] = factory
+
+
+def _factory(func: str) -> Callable[[], Accumulator]:
+    factory = AGGREGATES.get(func)
+    if factory is None:
+        raise ValueError(f"Unsupported aggregation '{func}'")
+    return factory
+
+
+def accumulator(func: str) -> Accumulator:
+    """A fresh accumulator for the aggregate named ``func``."""
+    return _factory(func)()
+
+
+AggSpec = Tuple[str, str, str]  # (output column, input column, function)
+
+
+def parse_agg_map(agg_map: Mapping[str, Any]) -> List[AggSpec]:
+    """Flatten an ``agg_map`` into ``(output, column, func)`` triples.
+
+    Values may be a function name (output named after the column), a list
+    of names (outputs ``"{column}_{func}"``), or a named aggregate given as
+    ``(column, func)`` or ``{"column": ..., "func": ...}`` (output named
+    after the key).
+    """
+    specs: List[AggSpec] = []
+    for key, value in agg_map.items():
+        if isinstance(value, str):
+            specs.append((key, key, value))
+        elif isinstance(value, Mapping):
+            specs.append((key, value["column"], value["func"]))
+        elif isinstance(value, tuple):
+            column, func = value
+            specs.append((key, column, func))
+        else:
+            specs.extend((f"{key}_{func}", key, func) for func in value)
+    for _, _, func in specs:
+        _factory(func)
+    names = [name for name, _, _ in specs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate aggregate output columns in {names}")
+    return specs
+
+
+def grouping_sets(
+    groupby: Sequence[str],
+    sets: Sequence[Sequence[str]] | None = None,
+    *,
+    rollup: bool = False,
+    cube: bool = False,
+) -> List[List[str]] | None:
+    """Key sets to aggregate by, or ``None`` for plain ``groupby``.
+
+    ``rollup`` gives ``groupby`` and each of its prefixes down to the grand
+    total; ``cube`` every subset, largest first.  Columns keep their
+    ``groupby`` order.
+    """
+    if sum(bool(x) for x in (sets, rollup, cube)) > 1:
+        raise ValueError("Use only one of grouping_sets, rollup and cube")
+    cols = list(groupby)
+    if rollup:
+        return [cols[:k] for k in range(len(cols), -1, -1)]
+    if cube:
+        return [
+            list(subset)
+            for k in range(len(cols), -1, -1)
+            for subset in combinations(cols, k)
+        ]
+    if not sets:
+        return None
+    out = []
+    for s in sets:
+        s = [s] if isinstance(s, str) else list(s)
+        unknown = [c for c in s if c not in cols]
+        if unknown:
+            raise ValueError(f"Grouping set columns {unknown} are not in groupby")
+        out.append([c for c in cols if c in s])
+    return out
+
+
+def accumulate(
+    df: pd.DataFrame, index: GroupIndex, specs: Sequence[AggSpec]
+) -> List[List[Accumulator]]:
+    """One accumulator per spec for every group of ``index``."""
+    factories = [_factory(func) for _, _, func in specs]
+    columns: Dict[str, List[Any]] = {}
+    partials = []
+    for members in index.groups():
+        values: Dict[str, List[Any]] = {}
+        accs = []
+        for (_, col, _), factory in zip(specs, factories):
+            acc = factory()
+            if acc.rows_only:
+                acc.update(members)
+            else:
+                if col not in values:
+                    if col not in columns:
+                        columns[col] = df[col]
+                    column = columns[col]
+                    values[col] = [column[i] for i in members]
+                acc.update(values[col])
+            accs.append(acc)
+        partials.append(accs)
+    return partials
+
+
+def regroup(
+    keys: Sequence[tuple],
+    partials: Sequence[List[Accumulator]],
+    positions: Sequence[int],
+    specs: Sequence[AggSpec],
+) -> Tuple[List[tuple], List[List[Accumulator]]]:
+    """Merge groups into the coarser groups keyed on ``key[positions]``."""
+    factories = [_factory(func) for _, _, func in specs]
+    merged: Dict[tuple, List[Accumulator]] = {}
+    for key, accs in zip(keys, partials):
+        sub = tuple(key[i] for i in positions)
+        target = merged.get(sub)
+        if target is None:
+            target = merged[sub] = [factory() for factory in factories]
+        for into, acc in zip(target, accs):
+            into.merge(acc)
+    return list(merged), list(merged.values())
+
+
+def grouped_frame(
+    df: pd.DataFrame,
+    index: GroupIndex,
+    specs: Sequence[AggSpec],
+    sets: Sequence[Sequence[str]] | None = None,
+) -> pd.DataFrame:
+    """Aggregated frame of ``df`` grouped by ``index`` (and ``sets``).
+
+    With ``sets``, the groups of every set are stacked in order; key columns
+    outside a set are null and a ``grouping_id`` column carries one bit per
+    ``index`` column left out (the first column being the most significant).
+    A grand-total set (no columns) yields one row even when ``df`` is empty,
+    as in SQL; without groups the other sets yield the columns alone.
+    """
+    keys = index.columns
+    partials = accumulate(df, index, specs)
+    if sets is None:
+        blocks = [(keys, index.keys, partials)]
+    else:
+        blocks = []
+        for s in sets:
+            if list(s) == keys:
+                blocks.append((keys, index.keys, partials))
+                continue
+            positions = [keys.index(c) for c in s]
+            sub_keys, sub_partials = regroup(index.keys, partials, positions, specs)
+            blocks.append((list(s), sub_keys, sub_partials))
+    out: Dict[str, List[Any]] = {c: [] for c in keys}
+    for name, _, _ in specs:
+        out[name] = []
+    if sets is not None:
+        out["grouping_id"] = []
+    for cols, group_keys, accs in blocks:
+        if not cols and not group_keys:
+            group_keys, accs = [()], [[accumulator(f) for _, _, f in specs]]
+        for c in keys:
+            if c in cols:
+                at = cols.index(c)
+                out[c].extend(key[at] for key in group_keys)
+            else:
+                out[c].extend([None] * len(group_keys))
+        for j, (name, _, _) in enumerate(specs):
+            out[name].extend(a[j].result() for a in accs)
+        if sets is not None:
+            missing = [n for n, c in enumerate(keys) if c not in cols]
+            gid = sum(1 << (len(keys) - 1 - n) for n in missing)
+            out["grouping_id"].extend([gid] * len(group_keys))
+    return type(df)(out)
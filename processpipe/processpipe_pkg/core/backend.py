@@ -1,26 +1,186 @@
 from __future__ import annotations
-from typing import Protocol, List, Dict
+import re
+from typing import Any, Callable, Protocol, List, Dict, Mapping, Sequence
 import pandas as pd
 
+from .aggregate import grouped_frame, parse_agg_map
+from .expr import compile_expression
+from .frame import ColumnarFrame, take
+from .index import group_index
+from .joins import JoinIndexCache, hash_join
+
 
 class FrameBackend(Protocol):
+    """Frame operations the built-in operators delegate to.
+
+    Back-ends may also implement the column-wise methods of
+    :class:`InMemoryBackend` (``fill_na``, ``cast``, ``rename``,
+    ``str_contains``, ``str_replace``, ``where`` and ``case``); operators
+    look them up with ``getattr`` and fall back to a row loop otherwise.
+    """
+
     def merge(self, left, right, *, on, how): ...
     def concat(self, frames: List[pd.DataFrame], *, ignore_index): ...
-    def groupby_agg(self, df, groupby, agg_map: Dict[str, str]): ...
+    def groupby_agg(self, df, groupby, agg_map: Dict[str, Any]): ...
     def query(self, df, expr: str): ...
 
 
+def _cast_values(values: List[Any], func: Callable) -> List[Any]:
+    try:
+        return [None if v is None else func(v) for v in values]
+    except Exception:
+        pass
+    # slow path: keep the values the cast rejects
+    out = []
+    for v in values:
+        try:
+            out.append(None if v is None else func(v))
+        except Exception:
+            out.append(v)
+    return out
+
+
 class InMemoryBackend(FrameBackend):
-    """Pass-through to pandas; all frames remain in RAM."""
+    """Pass-through to pandas; all frames remain in RAM.
+
+    Join hash indexes are kept in :attr:`index_cache` (capped at
+    ``index_cache_bytes``) so joins against the same frame and key columns
+    reuse them.
+    """
+
+    def __init__(self, index_cache_bytes: int = 256 * 2**20) -> None:
+        self.index_cache = JoinIndexCache(index_cache_bytes)
 
     def merge(self, left, right, *, on, how="left"):
         return left.merge(right, on=on, how=how)
 
+    def hash_join(
+        self,
+        left,
+        right,
+        *,
+        left_on: Sequence[str],
+        right_on: Sequence[str],
+        how: str = "inner",
+        predicates: Sequence = (),
+        suffixes=("_left", "_right"),
+    ):
+        """Join via :func:`~.joins.hash_join`; returns ``(frame, stats)``."""
+        return hash_join(
+            left,
+            right,
+            left_on,
+            right_on,
+            how,
+            predicates,
+            suffixes,
+            cache=self.index_cache,
+        )
+
     def concat(self, frames, *, ignore_index=True):
+        if any(isinstance(f, ColumnarFrame) for f in frames):
+            return ColumnarFrame.concat(frames)
         return pd.concat(frames, ignore_index=ignore_index)
 
-    def groupby_agg(self, df, groupby, agg_map):
-        return df.groupby(groupby).agg(agg_map).reset_index()
+    def groupby_agg(self, df, groupby, agg_map, grouping_sets=None):
+        """Aggregate ``df`` per ``groupby`` key (see :mod:`.aggregate`).
+
+        ``grouping_sets`` lists subsets of ``groupby`` to aggregate by
+        instead; all of them are rolled up from one pass over the finest
+        grouping.
+        """
+        keys = [groupby] if isinstance(groupby, str) else list(groupby)
+        specs = parse_agg_map(agg_map)
+        index = group_index(self, df, keys)
+        return grouped_frame(df, index, specs, grouping_sets)
 
     def query(self, df, expr):
-        return df.query(expr)
+        keep = compile_expression(expr).mask(df)
+        return take(df, [i for i, k in enumerate(keep) if k])
+
+    # ── column-wise row operations ───────────────────────────────
+    def fill_na(self, df, value, columns: Sequence[str] | None = None):
+        out = df.copy()
+        for c in columns or df.columns:
+            values = df[c]
+            if None in values:
+                out[c] = [value if v is None else v for v in values]
+        return out
+
+    def cast(self, df, casts: Mapping[str, Callable]):
+        out = df.copy()
+        present = df.columns
+        for col, func in casts.items():
+            if col in present:
+                out[col] = _cast_values(df[col], func)
+        return out
+
+    def rename(self, df, columns: Mapping[str, str]):
+        cols = {c: df[c] for c in df.columns}
+        if not cols:
+            return df.copy()
+        for old, new in columns.items():
+            if old in cols:
+                cols[new] = cols.pop(old)
+        return type(df)(cols)
+
+    def str_contains(self, df, column: str, pattern: str, target: str):
+        search = re.compile(pattern).search
+        out = df.copy()
+        out[target] = [None if v is None else bool(search(str(v))) for v in df[column]]
+        return out
+
+    def str_replace(
+        self, df, column: str, pattern: str, replacement: str, target: str
+    ):
+        sub = re.compile(pattern).sub
+        out = df.copy()
+        out[target] = [
+            None if v is None else sub(replacement, str(v)) for v in df[column]
+        ]
+        return out
+
+    def where(self, df, condition: str, set_map: Mapping[str, Any]):
+        """Set ``set_map`` columns on the rows matching ``condition``."""
+        hit = compile_expression(condition).mask(df)
+        out = df.copy()
+        if not isinstance(out, ColumnarFrame):
+            # row frames may be ragged: leave the rows that did not match alone
+            for row, h in zip(out._rows, hit):
+                if h:
+                    row.update(set_map)
+            return out
+        present = df.columns
+        for col, val in set_map.items():
+            if col not in present:
+                if not any(hit):
+                    continue
+                old = [None] * len(hit)
+            else:
+                old = df[col]
+            out[col] = [val if h else v for v, h in zip(old, hit)]
+        return out
+
+    def case(
+        self,
+        df,
+        conditions: Sequence[str],
+        choices: Sequence[Any],
+        default: Any,
+        output_col: str,
+    ):
+        """Add ``output_col`` holding the choice of each row's first match."""
+        values = [default] * df.shape[0]
+        # each condition only sees the rows no earlier condition matched
+        pending = list(range(len(values)))
+        for cond, choice in zip(conditions, choices):
+            if not pending:
+                break
+            hit = compile_expression(cond).mask(df, pending)
+            for i, h in zip(pending, hit):
+                if h:
+                    values[i] = choice
+            pending = [i for i, h in zip(pending, hit) if not h]
+        out = df.copy()
+        out[output_col] = values
+        return out
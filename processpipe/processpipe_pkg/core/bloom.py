@@ -0,0 +1,65 @@
+"""Bloom filter over hashable keys.
+
+Membership answers "possibly present" or "definitely absent": a key that was
+added is always found, other keys are found with probability roughly
+``fp_rate``.  Bits are derived from :func:`hash`, so a filter unpickled in a
+process with a different hash seed cannot test string keys; it then reports
+every key as possibly present, which is always safe.
+"""
+from __future__ import annotations
+
+import math
+from typing import Hashable, Iterable
+
+_SALT = "processpipe.bloom"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for ``capacity`` keys."""
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01) -> None:
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        capacity = max(1, capacity)
+        nbits = math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+        self.nbits = max(8, nbits)
+        self.nhashes = max(1, round(self.nbits / capacity * math.log(2)))
+        self._bits = bytearray((self.nbits + 7) // 8)
+        self._seed = hash(_SALT)
+
+    @classmethod
+    def from_keys(
+        cls, keys: Iterable[Hashable], capacity: int, fp_rate: float = 0.01
+    ) -> "BloomFilter":
+        bloom = cls(capacity, fp_rate)
+        bloom.update(keys)
+        return bloom
+
+    def _positions(self, key: Hashable):
+        # double hashing: k positions from two independent hashes
+        h1 = hash(key)
+        h2 = hash((key, _SALT)) | 1
+        nbits = self.nbits
+        return [(h1 + i * h2) % nbits for i in range(self.nhashes)]
+
+    def add(self, key: Hashable) -> None:
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        if self._seed != hash(_SALT):
+            return True
+        bits = self._bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
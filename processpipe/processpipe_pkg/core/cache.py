@@ -0,0 +1,141 @@
+"""Content-addressed on-disk cache of operator results."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import types
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from ..operators import Operator
+from .codec import decode_frame, encode_frame
+
+log = logging.getLogger("processpipe")
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Hash of a frame's content (column names, order and values)."""
+    return hashlib.blake2b(encode_frame(df), digest_size=20).hexdigest()
+
+
+def _stable(obj: Any) -> str:
+    """Deterministic text form of an operator parameter.
+
+    Functions are named by module and qualname plus a hash of their
+    bytecode, constants, defaults and closure, so editing a function's body
+    changes the key.  Raises ``TypeError`` for values without a stable form
+    (lambdas, arbitrary objects), which makes the operator uncacheable.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        return repr(obj)
+    if isinstance(obj, (list, tuple)):
+        inner = ",".join(_stable(v) for v in obj)
+        return f"[{inner}]" if isinstance(obj, list) else f"({inner})"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ",".join(sorted(_stable(v) for v in obj)) + "}"
+    if isinstance(obj, dict):
+        items = sorted(f"{_stable(k)}:{_stable(v)}" for k, v in obj.items())
+        return "{" + ",".join(items) + "}"
+    qualname = getattr(obj, "__qualname__", "")
+    if callable(obj) and qualname and "<" not in qualname:
+        name = f"{obj.__module__}.{qualname}"
+        code = getattr(obj, "__code__", None)
+        if code is None:
+            return name
+        cells = [cell.cell_contents for cell in obj.__closure__ or ()]
+        body = _stable([_code_text(code), obj.__defaults__, obj.__kwdefaults__, cells])
+        return f"{name}#{hashlib.blake2b(body.encode(), digest_size=8).hexdigest()}"
+    raise TypeError(f"no stable representation for {type(obj).__name__}")
+
+
+def _code_text(code: types.CodeType) -> str:
+    consts = ",".join(
+        _code_text(c) if isinstance(c, types.CodeType) else _stable(c)
+        for c in code.co_consts
+    )
+    return f"{code.co_code.hex()}|{consts}|{','.join(code.co_names)}"
+
+
+def operator_fingerprint(op: Operator, input_fingerprints: List[str]) -> str | None:
+    """Key an operator run by its class, parameters and input contents.
+
+    Public attributes other than ``output`` count as parameters.  Returns
+    ``None`` when a parameter has no stable representation.
+    """
+    params = {
+        k: v for k, v in vars(op).items() if not k.startswith("_") and k != "output"
+    }
+    cls = type(op)
+    try:
+        text = _stable([f"{cls.__module__}.{cls.__qualname__}", params])
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(text.encode(), digest_size=20)
+    for fp in input_fingerprints:
+        digest.update(fp.encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Directory of encoded operator outputs keyed by fingerprint.
+
+    Entries are evicted least-recently-used first once their total size
+    exceeds ``max_bytes``.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 2**30) -> None:
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.ppf"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return decode_frame(data)
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode_frame(df))
+        os.replace(tmp, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(
+            (p.stat().st_mtime, p.stat().st_size, p)
+            for p in self.directory.glob("*.ppf")
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink()
+            total -= size
+            self.evictions += 1
+            log.info("cache evicted %s", path.name)
+
+    def stats(self) -> Dict[str, int]:
+        files = list(self.directory.glob("*.ppf"))
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(files),
+            "bytes": sum(p.stat().st_size for p in files),
+        }
@@ -0,0 +1,157 @@
+"""Worker pools that run operators for :meth:`ProcessPipe.run`."""
+from __future__ import annotations
+
+import pickle
+import tracemalloc
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, MutableMapping, Tuple
+
+import pandas as pd
+
+from ..operators import Operator
+from .backend import FrameBackend
+from .codec import decode_frame, encode_frame
+from .profiling import OperatorStats, measure
+
+SharedHandle = Tuple[str, int]
+Measured = Tuple[pd.DataFrame, OperatorStats]
+
+
+class ThreadExecutor:
+    """Run operators on a thread pool sharing the pipe's environment.
+
+    Operators are timed by the worker that runs them, so :meth:`result`
+    returns the output frame together with its :class:`OperatorStats`.
+    """
+
+    def __init__(
+        self,
+        backend: FrameBackend,
+        env: MutableMapping[str, pd.DataFrame],
+        max_workers: int,
+        trace_memory: bool = False,
+    ) -> None:
+        self.backend = backend
+        self.env = env
+        self.trace_memory = trace_memory
+        self._threads = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(self, op: Operator, prefilter: Any = None) -> Future:
+        """Start ``op``, reading its input through ``prefilter`` if given."""
+        return self._threads.submit(
+            measure, op, self.backend, self.env, self.trace_memory, prefilter
+        )
+
+    def result(self, fut: Future, op: Operator) -> Measured:
+        return fut.result()
+
+    def release(self, name: str) -> None:
+        """Forget any per-frame state kept for ``name``."""
+
+    def close(self, wait: bool = True) -> None:
+        self._threads.shutdown(wait=wait)
+
+    def __enter__(self) -> "ThreadExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _to_shared(df: pd.DataFrame) -> Tuple[SharedMemory, int]:
+    data = encode_frame(df)
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[: len(data)] = data
+    return shm, len(data)
+
+
+def _from_shared(handle: SharedHandle) -> pd.DataFrame:
+    name, size = handle
+    shm = SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+    return decode_frame(data)
+
+
+def _execute_shared(
+    op: Operator,
+    backend: FrameBackend,
+    inputs: Dict[str, SharedHandle],
+    trace_memory: bool,
+    prefilter: Any,
+) -> Tuple[SharedHandle, OperatorStats]:
+    """Worker entry point: decode inputs, run ``op`` and publish its output."""
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    env = {name: _from_shared(handle) for name, handle in inputs.items()}
+    res, stats = measure(op, backend, env, trace_memory, prefilter)
+    shm, size = _to_shared(res)
+    shm.close()
+    return (shm.name, size), stats
+
+
+class ProcessExecutor(ThreadExecutor):
+    """Run operators in worker processes, side-stepping the GIL.
+
+    Input and output frames travel through shared-memory blocks holding the
+    :mod:`codec` encoding, so each frame is encoded once however many
+    operators read it.  Operators that cannot be pickled (for example those
+    built with the ``@op`` decorator) fall back to the thread pool.
+    """
+
+    def __init__(
+        self,
+        backend: FrameBackend,
+        env: MutableMapping[str, pd.DataFrame],
+        max_workers: int,
+        trace_memory: bool = False,
+    ) -> None:
+        super().__init__(backend, env, max_workers, trace_memory)
+        self._processes = ProcessPoolExecutor(max_workers=max_workers)
+        self._shared: Dict[str, SharedMemory] = {}
+        self._sizes: Dict[str, int] = {}
+
+    def _export(self, name: str) -> SharedHandle:
+        if name not in self._shared:
+            self._shared[name], self._sizes[name] = _to_shared(self.env[name])
+        return self._shared[name].name, self._sizes[name]
+
+    def submit(self, op: Operator, prefilter: Any = None) -> Future:
+        try:
+            pickle.dumps(op)
+        except Exception:  # noqa: BLE001 - any pickling failure means local
+            return super().submit(op, prefilter)
+        missing = [k for k in op.inputs if k not in self.env]
+        if missing:
+            raise KeyError(f"{op.__class__.__name__}: missing '{missing[0]}'")
+        inputs = {k: self._export(k) for k in dict.fromkeys(op.inputs)}
+        return self._processes.submit(
+            _execute_shared, op, self.backend, inputs, self.trace_memory, prefilter
+        )
+
+    def result(self, fut: Future, op: Operator) -> Measured:
+        res, stats = fut.result()
+        if not isinstance(res, tuple):
+            return res, stats
+        name, size = res
+        shm = SharedMemory(name=name)
+        # keep the encoded output around: downstream workers reuse it as is
+        self._shared[op.output] = shm
+        self._sizes[op.output] = size
+        return decode_frame(bytes(shm.buf[:size])), stats
+
+    def release(self, name: str) -> None:
+        shm = self._shared.pop(name, None)
+        self._sizes.pop(name, None)
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    def close(self, wait: bool = True) -> None:
+        self._processes.shutdown(wait=wait)
+        super().close(wait)
+        for name in list(self._shared):
+            self.release(name)
@@ -0,0 +1,175 @@
+"""Row predicates and expressions, parsed and compiled once.
+
+Expressions use Python syntax over column names, e.g.
+``"amount > 50 and region == 'east'"``.  They are validated against a
+whitelist of node types (no lambdas, comprehensions, imports or dunder
+attributes; calls only to a few pure builtins and to public methods), then
+compiled into a function taking the referenced columns as arguments, which
+is applied column-at-a-time over a frame.
+
+A row on which the expression raises (a missing value, a type mismatch)
+evaluates to *unknown*; :meth:`Expression.mask` treats that as ``False``.
+So does a row of a ragged row frame that lacks a referenced column, as it
+did when each row was ``eval``'d with its own dict.
+An expression that does not parse or uses a forbidden construct raises
+``ValueError`` when it is compiled.
+"""
+from __future__ import annotations
+
+import ast
+import builtins
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+import pandas as pd
+
+SAFE_BUILTINS = {
+    name: getattr(builtins, name)
+    for name in ("abs", "bool", "float", "int", "len", "max", "min", "round", "str")
+}
+
+_ALLOWED = tuple(
+    getattr(ast, name)
+    for name in """
+        Expression BoolOp And Or UnaryOp Not USub UAdd Invert BinOp Add Sub Mult
+        Div FloorDiv Mod Pow BitAnd BitOr BitXor LShift RShift Compare Eq NotEq Lt
+        LtE Gt GtE In NotIn Is IsNot IfExp Call keyword Name Load Constant
+        Attribute Subscript Index Slice Tuple List Set
+    """.split()
+    if hasattr(ast, name)
+)
+
+_UNKNOWN = object()
+_MISSING = object()  # a column the row itself lacks
+
+
+def _validate(tree: ast.AST, source: str) -> None:
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED):
+            kind = type(node).__name__
+            raise ValueError(f"Unsupported expression {source!r}: {kind} not allowed")
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError(
+                f"Unsupported expression {source!r}: private attribute '{node.attr}'"
+            )
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id not in SAFE_BUILTINS:
+                raise ValueError(
+                    f"Unsupported expression {source!r}: call to '{func.id}'"
+                )
+            if not isinstance(func, (ast.Name, ast.Attribute)):
+                raise ValueError(f"Unsupported expression {source!r}: indirect call")
+
+
+class Expression:
+    """A validated expression over column names."""
+
+    def __init__(self, source: str) -> None:
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as exc:
+            raise ValueError(f"Invalid expression {source!r}: {exc.msg}") from None
+        _validate(tree, source)
+        self.source = source
+        self._tree = tree
+        #: every name the expression reads, in first-use order
+        found = [node for node in ast.walk(tree) if isinstance(node, ast.Name)]
+        found.sort(key=lambda node: (node.lineno, node.col_offset))
+        self.names: Tuple[str, ...] = tuple(dict.fromkeys(n.id for n in found))
+
+    def __repr__(self) -> str:
+        return f"Expression({self.source!r})"
+
+    def parameters(self, columns: Iterable[str]) -> Tuple[str, ...]:
+        """Names read from the row; columns shadow builtins of the same name."""
+        columns = set(columns)
+        return tuple(n for n in self.names if n not in SAFE_BUILTINS or n in columns)
+
+    def function(self, params: Sequence[str]) -> Callable[..., Any]:
+        """The expression as a function of the ``params`` columns."""
+        return _function(self.source, tuple(params))
+
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        positions: Sequence[int] | None = None,
+        default: Any = None,
+    ) -> List[Any]:
+        """Value for each row (or each row in ``positions``).
+
+        Rows where evaluation raises get ``default``; if a referenced column
+        is absent from ``df`` every row does.
+        """
+        columns = df.columns
+        nrows = df.shape[0] if positions is None else len(positions)
+        params = self.parameters(columns)
+        if any(name not in columns for name in params):
+            return [default] * nrows
+        fn = self.function(params)
+        values = _column_values(df, params)
+        if positions is not None:
+            values = [[col[i] for i in positions] for col in values]
+        ragged = any(_MISSING in col for col in values)
+        out = []
+        append = out.append
+        for args in zip(*values) if values else repeat((), nrows):
+            if ragged and _MISSING in args:
+                append(default)
+                continue
+            try:
+                append(fn(*args))
+            except Exception:  # noqa: BLE001 - unknown for this row only
+                append(default)
+        return out
+
+    def mask(
+        self, df: pd.DataFrame, positions: Sequence[int] | None = None
+    ) -> List[bool]:
+        """Truth value per row; unknown counts as ``False``."""
+        return [
+            v is not _UNKNOWN and _truth(v)
+            for v in self.evaluate(df, positions, _UNKNOWN)
+        ]
+
+
+def _column_values(df: pd.DataFrame, names: Sequence[str]) -> List[List[Any]]:
+    """Values of each of ``names``; a key a row dict lacks reads as
+    ``_MISSING`` rather than ``None``."""
+    # a ColumnarFrame has ``_row_list`` (``None`` while columnar); reading its
+    # ``_rows`` would materialise the rows
+    rows = df._row_list if hasattr(df, "_row_list") else getattr(df, "_rows", None)
+    if rows is None:
+        return [df[name] for name in names]
+    return [[row.get(name, _MISSING) for row in rows] for name in names]
+
+
+def _truth(value: Any) -> bool:
+    try:
+        return bool(value)
+    except Exception:  # noqa: BLE001 - e.g. ambiguous truth values
+        return False
+
+
+@lru_cache(maxsize=256)
+def compile_expression(source: str) -> Expression:
+    """Parse and validate ``source``; results are cached per string."""
+    return Expression(source)
+
+
+@lru_cache(maxsize=512)
+def _function(source: str, params: Tuple[str, ...]) -> Callable[..., Any]:
+    body = compile_expression(source)._tree.body
+    args = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=name) for name in params],
+        vararg=None,
+        kwonlyargs=[],
+        kw_defaults=[],
+        kwarg=None,
+        defaults=[],
+    )
+    tree = ast.fix_missing_locations(ast.Expression(ast.Lambda(args=args, body=body)))
+    code = compile(tree, f"<expression {source!r}>", "eval")
+    return eval(code, {"__builtins__": SAFE_BUILTINS})
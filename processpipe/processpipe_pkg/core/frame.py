@@ -0,0 +1,370 @@
+"""Column-oriented frame implementing the bundled ``pandas.DataFrame`` API.
+
+:class:`ColumnarFrame` keeps one storage object per column: an ``array('q')``
+or ``array('d')`` for integer and float columns (with a byte mask marking
+nulls) and a plain list for anything else.  ``columns`` and ``shape`` are
+O(1), a column read is a single C-level copy, and an integer or float value
+costs 8 bytes instead of a slot in a per-row dict.
+
+Operators written against the row form still work: reading ``_rows``
+materialises the rows and from then on they are authoritative, so in-place
+row edits are honoured.  ``copy()`` (which operators call before editing)
+returns a columnar frame again.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import pandas as pd
+
+from .expr import compile_expression
+
+_INT64 = (-(2**63), 2**63 - 1)
+_SAMPLE = 100
+
+Storage = Any  # array or list
+_NUMERIC = {int: "q", float: "d"}
+
+
+def nrows(df: pd.DataFrame) -> int:
+    """Row count without the full scan ``shape`` costs on row frames."""
+    try:
+        return len(df)
+    except TypeError:
+        return len(df._rows) if hasattr(df, "_rows") else df.shape[0]
+
+
+def _pack(values: Sequence[Any]) -> Tuple[Storage, bytearray | None]:
+    """Typed storage and null mask (``None`` when there are no nulls)."""
+    types = set(map(type, values))
+    nulls = type(None) in types
+    types.discard(type(None))
+    if len(types) != 1 or next(iter(types)) not in _NUMERIC:
+        return list(values), None
+    kind = _NUMERIC[next(iter(types))]
+    if nulls:
+        zero = 0 if kind == "q" else 0.0
+        source = [zero if v is None else v for v in values]
+    else:
+        source = values
+    try:
+        data = array(kind, source)
+    except OverflowError:
+        return list(values), None
+    mask = bytearray(v is None for v in values) if nulls else None
+    return data, mask
+
+
+def _unpack(data: Storage, mask: bytearray | None) -> List[Any]:
+    values = data.tolist() if isinstance(data, array) else list(data)
+    if mask is not None:
+        values = [None if m else v for v, m in zip(values, mask)]
+    return values
+
+
+def _take(data: Storage, positions: Sequence[int]) -> Storage:
+    picked = [data[i] for i in positions]
+    return array(data.typecode, picked) if isinstance(data, array) else picked
+
+
+class ColumnarFrame:
+    """Frame holding one typed array or list per column."""
+
+    def __init__(self, data: Any = None) -> None:
+        self._data: Dict[str, Storage] = {}
+        self._masks: Dict[str, bytearray | None] = {}
+        self._nrows = 0
+        self._row_list: List[Dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+        if data is None:
+            return
+        if isinstance(data, ColumnarFrame):
+            rows, columns, masks = data._storage()
+            if rows is not None:
+                self._load_rows(rows)
+            else:
+                # storage is never modified in place, so it can be shared
+                self._data = dict(columns)
+                self._masks = dict(masks)
+                self._nrows = data._nrows
+        elif isinstance(data, dict):
+            lengths = {len(v) for v in data.values()}
+            if len(lengths) > 1:
+                raise ValueError("Column lengths not equal")
+            self._nrows = lengths.pop() if lengths else 0
+            for name, values in data.items():
+                self._data[name], self._masks[name] = _pack(values)
+        elif isinstance(data, list):
+            self._load_rows(data)
+        elif hasattr(data, "columns"):
+            self._nrows = data.shape[0]
+            for name in data.columns:
+                self._data[name], self._masks[name] = _pack(data[name])
+        else:
+            raise TypeError("Unsupported data type for ColumnarFrame")
+
+    def _load_rows(self, rows: List[Dict[str, Any]]) -> None:
+        names: Dict[str, None] = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+        self._nrows = len(rows)
+        for name in names:
+            values = [row.get(name) for row in rows]
+            self._data[name], self._masks[name] = _pack(values)
+
+    @classmethod
+    def _from_storage(
+        cls,
+        nrows: int,
+        data: Dict[str, Storage],
+        masks: Dict[str, bytearray | None],
+    ) -> "ColumnarFrame":
+        frame = cls()
+        frame._nrows, frame._data, frame._masks = nrows, data, masks
+        return frame
+
+    def _storage(self) -> Tuple[List[Dict[str, Any]] | None, Dict, Dict]:
+        """``(rows, columns, masks)``; ``rows`` is ``None`` while the columns
+        are authoritative."""
+        # columns first: ``_rows`` publishes the rows before it drops the
+        # columns, so a reader in another thread sees one or the other intact
+        data, masks = self._data, self._masks
+        return self._row_list, data, masks
+
+    # ── conversion ───────────────────────────────────────────────
+    @property
+    def _rows(self) -> List[Dict[str, Any]]:
+        """Row dicts; once read, they become the frame's storage."""
+        if self._row_list is None:
+            with self._lock:
+                if self._row_list is None:
+                    names = list(self._data)
+                    columns = [self[name] for name in names]
+                    rows = [dict(zip(names, values)) for values in zip(*columns)]
+                    if not names:
+                        rows = [{} for _ in range(self._nrows)]
+                    self._row_list = rows
+                    self._data, self._masks = {}, {}
+        return self._row_list
+
+    def to_frame(self) -> pd.DataFrame:
+        """The same data as a row-oriented :class:`pandas.DataFrame`."""
+        rows, data, masks = self._storage()
+        if rows is not None:
+            return pd.DataFrame(rows)
+        if not data:
+            return pd.DataFrame([{} for _ in range(self._nrows)])
+        return pd.DataFrame({name: _unpack(data[name], masks[name]) for name in data})
+
+    # ── pandas-like API ──────────────────────────────────────────
+    @property
+    def columns(self) -> List[str]:
+        rows, data, _ = self._storage()
+        if rows is not None:
+            names: Dict[str, None] = {}
+            for row in rows:
+                names.update(dict.fromkeys(row))
+            return list(names)
+        return list(data)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self), len(self.columns))
+
+    def __len__(self) -> int:
+        if self._row_list is not None:
+            return len(self._row_list)
+        return self._nrows
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the column storage."""
+        rows, columns, masks = self._storage()
+        if rows is not None:
+            return sys.getsizeof(rows) + sum(sys.getsizeof(r) for r in rows)
+        total = 0
+        for name, data in columns.items():
+            mask = masks[name]
+            total += len(mask) if mask is not None else 0
+            if isinstance(data, array):
+                total += len(data) * data.itemsize
+            elif data:
+                sample = data[:_SAMPLE]
+                per_value = sum(sys.getsizeof(v) for v in sample) / len(sample)
+                total += int((8 + per_value) * len(data))
+        return total
+
+    def __getitem__(self, key: str) -> List[Any]:
+        if not isinstance(key, str):
+            raise TypeError("Only column access by name is supported")
+        rows, data, masks = self._storage()
+        if rows is not None:
+            return [row.get(key) for row in rows]
+        if key not in data:
+            return [None] * self._nrows
+        return _unpack(data[key], masks[key])
+
+    def __setitem__(self, key: str, values: Sequence[Any]) -> None:
+        if len(values) != len(self):
+            raise ValueError("Length mismatch")
+        if self._row_list is not None:
+            for row, val in zip(self._row_list, values):
+                row[key] = val
+            return
+        self._data[key], self._masks[key] = _pack(values)
+
+    def copy(self) -> "ColumnarFrame":
+        return ColumnarFrame(self)
+
+    def reset_index(self, drop: bool = False) -> "ColumnarFrame":
+        return self.copy()
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {name: self[name] for name in self.columns}
+
+    def __repr__(self) -> str:
+        return f"ColumnarFrame({self.to_dict()})"
+
+    def take(self, positions: Sequence[int]) -> "ColumnarFrame":
+        """New frame with the rows at ``positions``, in that order."""
+        rows, columns, column_masks = self._storage()
+        if rows is not None:
+            return ColumnarFrame([rows[i] for i in positions])
+        data = {name: _take(col, positions) for name, col in columns.items()}
+        masks = {}
+        for name, mask in column_masks.items():
+            if mask is not None:
+                picked = bytearray(mask[i] for i in positions)
+                mask = picked if any(picked) else None
+            masks[name] = mask
+        return ColumnarFrame._from_storage(len(positions), data, masks)
+
+    def query(self, expr: str) -> "ColumnarFrame":
+        keep = compile_expression(expr).mask(self)
+        return self.take([i for i, k in enumerate(keep) if k])
+
+    def merge(self, right: Any, *, on: Any, how: str = "left") -> "ColumnarFrame":
+        """Hash join with the semantics of the row-oriented ``merge``."""
+        on_cols = [on] if isinstance(on, str) else list(on)
+        left_keys = list(zip(*(self[c] for c in on_cols)))
+        right_keys = list(zip(*(right[c] for c in on_cols)))
+        index: Dict[Tuple, List[int]] = {}
+        for j, key in enumerate(right_keys):
+            index.setdefault(key, []).append(j)
+        lpos: List[int | None] = []
+        rpos: List[int | None] = []
+        for i, key in enumerate(left_keys):
+            matches = index.get(key)
+            if matches:
+                lpos.extend([i] * len(matches))
+                rpos.extend(matches)
+            elif how in ("left", "outer"):
+                lpos.append(i)
+                rpos.append(None)
+        if how in ("right", "outer"):
+            seen = set(left_keys)
+            for j, key in enumerate(right_keys):
+                if key not in seen:
+                    lpos.append(None)
+                    rpos.append(j)
+        left_cols = self.columns
+        right_cols = [c for c in right.columns if c not in on_cols]
+        if any(i is not None for i in lpos) or not rpos:
+            names = left_cols + [c for c in right_cols if c not in left_cols]
+        else:
+            names = [c for c in left_cols if c not in on_cols] + right.columns
+        out = {}
+        for name in names:
+            lvals = self[name] if name in left_cols else None
+            rvals = right[name] if name in right_cols or name in on_cols else None
+            column = []
+            for i, j in zip(lpos, rpos):
+                if j is not None and rvals is not None and (
+                    name in right_cols or i is None
+                ):
+                    column.append(rvals[j])
+                elif i is not None and lvals is not None:
+                    column.append(lvals[i])
+                else:
+                    column.append(None)
+            out[name] = column
+        if not out:
+            return ColumnarFrame([{} for _ in lpos])
+        return ColumnarFrame(out)
+
+    def groupby(self, by: Any) -> "_ColumnarGroupBy":
+        return _ColumnarGroupBy(self, by)
+
+    @classmethod
+    def concat(cls, frames: Iterable[Any]) -> "ColumnarFrame":
+        """Stack ``frames`` (of any frame type) vertically."""
+        frames = list(frames)
+        names: Dict[str, None] = {}
+        for f in frames:
+            names.update(dict.fromkeys(f.columns))
+        if not names:
+            return cls([{} for f in frames for _ in range(f.shape[0])])
+        out = {}
+        for name in names:
+            column: List[Any] = []
+            for f in frames:
+                column.extend(f[name])
+            out[name] = column
+        return cls(out)
+
+
+class _ColumnarGroupBy:
+    """``groupby`` subset matching the row-oriented frame's."""
+
+    def __init__(self, df: ColumnarFrame, by: Any) -> None:
+        self._df = df
+        self._by = [by] if isinstance(by, str) else list(by)
+
+    def _keys(self) -> List[Tuple]:
+        return list(zip(*(self._df[c] for c in self._by)))
+
+    def agg(self, agg_map: Dict[str, str]) -> ColumnarFrame:
+        groups: Dict[Tuple, List[int]] = {}
+        for i, key in enumerate(self._keys()):
+            groups.setdefault(key, []).append(i)
+        out = {c: [key[n] for key in groups] for n, c in enumerate(self._by)}
+        for col, func in agg_map.items():
+            column = self._df[col]
+            results = []
+            for members in groups.values():
+                vals = [column[i] for i in members]
+                if func == "sum":
+                    val = sum(vals)
+                elif func in ("mean", "avg", "average"):
+                    val = sum(vals) / len(vals) if vals else None
+                elif func == "min":
+                    val = min(vals)
+                elif func == "max":
+                    val = max(vals)
+                elif func == "count":
+                    val = len(members)
+                else:
+                    raise ValueError(f"Unsupported aggregation '{func}'")
+                results.append(val)
+            out[col] = results
+        return ColumnarFrame(out)
+
+    def transform(self, func: str) -> List[int]:
+        if func != "size":
+            raise ValueError(f"Unsupported transform '{func}'")
+        keys = self._keys()
+        counts: Dict[Tuple, int] = {}
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+        return [counts[key] for key in keys]
+
+
+def take(df: Any, positions: Sequence[int]) -> Any:
+    """Rows of ``df`` at ``positions`` as a new frame of the same kind."""
+    if isinstance(df, ColumnarFrame):
+        return df.take(positions)
+    rows = df._rows
+    return pd.DataFrame([rows[i] for i in positions])
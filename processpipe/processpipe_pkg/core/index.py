@@ -0,0 +1,91 @@
+"""Group indexes shared by the grouping operators.
+
+A :class:`GroupIndex` hashes a frame's key columns once and records, for
+every row, the dense id of its group plus the rows of each group in input
+order.  :func:`group_index` keeps it in the back-end's ``index_cache`` (see
+:class:`~.joins.JoinIndexCache`), so operators sizing, ranking and
+aggregating the same frame on the same keys share a single pass.
+"""
+from __future__ import annotations
+
+from array import array
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import pandas as pd
+
+from .frame import nrows
+
+
+class GroupIndex:
+    """Dense group ids for the rows of ``df`` keyed on ``columns``.
+
+    Groups are numbered in order of first appearance; :attr:`keys` holds
+    their key tuples.  Member positions are stored grouped in :attr:`order`
+    with group ``g`` spanning ``order[offsets[g]:offsets[g + 1]]``.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: Sequence[str]) -> None:
+        self.columns = list(columns)
+        if self.columns:
+            rows = zip(*(df[c] for c in self.columns))
+        else:
+            rows = repeat((), nrows(df))
+        found: Dict[Tuple, int] = {}
+        ids = array("q")
+        append = ids.append
+        for key in rows:
+            gid = found.get(key)
+            if gid is None:
+                gid = found[key] = len(found)
+            append(gid)
+        self.keys: List[Tuple] = list(found)
+        self.ids = ids
+        # counting sort of the positions by group id (stable)
+        offsets = array("q", bytes(8 * (len(found) + 1)))
+        for gid in ids:
+            offsets[gid + 1] += 1
+        for g in range(len(found)):
+            offsets[g + 1] += offsets[g]
+        fill = offsets[:-1]
+        order = array("q", bytes(8 * len(ids)))
+        for pos, gid in enumerate(ids):
+            order[fill[gid]] = pos
+            fill[gid] += 1
+        self.order = order
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def members(self, gid: int) -> array:
+        """Positions of the rows in group ``gid``, ascending."""
+        return self.order[self.offsets[gid] : self.offsets[gid + 1]]
+
+    def groups(self) -> Iterator[array]:
+        """Member positions of every group, in group id order."""
+        order, offsets = self.order, self.offsets
+        for g in range(len(self.keys)):
+            yield order[offsets[g] : offsets[g + 1]]
+
+    def sizes(self) -> List[int]:
+        offsets = self.offsets
+        return [offsets[g + 1] - offsets[g] for g in range(len(self.keys))]
+
+    def broadcast(self, values: Sequence[Any]) -> List[Any]:
+        """Per-group ``values`` spread to one value per row."""
+        return [values[g] for g in self.ids]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.ids, self.order, self.offsets)
+        return sum(a.itemsize * len(a) for a in arrays) + 64 * len(self.keys)
+
+
+def group_index(backend: Any, df: pd.DataFrame, columns: Sequence[str]) -> GroupIndex:
+    """``df``'s group index on ``columns``, from ``backend.index_cache`` if any."""
+    cache = getattr(backend, "index_cache", None)
+    if cache is None:
+        return GroupIndex(df, columns)
+    spec = ("group", tuple(columns))
+    return cache.get(df, spec, lambda: GroupIndex(df, columns))
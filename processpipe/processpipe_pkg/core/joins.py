@@ -0,0 +1,520 @@
+"""Join kernels used by :class:`~processpipe.JoinOperator`."""
+from __future__ import annotations
+
+import heapq
+import operator
+import sys
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Sequence, Tuple
+
+import pandas as pd
+
+from .frame import nrows
+
+JOIN_TYPES = ("inner", "left", "right", "outer", "semi", "anti", "asof")
+
+#: comparison used for each non-equality join condition
+PREDICATES: Dict[str, Callable[[Any, Any], bool]] = {
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+Predicate = Tuple[str, str, str]  # (left column, right column, condition)
+
+#: range conditions as (bounds the right value from above, bound is inclusive)
+_RANGE = {
+    "gt": (True, False),
+    "gte": (True, True),
+    "lt": (False, False),
+    "lte": (False, True),
+}
+
+
+@dataclass
+class JoinStats:
+    """Sizes seen by one join."""
+
+    build_side: str
+    build_rows: int
+    probe_rows: int
+    candidate_pairs: int
+    output_rows: int
+    index_reused: bool = False
+
+
+class JoinIndexCache:
+    """Indexes built for joins (and grouping), reused across operators.
+
+    Entries are keyed by frame identity plus the key columns and hold a weak
+    reference to the frame, so replacing a frame (e.g. in ``env``) orphans
+    its indexes and they are dropped once the old frame is collected.  Frames
+    are treated as immutable; one edited in place must be passed to
+    :meth:`invalidate`.  Least recently used entries are evicted while
+    the estimated size exceeds ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        # re-entrant: weakref callbacks may fire while the lock is held
+        self._lock = threading.RLock()
+
+    def __reduce__(self):
+        # worker processes start with an empty cache
+        return (type(self), (self.max_bytes,))
+
+    def __contains__(self, item: Tuple[Any, Hashable]) -> bool:
+        df, spec = item
+        entry = self._entries.get((id(df), spec))
+        return entry is not None and entry[0]() is df
+
+    def get(self, df: Any, spec: Hashable, build: Callable[[], Any]) -> Any:
+        """The index ``spec`` of ``df``, building it with ``build`` if needed."""
+        key = (id(df), spec)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is df:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        index = build()
+        size = _index_nbytes(index)
+        try:
+            ref = weakref.ref(df, lambda _, key=key: self._discard(key))
+        except TypeError:
+            return index
+        with self._lock:
+            if size <= self.max_bytes:
+                self._discard(key)
+                self._entries[key] = (ref, index, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._discard(next(iter(self._entries)))
+        return index
+
+    def _discard(self, key: Tuple[int, Hashable]) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+
+    def invalidate(self, df: Any) -> None:
+        """Drop every index of ``df`` (e.g. after it was changed in place)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == id(df)]:
+                self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+
+def _index_nbytes(index: Any) -> int:
+    if hasattr(index, "nbytes"):
+        return index.nbytes
+    buckets = index.values() if isinstance(index, dict) else [index]
+    total = sys.getsizeof(index)
+    for bucket in buckets:
+        if isinstance(bucket, tuple):  # sorted bucket: (values, positions)
+            total += sum(sys.getsizeof(part) for part in bucket)
+        else:
+            total += sys.getsizeof(bucket)
+    return total
+
+
+def _keys(df: pd.DataFrame, columns: Sequence[str]) -> List[Any]:
+    if len(columns) == 1:
+        return df[columns[0]]
+    return list(zip(*(df[c] for c in columns)))
+
+
+def _index(keys: List[Any]) -> Dict[Any, List[int]]:
+    index: Dict[Any, List[int]] = {}
+    for pos, key in enumerate(keys):
+        bucket = index.get(key)
+        if bucket is None:
+            index[key] = [pos]
+        else:
+            bucket.append(pos)
+    return index
+
+
+def _candidates(
+    index: Dict[Any, List[int]], probe_keys: List[Any], build: str, nleft: int
+) -> List[List[int] | None]:
+    """Matching right positions for every left row, in right order.
+
+    ``index`` maps keys of the ``build`` side to its positions; the returned
+    lists may be the index's own and must not be modified.
+    """
+    if build == "right":
+        return [index.get(key) for key in probe_keys]
+    found: List[List[int] | None] = [None] * nleft
+    for j, key in enumerate(probe_keys):
+        for i in index.get(key, ()):
+            if found[i] is None:
+                found[i] = [j]
+            else:
+                found[i].append(j)
+    return found
+
+
+def _split_range(
+    predicates: Sequence[Predicate],
+) -> Tuple[List[Predicate], List[Predicate]]:
+    """Range predicates on the most used right column, and the rest."""
+    counts: Dict[str, int] = {}
+    for _, rcol, cond in predicates:
+        if cond in _RANGE:
+            counts[rcol] = counts.get(rcol, 0) + 1
+    if not counts:
+        return [], list(predicates)
+    pivot = max(counts, key=counts.get)
+    ranged = [p for p in predicates if p[1] == pivot and p[2] in _RANGE]
+    return ranged, [p for p in predicates if p not in ranged]
+
+
+def _split_window(
+    predicates: Sequence[Predicate],
+) -> Tuple[Predicate, Predicate, List[Predicate]] | None:
+    """A window ``start <= v < end`` on two right columns, and the rest.
+
+    ``start`` bounds one right column from above and ``end`` another from
+    below, both by the same left column.  ``None`` if there is no such pair.
+    """
+    for start in predicates:
+        if start[2] not in _RANGE or not _RANGE[start[2]][0]:
+            continue
+        for end in predicates:
+            if (
+                end[2] in _RANGE
+                and not _RANGE[end[2]][0]
+                and end[0] == start[0]
+                and end[1] != start[1]
+            ):
+                rest = [p for p in predicates if p is not start and p is not end]
+                return start, end, rest
+    return None
+
+
+def _sorted_buckets(
+    right: pd.DataFrame, right_on: Sequence[str], pivot_col: str
+) -> Dict[Any, Tuple[List[Any], List[int]]]:
+    """Right positions per equality key, sorted on ``pivot_col`` (nulls out)."""
+    pivot = right[pivot_col]
+    if right_on:
+        buckets = _index(_keys(right, right_on))
+    else:
+        buckets = {None: list(range(len(pivot)))}
+    sorted_buckets = {}
+    for key, positions in buckets.items():
+        positions = [j for j in positions if pivot[j] is not None]
+        positions.sort(key=pivot.__getitem__)
+        sorted_buckets[key] = ([pivot[j] for j in positions], positions)
+    return sorted_buckets
+
+
+def _range_candidates(
+    left: pd.DataFrame,
+    sorted_buckets: Dict[Any, Tuple[List[Any], List[int]]],
+    left_keys: List[Any] | None,
+    ranged: Sequence[Predicate],
+) -> Iterator[List[int] | None]:
+    """Right positions satisfying ``ranged`` for every left row, lazily.
+
+    Right rows are bucketed by equality key (if any) and each bucket is
+    sorted on the range column, so a left row costs one binary search per
+    bound instead of a scan.  Matches come back ordered by the range column,
+    ties in right order.  Raises ``TypeError`` if the column is unorderable.
+    """
+    bounds = [(left[lcol], *_RANGE[cond]) for lcol, _, cond in ranged]
+    for i in range(nrows(left)):
+        bucket = sorted_buckets.get(None if left_keys is None else left_keys[i])
+        if bucket is None:
+            yield None
+            continue
+        values, positions = bucket
+        start, end = 0, len(values)
+        try:
+            for lvals, upper, inclusive in bounds:
+                v = lvals[i]
+                if v is None:
+                    end = 0
+                elif upper:
+                    cut = bisect_right if inclusive else bisect_left
+                    end = min(end, cut(values, v))
+                else:
+                    cut = bisect_left if inclusive else bisect_right
+                    start = max(start, cut(values, v))
+        except TypeError:
+            end = 0
+        yield positions[start:end] if start < end else None
+
+
+def _window_candidates(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    sorted_buckets: Dict[Any, Tuple[List[Any], List[int]]],
+    left_keys: List[Any] | None,
+    start: Predicate,
+    end: Predicate,
+) -> List[List[int] | None]:
+    """Right positions whose window (see :func:`_split_window`) holds each
+    left value, in right order.
+
+    Per equality key, left rows are swept in value order while right rows
+    (``sorted_buckets``, sorted on the start column) enter a heap on their
+    end value once their window has opened and leave it once it has closed,
+    so the heap is exactly the active set and no pair outside the window is
+    looked at.  Raises ``TypeError`` if the columns are unorderable.
+    """
+    lvals = left[start[0]]
+    ends = right[end[1]]
+    cut = bisect_right if _RANGE[start[2]][1] else bisect_left
+    end_inclusive = _RANGE[end[2]][1]
+    groups: Dict[Any, List[int]] = {}
+    for i, v in enumerate(lvals):
+        if v is not None:
+            key = None if left_keys is None else left_keys[i]
+            groups.setdefault(key, []).append(i)
+    found: List[List[int] | None] = [None] * nrows(left)
+    for key, rows in groups.items():
+        bucket = sorted_buckets.get(key)
+        if bucket is None:
+            continue
+        values, positions = bucket
+        rows.sort(key=lvals.__getitem__)
+        active: List[Tuple[Any, int]] = []
+        opened = 0
+        for i in rows:
+            v = lvals[i]
+            stop = cut(values, v, opened)
+            for j in positions[opened:stop]:
+                if ends[j] is not None:
+                    heapq.heappush(active, (ends[j], j))
+            opened = stop
+            while active and (
+                active[0][0] < v or (active[0][0] == v and not end_inclusive)
+            ):
+                heapq.heappop(active)
+            if active:
+                found[i] = sorted(j for _, j in active)
+    return found
+
+
+def _pair_filter(
+    left: pd.DataFrame, right: pd.DataFrame, predicates: Sequence[Predicate]
+) -> Callable[[int, int], bool]:
+    tests = [
+        (left[lcol], right[rcol], PREDICATES[cond]) for lcol, rcol, cond in predicates
+    ]
+
+    def accept(i: int, j: int) -> bool:
+        for lvals, rvals, compare in tests:
+            a, b = lvals[i], rvals[j]
+            if a is None or b is None:
+                return False
+            try:
+                if not compare(a, b):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    return accept
+
+
+def _gather(values: List[Any], positions: List[int | None]) -> List[Any]:
+    return [None if p is None else values[p] for p in positions]
+
+
+def hash_join(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    left_on: Sequence[str],
+    right_on: Sequence[str],
+    how: str = "inner",
+    predicates: Sequence[Predicate] = (),
+    suffixes: Tuple[str, str] = ("_left", "_right"),
+    cache: JoinIndexCache | None = None,
+) -> Tuple[pd.DataFrame, JoinStats]:
+    """Join ``left`` and ``right`` on equal keys plus ``predicates``.
+
+    The hash table is built on the smaller input, unless ``cache`` already
+    holds one for exactly one of them, which is then reused.  Output rows
+    follow the left input's order, with right rows that found no partner
+    (``right`` and ``outer``) appended in their own order.  Key columns
+    sharing a name are emitted once; other columns present on both sides get
+    ``suffixes``.  ``semi`` and ``anti`` return left rows (and columns) with,
+    respectively without, a partner.  A predicate comparing a null never
+    holds.
+
+    ``gt``/``gte``/``lt``/``lte`` predicates are answered from the right
+    input sorted per equality key, without a cartesian product: a window
+    ``start <= v < end`` over two right columns by a sweep over the left rows
+    in ``v`` order (only pairs inside the window are looked at), other bounds
+    on one right column by binary search, candidates generated one left row
+    at a time.  ``asof`` is a left join keeping only the nearest match under
+    those predicates: the latest right value still below an upper bound
+    (``gt``/``gte``), or the earliest above a lower bound when there is none.
+
+    With neither equality keys nor range predicates every pair of rows is a
+    candidate.
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"Unsupported join type: {how}")
+    if len(left_on) != len(right_on):
+        raise ValueError("left_on and right_on differ in length")
+    nleft, nright = nrows(left), nrows(right)
+    build = "right" if nright <= nleft else "left"
+    window = None if how == "asof" else _split_window(predicates)
+    ranged, predicates = ([], predicates) if window else _split_range(predicates)
+    if how == "asof" and not ranged:
+        raise ValueError("asof joins need a gt/gte/lt/lte condition")
+    left_keys = _keys(left, left_on) if left_on else None
+    reused = False
+
+    def index_of(df, spec, build_index):
+        nonlocal reused
+        if cache is None:
+            return build_index()
+        reused = reused or (df, spec) in cache
+        return cache.get(df, spec, build_index)
+
+    found = None
+    if window:
+        start, end, rest = window
+        spec = ("range", tuple(right_on), start[1])
+        try:
+            buckets = index_of(
+                right, spec, lambda: _sorted_buckets(right, right_on, start[1])
+            )
+            found = _window_candidates(left, right, buckets, left_keys, start, end)
+            build = "right"
+            predicates = rest
+        except TypeError:
+            pass  # unorderable columns: every predicate filters pairs below
+    elif ranged:
+        spec = ("range", tuple(right_on), ranged[0][1])
+        try:
+            buckets = index_of(
+                right, spec, lambda: _sorted_buckets(right, right_on, ranged[0][1])
+            )
+            found = _range_candidates(left, buckets, left_keys, ranged)
+            build = "right"
+        except TypeError:
+            if how == "asof":
+                raise
+            predicates = [*ranged, *predicates]
+    if found is None and left_on:
+        left_spec, right_spec = ("hash", tuple(left_on)), ("hash", tuple(right_on))
+        if cache is not None:
+            left_cached = (left, left_spec) in cache
+            if left_cached != ((right, right_spec) in cache):
+                build = "left" if left_cached else "right"
+        if build == "right":
+            index = index_of(right, right_spec, lambda: _index(_keys(right, right_on)))
+            found = _candidates(index, left_keys, build, nleft)
+        else:
+            index = index_of(left, left_spec, lambda: _index(left_keys))
+            found = _candidates(index, _keys(right, right_on), build, nleft)
+    elif found is None:
+        everything = list(range(nright))
+        found = [everything if nright else None] * nleft
+    elif how == "asof":
+        nearest_first = any(_RANGE[cond][0] for _, _, cond in ranged)
+        found = (m[::-1] if m and nearest_first else m for m in found)
+    elif ranged:
+        # back to right order, as for equality matches
+        found = (sorted(m) if m else m for m in found)
+    accept = _pair_filter(left, right, predicates) if predicates else None
+
+    lpos: List[int | None] = []
+    rpos: List[int | None] = []
+    right_matched = bytearray(nright)
+    candidates = 0
+    for i, matches in enumerate(found):
+        if matches:
+            candidates += len(matches)
+            if how == "asof":
+                nearest = next(
+                    (j for j in matches if accept is None or accept(i, j)), None
+                )
+                matches = None if nearest is None else [nearest]
+            elif accept is not None:
+                matches = [j for j in matches if accept(i, j)]
+        if matches:
+            if how == "anti":
+                continue
+            if how == "semi":
+                lpos.append(i)
+                continue
+            lpos.extend([i] * len(matches))
+            rpos.extend(matches)
+            for j in matches:
+                right_matched[j] = 1
+        elif how in ("left", "outer", "anti", "asof"):
+            lpos.append(i)
+            rpos.append(None)
+    if how in ("right", "outer"):
+        for j in range(nright):
+            if not right_matched[j]:
+                lpos.append(None)
+                rpos.append(j)
+
+    stats = JoinStats(
+        build,
+        nright if build == "right" else nleft,
+        nleft if build == "right" else nright,
+        candidates,
+        len(lpos),
+        reused,
+    )
+    if how in ("semi", "anti"):
+        columns = {c: _gather(left[c], lpos) for c in left.columns}
+        return _frame(left, columns, len(lpos)), stats
+
+    shared_keys = {lcol: rcol for lcol, rcol in zip(left_on, right_on) if lcol == rcol}
+    left_cols = left.columns
+    right_cols = [c for c in right.columns if c not in shared_keys]
+    dup = set(left_cols) & set(right_cols)
+    columns: Dict[str, List[Any]] = {}
+    for c in left_cols:
+        values = _gather(left[c], lpos)
+        if c in shared_keys and None in lpos:
+            # right-only rows carry the key from the right input
+            keys = right[shared_keys[c]]
+            for n, (i, j) in enumerate(zip(lpos, rpos)):
+                if i is None:
+                    values[n] = keys[j]
+        columns[f"{c}{suffixes[0]}" if c in dup else c] = values
+    for c in right_cols:
+        columns[f"{c}{suffixes[1]}" if c in dup else c] = _gather(right[c], rpos)
+    return _frame(left, columns, len(lpos)), stats
+
+
+def _frame(like: pd.DataFrame, columns: Dict[str, List[Any]], length: int):
+    """Frame of ``like``'s type from ``columns``."""
+    if not columns:
+        return type(like)([{} for _ in range(length)])
+    return type(like)(columns)
@@ -0,0 +1,57 @@
+"""Disk-backed map from 64-bit key hashes to integer ids.
+
+Used by operators whose set of distinct keys may outgrow memory: entries
+live in a SQLite file in a temporary directory and are looked up in batches,
+so only the batch being processed is held in RAM.  Several ids may share a
+hash; callers verify the keys themselves.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import tempfile
+from typing import Dict, Iterable, Tuple
+
+_BATCH = 500  # bound parameters per SELECT
+
+
+class DiskKeyMap:
+    """``hash -> id`` pairs in a scratch SQLite database."""
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = tempfile.mkdtemp(prefix="processpipe-keys-", dir=directory)
+        self._db = sqlite3.connect(os.path.join(self.directory, "keys.db"))
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute("CREATE TABLE keys (h INTEGER NOT NULL, id INTEGER NOT NULL)")
+        self._db.execute("CREATE INDEX keys_h ON keys (h)")
+        self.size = 0
+
+    def insert(self, items: Iterable[Tuple[int, int]]) -> None:
+        items = list(items)
+        self._db.executemany("INSERT INTO keys VALUES (?, ?)", items)
+        self.size += len(items)
+
+    def lookup(self, hashes: Iterable[int]) -> Dict[int, int]:
+        """First stored id for each of ``hashes`` that is present."""
+        hashes = list(hashes)
+        found: Dict[int, int] = {}
+        for start in range(0, len(hashes), _BATCH):
+            batch = hashes[start : start + _BATCH]
+            marks = ",".join("?" * len(batch))
+            rows = self._db.execute(
+                f"SELECT h, MIN(id) FROM keys WHERE h IN ({marks}) GROUP BY h", batch
+            )
+            found.update(rows)
+        return found
+
+    def close(self) -> None:
+        self._db.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self) -> "DiskKeyMap":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,48 @@
+"""Multi-column row ordering shared by the sorting operators."""
+from __future__ import annotations
+
+from typing import Any, List, Sequence
+
+
+class Descending:
+    """Wrapper inverting the order of the value it holds."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Descending) and self.value == other.value
+
+
+def sort_positions(
+    columns: Sequence[List[Any]],
+    ascending: Sequence[bool],
+    nulls_first: bool = False,
+    positions: List[int] | None = None,
+) -> List[int]:
+    """Row positions ordered by ``columns`` (most significant first).
+
+    One stable pass per column, least significant first, each keyed on the
+    column's own list so no per-row key tuples are built.  Nulls go last
+    (or first) in every column regardless of direction; ties keep input
+    order.
+    """
+    if positions is None:
+        positions = list(range(len(columns[0]) if columns else 0))
+    else:
+        positions = list(positions)
+    for values, asc in zip(reversed(columns), reversed(ascending)):
+        if None in values:
+            present = [p for p in positions if values[p] is not None]
+            missing = [p for p in positions if values[p] is None]
+        else:
+            present, missing = positions, []
+        present.sort(key=values.__getitem__, reverse=not asc)
+        positions = missing + present if nulls_first else present + missing
+    return positions
+
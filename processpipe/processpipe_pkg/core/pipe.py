@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict
+import os
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Dict, Iterable, Mapping, MutableMapping, Tuple
 
 import networkx as nx
 import pandas as pd
@@ -29,8 +31,27 @@ from ..operators import (
     TopNOperator,
     UnionOperator,
     UpdateOperator,
+    WindowOperator,
 )
 from .backend import FrameBackend, InMemoryBackend
+from .cache import ResultCache, frame_fingerprint, operator_fingerprint
+from .executors import ProcessExecutor, ThreadExecutor
+from .frame import ColumnarFrame
+from .profiling import (
+    OperatorStats,
+    ProfilingHook,
+    RunHook,
+    RunReport,
+    ameasure,
+    cached_stats,
+    measure,
+)
+from .runtime_filter import FilterPlan, KeyFilter, plan_runtime_filters
+from .scheduler import ConsumerCounts, ReadyQueue, critical_path, descendants
+from .spill import SpillingEnv
+from .trace import TraceHook
+
+EXECUTORS = {"thread": ThreadExecutor, "process": ProcessExecutor}
 
 log = logging.getLogger("processpipe")
 if not log.handlers:
@@ -47,11 +68,31 @@ class ProcessPipe:
         backend: FrameBackend | None = None,
         spill_enabled: bool = False,
         max_workers: int = 1,
+        critical_path: bool = False,
+        executor: str = "thread",
+        spill_budget: int = 512 * 2**20,
+        spill_dir: str | None = None,
+        cache: ResultCache | None = None,
+        profile_memory: bool = False,
+        columnar: bool = False,
+        runtime_filters: bool = False,
     ) -> None:
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unsupported executor: {executor}")
         self.backend = backend or InMemoryBackend()
         self.spill_enabled = spill_enabled
         self.max_workers = max_workers
-        self.env: Dict[str, pd.DataFrame] = {}
+        self.critical_path = critical_path
+        self.executor = executor
+        self.cache = cache
+        self.profile_memory = profile_memory
+        self.columnar = columnar
+        self.runtime_filters = runtime_filters
+        self._profiler = ProfilingHook()
+        self.hooks: list[RunHook] = [self._profiler]
+        self.env: MutableMapping[str, pd.DataFrame] = (
+            SpillingEnv(spill_budget, spill_dir) if spill_enabled else {}
+        )
         self.ops: list[Operator] = []
         self.dag = nx.DiGraph()
         self._last_output: str | None = None
@@ -60,7 +101,11 @@ class ProcessPipe:
     def add_dataframe(self, name: str, df: pd.DataFrame) -> "ProcessPipe":
         if name in self.env:
             raise ValueError(f"DataFrame name '{name}' already exists.")
-        self.env[name] = df
+        if self.spill_enabled:
+            # callers hold their own references to sources; spilling them
+            # would cost I/O without freeing anything
+            self.env.pin(name)
+        self.env[name] = self._as_frame(df)
         self.dag.add_node(name)
         return self
 
@@ -74,6 +119,7 @@ class ProcessPipe:
         conditions=None,
         how="inner",
         output=None,
+        suffixes=("_left", "_right"),
     ) -> "ProcessPipe":
         return self._append(
             JoinOperator(
@@ -83,15 +129,34 @@ class ProcessPipe:
                 how=how,
                 conditions=conditions,
                 output=output,
+                suffixes=suffixes,
             )
         )
 
     def union(self, left: str, right: str, *, output=None) -> "ProcessPipe":
         return self._append(UnionOperator(left, right, output=output))
 
-    def aggregate(self, source: str, *, groupby, agg_map, output=None) -> "ProcessPipe":
+    def aggregate(
+        self,
+        source: str,
+        *,
+        groupby,
+        agg_map,
+        grouping_sets=None,
+        rollup=False,
+        cube=False,
+        output=None,
+    ) -> "ProcessPipe":
         return self._append(
-            AggregationOperator(source, groupby, agg_map, output=output)
+            AggregationOperator(
+                source,
+                groupby,
+                agg_map,
+                grouping_sets=grouping_sets,
+                rollup=rollup,
+                cube=cube,
+                output=output,
+            )
         )
 
     def group_size(self, source: str, *, groupby, output=None) -> "ProcessPipe":
@@ -101,13 +166,47 @@ class ProcessPipe:
         return self._append(FilterOperator(source, predicate, output=output))
 
     def rolling_agg(
-        self, source: str, *, on, window, agg, output=None
+        self,
+        source: str,
+        *,
+        on,
+        window,
+        agg,
+        partition_by=None,
+        order_by=None,
+        output_col=None,
+        output=None,
     ) -> "ProcessPipe":
-        return self._append(RollingAggOperator(source, on, window, agg, output=output))
+        return self._append(
+            RollingAggOperator(
+                source,
+                on,
+                window,
+                agg,
+                partition_by=partition_by,
+                order_by=order_by,
+                output_col=output_col,
+                output=output,
+            )
+        )
 
-    def sort(self, source: str, *, by, ascending=True, output=None) -> "ProcessPipe":
+    def sort(
+        self,
+        source: str,
+        *,
+        by,
+        ascending=True,
+        na_position="last",
+        output=None,
+    ) -> "ProcessPipe":
         return self._append(
-            SortOperator(source, by, ascending=ascending, output=output)
+            SortOperator(
+                source,
+                by,
+                ascending=ascending,
+                na_position=na_position,
+                output=output,
+            )
         )
 
     def top_n(
@@ -168,10 +267,26 @@ class ProcessPipe:
         )
 
     def drop_duplicates(
-        self, source: str, *, subset=None, keep="first", output=None
+        self,
+        source: str,
+        *,
+        subset=None,
+        keep="first",
+        chunk_size=65536,
+        max_keys=None,
+        spill_dir=None,
+        output=None,
     ) -> "ProcessPipe":
         return self._append(
-            DropDuplicateOperator(source, subset, keep=keep, output=output)
+            DropDuplicateOperator(
+                source,
+                subset,
+                keep=keep,
+                chunk_size=chunk_size,
+                max_keys=max_keys,
+                spill_dir=spill_dir,
+                output=output,
+            )
         )
 
     def partition_agg(
@@ -210,6 +325,29 @@ class ProcessPipe:
             )
         )
 
+    def window(
+        self,
+        source: str,
+        *,
+        functions,
+        partition_by=None,
+        order_by=None,
+        ascending=True,
+        na_position="last",
+        output=None,
+    ) -> "ProcessPipe":
+        return self._append(
+            WindowOperator(
+                source,
+                functions,
+                partition_by=partition_by,
+                order_by=order_by,
+                ascending=ascending,
+                na_position=na_position,
+                output=output,
+            )
+        )
+
     # ── plan helpers ─────────────────────────────────────────────
     @classmethod
     def build_pipe(cls, plan: Dict[str, any]) -> "ProcessPipe":
@@ -231,6 +369,7 @@ class ProcessPipe:
                     how=op.get("how", "inner"),
                     conditions=op.get("conditions"),
                     output=op.get("output"),
+                    suffixes=op.get("suffixes", ("_left", "_right")),
                 )
             elif op_type == "union":
                 pipe.union(op["left"], op["right"], output=op.get("output"))
@@ -239,6 +378,9 @@ class ProcessPipe:
                     op["source"],
                     groupby=op["groupby"],
                     agg_map=op["agg_map"],
+                    grouping_sets=op.get("grouping_sets"),
+                    rollup=op.get("rollup", False),
+                    cube=op.get("cube", False),
                     output=op.get("output"),
                 )
             elif op_type == "group_size":
@@ -259,6 +401,9 @@ class ProcessPipe:
                     on=op["on"],
                     window=op["window"],
                     agg=op["agg"],
+                    partition_by=op.get("partition_by"),
+                    order_by=op.get("order_by"),
+                    output_col=op.get("output_col"),
                     output=op.get("output"),
                 )
             elif op_type == "sort":
@@ -266,6 +411,7 @@ class ProcessPipe:
                     op["source"],
                     by=op["by"],
                     ascending=op.get("ascending", True),
+                    na_position=op.get("na_position", "last"),
                     output=op.get("output"),
                 )
             elif op_type == "top_n":
@@ -312,6 +458,9 @@ class ProcessPipe:
                     op["source"],
                     subset=op.get("subset"),
                     keep=op.get("keep", "first"),
+                    chunk_size=op.get("chunk_size", 65536),
+                    max_keys=op.get("max_keys"),
+                    spill_dir=op.get("spill_dir"),
                     output=op.get("output"),
                 )
             elif op_type == "partition_agg":
@@ -350,12 +499,42 @@ class ProcessPipe:
                     output_col=op.get("output_col", "case"),
                     output=op.get("output"),
                 )
+            elif op_type == "window":
+                pipe.window(
+                    op["source"],
+                    functions=op["functions"],
+                    partition_by=op.get("partition_by"),
+                    order_by=op.get("order_by"),
+                    ascending=op.get("ascending", True),
+                    na_position=op.get("na_position", "last"),
+                    output=op.get("output"),
+                )
             else:
                 raise ValueError(f"Unsupported operation type: {op_type}")
 
         return pipe
 
+    # ── profiling ────────────────────────────────────────────────
+    def add_hook(self, hook: RunHook) -> "ProcessPipe":
+        """Register ``hook`` to be notified of every subsequent run."""
+        self.hooks.append(hook)
+        return self
+
+    def last_run_report(self) -> RunReport | None:
+        """Per-operator timings and row counts of the most recent run.
+
+        ``peak_bytes`` is only measured when the pipe was created with
+        ``profile_memory=True``.
+        """
+        return self._profiler.report
+
     # internal
+    def _as_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Source frames are stored column-wise when ``columnar`` is set."""
+        if self.columnar and not isinstance(df, ColumnarFrame):
+            return ColumnarFrame(df)
+        return df
+
     def _append(self, op: Operator) -> "ProcessPipe":
         self.ops.append(op)
         self.dag.add_node(op.output, operator=op)
@@ -365,40 +544,222 @@ class ProcessPipe:
         return self
 
     # ── execution ────────────────────────────────────────────────
-    def run(self) -> pd.DataFrame:
+    def run(
+        self,
+        *,
+        targets: Iterable[str] | None = None,
+        keep: Iterable[str] | None = None,
+        trace: str | os.PathLike | None = None,
+    ) -> pd.DataFrame:
+        """Execute the pipeline and return the last operator's output.
+
+        With ``targets``, only operators contributing to those outputs run and
+        the frame of the last target is returned.
+
+        By default all intermediate frames stay in :attr:`env`.  When ``keep``
+        is given, an intermediate is dropped as soon as its last consumer has
+        finished unless it is listed in ``keep``; source frames and the
+        returned outputs are always retained.
+
+        ``trace`` names a file to receive a Chrome trace-event JSON of the
+        run (one span per operator, per worker thread or process).
+        """
+        ops, outputs = self._select(targets)
+        self._execute(_RunState(self, ops, keep, outputs, trace))
+        self._write_lineage(ops)
+        return self.env[outputs[-1]]
+
+    async def arun(
+        self,
+        *,
+        targets: Iterable[str] | None = None,
+        keep: Iterable[str] | None = None,
+        timeout: float | Mapping[str, float] | None = None,
+        trace: str | os.PathLike | None = None,
+    ) -> pd.DataFrame:
+        """Asynchronous :meth:`run` for use inside an event loop.
+
+        Operators implementing ``_aexecute_core`` are awaited on the loop;
+        all others run on the configured executor (at most ``max_workers`` at
+        a time) without blocking it.  ``timeout`` bounds each operator's
+        runtime in seconds, either globally or per output name, and raises
+        :class:`TimeoutError`.  Cancelling the awaiting task cancels every
+        operator still pending.  ``trace`` is as for :meth:`run`.
+        """
+        ops, outputs = self._select(targets)
+        await self._aexecute(_RunState(self, ops, keep, outputs, trace), timeout)
+        self._write_lineage(ops)
+        return self.env[outputs[-1]]
+
+    def rerun(
+        self,
+        changed: Dict[str, pd.DataFrame],
+        *,
+        keep: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """Replace source frames and recompute only what depends on them.
+
+        Operators downstream of a name in ``changed`` are re-executed; every
+        other result is reused from :attr:`env`.  Results that are no longer
+        in ``env`` (e.g. evicted by ``run(keep=...)``) are recomputed when a
+        dirty operator needs them.
+        """
+        produced = {op.output for op in self.ops}
+        for name in changed:
+            if name in produced or name not in self.dag:
+                raise KeyError(f"'{name}' is not a source DataFrame.")
+        cache = getattr(self.backend, "index_cache", None)
+        for name, df in changed.items():
+            if cache is not None:
+                # the frame may be the old object, edited in place
+                cache.invalidate(df)
+                if name in self.env:
+                    cache.invalidate(self.env[name])
+            self.env[name] = self._as_frame(df)
+        dirty = descendants(self.ops, changed)
+        if self.runtime_filters:
+            # filtered chains hold only rows matching the old build input
+            for plan in plan_runtime_filters(self.ops, self.ops, ()):
+                if plan.build in dirty or plan.build in changed:
+                    dirty.update(plan.chain)
+        if self._last_output not in self.env:
+            dirty.add(self._last_output)
+        producer = {op.output: op for op in self.ops}
+        stack = list(dirty)
+        while stack:
+            for name in producer[stack.pop()].inputs:
+                missing = name not in self.env and name not in dirty
+                if missing and name in producer:
+                    dirty.add(name)
+                    stack.append(name)
+        ops = [op for op in self.ops if op.output in dirty]
+        self._execute(_RunState(self, ops, keep, [self._last_output]))
+        self._write_lineage(ops)
+        return self.env[self._last_output]
+
+    def _select(
+        self, targets: Iterable[str] | None
+    ) -> Tuple[list[Operator], list[str]]:
+        """Operators to run for ``targets`` and the outputs to hand back."""
         if not self.ops:
             raise ValueError("No operators defined.")
-        # assign a level (depth) to each node so that operators with the same
-        # dependency depth can run concurrently
-        levels: Dict[str, int] = {}
-        for node in nx.topological_sort(self.dag):
-            preds = list(self.dag.predecessors(node))
-            lvl = 0
-            if preds:
-                lvl = max(levels[p] for p in preds) + 1
-            levels[node] = lvl
-
-        level_ops: Dict[int, list[Operator]] = defaultdict(list)
-        for node, lvl in levels.items():
-            op = self.dag.nodes[node].get("operator")
-            if op is not None:
-                level_ops[lvl].append(op)
-
-        for lvl in sorted(level_ops):
-            ops = level_ops[lvl]
-            if self.max_workers > 1 and len(ops) > 1:
-                with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
-                    futures = {
-                        ex.submit(op.execute, self.backend, self.env): op for op in ops
-                    }
-                    for fut, op in futures.items():
-                        res = fut.result()
-                        self.env[op.output] = res
+        if targets is None:
+            return self.ops, [self._last_output]
+        targets = list(targets)
+        if not targets:
+            raise ValueError("targets must name at least one output.")
+        needed = self._ancestors(targets)
+        return [op for op in self.ops if op.output in needed], targets
+
+    def _ancestors(self, names: list[str]) -> set[str]:
+        """``names`` plus every node they depend on in :attr:`dag`."""
+        for name in names:
+            if name not in self.dag:
+                raise KeyError(f"Unknown output '{name}'.")
+        found = set(names)
+        stack = list(names)
+        while stack:
+            for pred in self.dag.predecessors(stack.pop()):
+                if pred not in found:
+                    found.add(pred)
+                    stack.append(pred)
+        return found
+
+    def _execute(self, state: "_RunState") -> None:
+        queue = state.queue
+        trace = self.profile_memory
+        state.start()
+        try:
+            if self.max_workers > 1:
+                pool_cls = EXECUTORS[self.executor]
+                with pool_cls(self.backend, self.env, self.max_workers, trace) as pool:
+                    running: Dict[Future, Operator] = {}
+                    while queue or running:
+                        while queue and len(running) < self.max_workers:
+                            op = queue.pop()
+                            if not state.finish_cached(op, pool):
+                                prefilter = state.dispatch(op)
+                                running[pool.submit(op, prefilter)] = op
+                        if not running:
+                            continue
+                        done, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            op = running.pop(fut)
+                            res, stats = pool.result(fut, op)
+                            state.store(op, res)
+                            state.finish(op, res, stats, pool)
             else:
-                for op in ops:
-                    res = op.execute(self.backend, self.env)
-                    self.env[op.output] = res
-
+                while queue:
+                    op = queue.pop()
+                    if not state.finish_cached(op):
+                        prefilter = state.dispatch(op)
+                        res, stats = measure(
+                            op, self.backend, self.env, trace, prefilter
+                        )
+                        state.store(op, res)
+                        state.finish(op, res, stats)
+        finally:
+            state.stop()
+        state.check_complete()
+
+    async def _aexecute(
+        self,
+        state: "_RunState",
+        timeout: float | Mapping[str, float] | None,
+    ) -> None:
+        queue = state.queue
+        workers = max(1, self.max_workers)
+        trace = self.profile_memory
+        pool = EXECUTORS[self.executor](self.backend, self.env, workers, trace)
+        slots = asyncio.Semaphore(workers)
+
+        async def run_one(
+            op: Operator, prefilter: KeyFilter | None
+        ) -> Tuple[pd.DataFrame, OperatorStats]:
+            limit = timeout.get(op.output) if isinstance(timeout, Mapping) else timeout
+            try:
+                if op.is_async:
+                    coro = ameasure(op, self.backend, self.env, trace, prefilter)
+                    return await asyncio.wait_for(coro, limit)
+                async with slots:
+                    fut = pool.submit(op, prefilter)
+                    await asyncio.wait_for(asyncio.wrap_future(fut), limit)
+                    return pool.result(fut, op)
+            except asyncio.TimeoutError:
+                name = op.__class__.__name__
+                raise TimeoutError(f"{name} -> '{op.output}' exceeded {limit}s")
+
+        running: Dict[asyncio.Future, Operator] = {}
+        state.start()
+        try:
+            while queue or running:
+                while queue:
+                    op = queue.pop()
+                    if not state.finish_cached(op, pool):
+                        prefilter = state.dispatch(op)
+                        running[asyncio.ensure_future(run_one(op, prefilter))] = op
+                if not running:
+                    continue
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    op = running.pop(task)
+                    res, stats = task.result()
+                    state.store(op, res)
+                    state.finish(op, res, stats, pool)
+        except BaseException:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            pool.close(wait=False)
+            raise
+        finally:
+            state.stop()
+        pool.close()
+        state.check_complete()
+
+    def _write_lineage(self, ops: list[Operator]) -> None:
         if self.max_workers > 1 or not isinstance(self.backend, InMemoryBackend):
             lineage = [
                 {
@@ -406,14 +767,148 @@ class ProcessPipe:
                     "output": op.output,
                     "inputs": op.inputs,
                 }
-                for op in self.ops
+                for op in ops
             ]
             with open("pipeline_run.json", "w") as f:
-                json.dump({"max_workers": self.max_workers, "lineage": lineage}, f)
+                json.dump(
+                    {
+                        "max_workers": self.max_workers,
+                        "executor": self.executor,
+                        "lineage": lineage,
+                    },
+                    f,
+                )
 
-        return self.env[self._last_output]
+    def _drop(self, name: str) -> None:
+        # ``del`` rather than ``pop`` so a spilled frame is not read back
+        if name in self.env:
+            del self.env[name]
 
     def describe(self) -> None:
         """Print the execution order of operators."""
         for op in self.ops:
             print(f"{op.__class__.__name__} -> '{op.output}'")
+
+
+class _RunState:
+    """Book-keeping for one execution of a set of operators.
+
+    Shared by the synchronous and asynchronous loops: the ready queue,
+    reference counts for ``keep``-based eviction, the spill schedule,
+    result-cache fingerprints and the run hooks.
+    """
+
+    def __init__(
+        self,
+        pipe: ProcessPipe,
+        ops: list[Operator],
+        keep: Iterable[str] | None,
+        outputs: list[str],
+        trace: str | os.PathLike | None = None,
+    ) -> None:
+        self.pipe = pipe
+        self.ops = ops
+        self.hooks = list(pipe.hooks)
+        if trace is not None:
+            self.hooks.append(TraceHook(trace))
+        # operators are dispatched as soon as all of their inputs exist, so a
+        # slow branch never holds back independent work that is already ready
+        priority = critical_path(ops) if pipe.critical_path else None
+        produced = {op.output for op in ops}
+        sources = [name for name in pipe.env if name not in produced]
+        self.filters: Dict[str, FilterPlan] = {}
+        self.partial: set[str] = set()
+        if pipe.runtime_filters:
+            retain = [*(keep or ()), *outputs]
+            for plan in plan_runtime_filters(ops, pipe.ops, retain):
+                self.filters[plan.chain[0]] = plan
+                self.partial.update(plan.chain)
+        after = {head: [plan.build] for head, plan in self.filters.items()}
+        self.queue = ReadyQueue(ops, priority, after)
+        self.refs = None
+        if keep is not None:
+            self.refs = ConsumerCounts(ops, [*keep, *sources, *outputs])
+        if pipe.spill_enabled:
+            pipe.env.plan(ops, pinned=sources)
+        self.fingerprints: Dict[str, str | None] = {}
+        self._tracing = False
+
+    def start(self) -> None:
+        pipe = self.pipe
+        if pipe.profile_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        for hook in self.hooks:
+            hook.on_run_start(pipe, self.ops)
+
+    def dispatch(self, op: Operator) -> KeyFilter | None:
+        """Announce ``op``; return the runtime filter for its input, if any.
+
+        The filter belongs to this run only, so concurrent runs or a later
+        ``rerun`` of the same pipe each build their own.
+        """
+        prefilter = None
+        plan = self.filters.get(op.output)
+        if plan is not None and plan.build in self.pipe.env:
+            prefilter = KeyFilter.build(plan, self.pipe.env[plan.build])
+        for hook in self.hooks:
+            hook.on_operator_start(op)
+        return prefilter
+
+    def stop(self) -> None:
+        """End the run, successful or not."""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        for hook in self.hooks:
+            hook.on_run_end(self.pipe)
+
+    def lookup(self, op: Operator) -> pd.DataFrame | None:
+        """Return ``op``'s cached output, recording its fingerprint."""
+        env, cache = self.pipe.env, self.pipe.cache
+        if cache is None or op.output in self.partial:
+            self.fingerprints[op.output] = None
+            return None
+        keys = []
+        for name in op.inputs:
+            if name not in env:
+                return None  # let execute() report the missing input
+            if self.fingerprints.get(name) is None:
+                self.fingerprints[name] = frame_fingerprint(env[name])
+            keys.append(self.fingerprints[name])
+        key = operator_fingerprint(op, keys)
+        self.fingerprints[op.output] = key
+        return None if key is None else cache.get(key)
+
+    def store(self, op: Operator, res: pd.DataFrame) -> None:
+        key = self.fingerprints.get(op.output)
+        if self.pipe.cache is not None and key is not None:
+            self.pipe.cache.put(key, res)
+
+    def finish_cached(self, op: Operator, pool=None) -> bool:
+        """Complete ``op`` from the result cache if possible."""
+        hit = self.lookup(op)
+        if hit is None:
+            return False
+        self.finish(op, hit, cached_stats(op, self.pipe.env, hit), pool)
+        return True
+
+    def finish(
+        self, op: Operator, res: pd.DataFrame, stats: OperatorStats, pool=None
+    ) -> None:
+        pipe = self.pipe
+        pipe.env[op.output] = res
+        for hook in self.hooks:
+            hook.on_operator_end(stats)
+        self.queue.complete(op)
+        if pipe.spill_enabled:
+            pipe.env.finished(op)
+        if self.refs is not None:
+            for name in self.refs.finish(op):
+                pipe._drop(name)
+                if pool is not None:
+                    pool.release(name)
+
+    def check_complete(self) -> None:
+        if self.queue.remaining:
+            raise ValueError("Pipeline graph has cycles.")
@@ -0,0 +1,216 @@
+"""Per-operator measurements and the hook interface that receives them."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Mapping, Tuple
+
+import pandas as pd
+
+from ..operators import Operator
+from .backend import FrameBackend
+from .frame import nrows
+
+
+@dataclass
+class OperatorStats:
+    """What one operator execution cost."""
+
+    operator: str
+    output: str
+    inputs: List[str]
+    start: float
+    wall_time: float
+    cpu_time: float
+    rows_in: int
+    rows_out: int
+    peak_bytes: int | None = None
+    pid: int = field(default_factory=os.getpid)
+    thread: int = field(default_factory=threading.get_ident)
+    cached: bool = False
+
+    @property
+    def rows_per_sec(self) -> float | None:
+        if not self.wall_time:
+            return None
+        return self.rows_in / self.wall_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "rows_per_sec": self.rows_per_sec}
+
+
+def _rows_in(op: Operator, env: Mapping[str, pd.DataFrame]) -> int:
+    return sum(nrows(env[k]) for k in dict.fromkeys(op.inputs) if k in env)
+
+
+def _begin(trace_memory: bool) -> Tuple[float, float, float, int | None]:
+    base = None
+    if trace_memory and tracemalloc.is_tracing():
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    return time.time(), time.perf_counter(), time.thread_time(), base
+
+
+def _end(
+    op: Operator,
+    env: Mapping[str, pd.DataFrame],
+    res: pd.DataFrame,
+    begun: Tuple[float, float, float, int | None],
+) -> OperatorStats:
+    start, wall0, cpu0, base = begun
+    wall = time.perf_counter() - wall0
+    cpu = time.thread_time() - cpu0
+    peak = None
+    if base is not None:
+        peak = max(tracemalloc.get_traced_memory()[1] - base, 0)
+    return OperatorStats(
+        op.__class__.__name__,
+        op.output,
+        list(op.inputs),
+        start,
+        wall,
+        cpu,
+        _rows_in(op, env),
+        nrows(res),
+        peak,
+    )
+
+
+def measure(
+    op: Operator,
+    backend: FrameBackend,
+    env: Mapping[str, pd.DataFrame],
+    trace_memory: bool = False,
+    prefilter: Any = None,
+) -> Tuple[pd.DataFrame, OperatorStats]:
+    """Execute ``op`` in the calling thread and time it.
+
+    ``peak_bytes`` is only filled in while :mod:`tracemalloc` is tracing.
+    The allocator is process-wide, so with several threads the peak of one
+    operator includes allocations made concurrently by others.
+    """
+    begun = _begin(trace_memory)
+    res = op.execute(backend, env, prefilter)
+    return res, _end(op, env, res, begun)
+
+
+async def ameasure(
+    op: Operator,
+    backend: FrameBackend,
+    env: Mapping[str, pd.DataFrame],
+    trace_memory: bool = False,
+    prefilter: Any = None,
+) -> Tuple[pd.DataFrame, OperatorStats]:
+    """:func:`measure` for async operators (CPU time includes the loop's)."""
+    begun = _begin(trace_memory)
+    res = await op.aexecute(backend, env, prefilter)
+    return res, _end(op, env, res, begun)
+
+
+def cached_stats(op: Operator, env: Mapping[str, pd.DataFrame], res) -> OperatorStats:
+    """Stats for an output served from the result cache."""
+    return OperatorStats(
+        op.__class__.__name__,
+        op.output,
+        list(op.inputs),
+        time.time(),
+        0.0,
+        0.0,
+        _rows_in(op, env),
+        nrows(res),
+        cached=True,
+    )
+
+
+class RunHook:
+    """Observer of pipeline runs; override any of the callbacks.
+
+    Callbacks are invoked on the thread driving the run, never concurrently.
+    """
+
+    def on_run_start(self, pipe: Any, ops: List[Operator]) -> None:
+        """Called before the first operator is dispatched."""
+
+    def on_operator_start(self, op: Operator) -> None:
+        """Called when ``op`` is handed to a worker."""
+
+    def on_operator_end(self, stats: OperatorStats) -> None:
+        """Called with the measurements of each finished operator."""
+
+    def on_run_end(self, pipe: Any) -> None:
+        """Called after the last operator finished."""
+
+
+class RunReport:
+    """Table of :class:`OperatorStats` for one run."""
+
+    _COLUMNS = [
+        ("operator", "{}"),
+        ("output", "{}"),
+        ("wall_s", "{:.4f}"),
+        ("cpu_s", "{:.4f}"),
+        ("rows_in", "{}"),
+        ("rows_out", "{}"),
+        ("rows/s", "{:.0f}"),
+        ("peak_kb", "{:.1f}"),
+    ]
+
+    def __init__(self, stats: List[OperatorStats]) -> None:
+        self.stats = stats
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [s.to_dict() for s in self.stats]
+
+    def to_json(self, path: str | None = None) -> str:
+        text = json.dumps({"operators": self.to_dicts()}, indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def _cells(self, s: OperatorStats) -> List[str]:
+        peak = None if s.peak_bytes is None else s.peak_bytes / 1024
+        values = [
+            s.operator,
+            s.output,
+            s.wall_time,
+            s.cpu_time,
+            s.rows_in,
+            s.rows_out,
+            s.rows_per_sec,
+            peak,
+        ]
+        return [
+            "-" if v is None else fmt.format(v)
+            for v, (_, fmt) in zip(values, self._COLUMNS)
+        ]
+
+    def __str__(self) -> str:
+        table = [[name for name, _ in self._COLUMNS]]
+        table += [self._cells(s) for s in self.stats]
+        widths = [max(len(row[i]) for row in table) for i in range(len(table[0]))]
+        return "\n".join(
+            "  ".join(cell.ljust(w) for cell, w in zip(row, widths)) for row in table
+        )
+
+
+class ProfilingHook(RunHook):
+    """Collect every operator's stats into a :class:`RunReport`."""
+
+    def __init__(self) -> None:
+        self.report: RunReport | None = None
+        self._stats: List[OperatorStats] = []
+
+    def on_run_start(self, pipe: Any, ops: List[Operator]) -> None:
+        self._stats = []
+
+    def on_operator_end(self, stats: OperatorStats) -> None:
+        self._stats.append(stats)
+
+    def on_run_end(self, pipe: Any) -> None:
+        self.report = RunReport(self._stats)
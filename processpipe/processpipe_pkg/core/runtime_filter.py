@@ -0,0 +1,162 @@
+"""Runtime join filters for :class:`ProcessPipe` (``runtime_filters=True``).
+
+For an inner, semi or right join on equality keys, the keys of the build
+input are collected once it has been produced and pushed up the probe input
+to the first operator of its *streamable chain*: filters, deletes, casts,
+fills, renames, string and update/case operators that each have the next one
+as their only reader and leave the key columns alone.  That operator waits
+for the build input and sees only the rows whose key can match, so the whole
+chain does its work on matching rows alone.
+
+The frames produced inside a filtered chain hold only rows that can survive
+the join; they are never served from or written to the result cache.
+"""
+from __future__ import annotations
+
+import logging
+from collections import ChainMap
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Mapping, Sequence
+
+import pandas as pd
+
+from ..operators import (
+    CaseOperator,
+    CastOperator,
+    DeleteOperator,
+    FillNAOperator,
+    FilterOperator,
+    JoinOperator,
+    Operator,
+    RenameOperator,
+    StringOperator,
+    UpdateOperator,
+)
+from .bloom import BloomFilter
+from .frame import nrows, take
+from .joins import _keys
+from .scheduler import consumers_of
+
+log = logging.getLogger("processpipe")
+
+#: join types whose left input (the probe side) only keeps rows with a
+#: partner; a right join keeps every right row, so its left input is the
+#: one filtered
+FILTERABLE_JOINS = {"inner", "semi", "right"}
+
+#: builds with more distinct keys than this are summarised by a Bloom filter
+EXACT_LIMIT = 250_000
+
+
+@dataclass
+class FilterPlan:
+    """One runtime filter: rows of ``source`` read by ``chain[0]``."""
+
+    join: str
+    build: str
+    build_on: List[str]
+    source: str
+    columns: List[str]
+    chain: List[str]
+
+
+class KeyFilter:
+    """Set (or Bloom filter) of build keys applied to one input frame."""
+
+    def __init__(self, source: str, columns: Sequence[str], keys: Any) -> None:
+        self.source = source
+        self.columns = list(columns)
+        self.keys = keys
+
+    @classmethod
+    def build(cls, plan: FilterPlan, build_df: pd.DataFrame) -> "KeyFilter":
+        """Exact keys of ``build_df`` while there are at most
+        :data:`EXACT_LIMIT` of them, else a Bloom filter sized for its rows."""
+        keys: Any = set()
+        values = iter(_keys(build_df, plan.build_on))
+        for key in values:
+            keys.add(key)
+            if len(keys) > EXACT_LIMIT:
+                bloom = BloomFilter.from_keys(keys, nrows(build_df))
+                bloom.update(values)
+                keys = bloom
+                break
+        return cls(plan.source, plan.columns, keys)
+
+    def apply(self, env: Mapping[str, pd.DataFrame]) -> Mapping[str, pd.DataFrame]:
+        """``env`` with the source frame reduced to possibly matching rows."""
+        df = env[self.source]
+        if any(c not in df.columns for c in self.columns):
+            return env  # let the operator report the missing column
+        keys = self.keys
+        keep = [i for i, k in enumerate(_keys(df, self.columns)) if k in keys]
+        log.debug("runtime filter on '%s' kept %d rows", self.source, len(keep))
+        return ChainMap({self.source: take(df, keep)}, env)
+
+
+def _upstream_columns(op: Operator, columns: List[str]) -> List[str] | None:
+    """Names of ``columns`` in ``op``'s input, or ``None`` if ``op`` may
+    change their values or is not a streamable row operator."""
+    if isinstance(op, (FilterOperator, DeleteOperator)):
+        return columns
+    if isinstance(op, CastOperator):
+        touched = set(op.casts)
+    elif isinstance(op, FillNAOperator):
+        if op.columns is None:
+            return None
+        touched = set(op.columns)
+    elif isinstance(op, StringOperator):
+        touched = {op.new_column or op.column}
+    elif isinstance(op, UpdateOperator):
+        touched = set(op.set_map)
+    elif isinstance(op, CaseOperator):
+        touched = {op.output_col}
+    elif isinstance(op, RenameOperator):
+        mapped = []
+        for col in columns:
+            for old, new in reversed(list(op.columns.items())):
+                if col == new:
+                    col = old
+                elif col == old:
+                    return None  # renamed away
+            mapped.append(col)
+        return mapped
+    else:
+        return None
+    return None if touched & set(columns) else columns
+
+
+def plan_runtime_filters(
+    ops: List[Operator], all_ops: List[Operator], retain: Iterable[str]
+) -> List[FilterPlan]:
+    """Runtime filters for the joins in ``ops``.
+
+    ``all_ops`` are every operator of the pipe (to count readers of each
+    frame); frames in ``retain`` are never filtered.
+    """
+    producer = {op.output: op for op in ops}
+    readers = consumers_of(all_ops)
+    retain = set(retain)
+    plans = []
+    for op in ops:
+        if not isinstance(op, JoinOperator) or op.how not in FILTERABLE_JOINS:
+            continue
+        if op.left == op.right:
+            continue
+        eq = [p for p, c in zip(op.on, op.conditions) if c == "eq"]
+        if not eq or len(op.on) != len(op.conditions):
+            continue
+        probe, columns = op.left, [lcol for lcol, _ in eq]
+        build, build_on = op.right, [rcol for _, rcol in eq]
+        chain: List[str] = []
+        while probe in producer and probe not in retain:
+            if len(readers.get(probe, ())) != 1:
+                break
+            upstream = _upstream_columns(producer[probe], columns)
+            if upstream is None:
+                break
+            chain.insert(0, probe)
+            probe, columns = producer[probe].source, upstream
+        if chain:
+            plans.append(FilterPlan(op.output, build, build_on, probe, columns, chain))
+    return plans
@@ -0,0 +1,127 @@
+"""Dependency-driven scheduling helpers used by :class:`ProcessPipe`."""
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Iterable, List, Set
+
+from ..operators import Operator
+
+
+def consumers_of(ops: Iterable[Operator]) -> Dict[str, List[Operator]]:
+    """Map every frame name to the operators reading it."""
+    consumers: Dict[str, List[Operator]] = {}
+    for op in ops:
+        for name in dict.fromkeys(op.inputs):
+            consumers.setdefault(name, []).append(op)
+    return consumers
+
+
+def descendants(ops: Iterable[Operator], names: Iterable[str]) -> Set[str]:
+    """Outputs that read, directly or transitively, any frame in ``names``."""
+    consumers = consumers_of(ops)
+    found: Set[str] = set()
+    stack = list(names)
+    while stack:
+        for op in consumers.get(stack.pop(), []):
+            if op.output not in found:
+                found.add(op.output)
+                stack.append(op.output)
+    return found
+
+
+def critical_path(ops: List[Operator]) -> Dict[str, int]:
+    """Return the number of operators on the longest path from each op to a sink.
+
+    ``ops`` must be in dependency order (as appended to a pipe).  Operators
+    with a longer chain of dependants are dispatched first so the tail of the
+    DAG is not left waiting on a branch started late.
+    """
+    consumers = consumers_of(ops)
+    depth: Dict[str, int] = {}
+    for op in reversed(ops):
+        below = [depth[c.output] for c in consumers.get(op.output, [])]
+        depth[op.output] = 1 + max(below, default=0)
+    return depth
+
+
+class ReadyQueue:
+    """Release operators as soon as every input they read has been produced.
+
+    Inputs that no operator in ``ops`` produces are treated as available; if
+    they are missing from the environment :meth:`Operator.execute` reports it.
+    ``after`` adds ordering-only prerequisites: output name -> frames that
+    must be produced before that operator runs.
+    """
+
+    def __init__(
+        self,
+        ops: List[Operator],
+        priority: Dict[str, int] | None = None,
+        after: Dict[str, List[str]] | None = None,
+    ) -> None:
+        produced = {op.output for op in ops}
+        self._consumers = consumers_of(ops)
+        by_output = {op.output: op for op in ops}
+        after = {
+            name: [d for d in dict.fromkeys(deps) if d not in by_output[name].inputs]
+            for name, deps in (after or {}).items()
+            if name in by_output
+        }
+        for name, deps in after.items():
+            for dep in deps:
+                if dep in produced:
+                    self._consumers.setdefault(dep, []).append(by_output[name])
+        self._waiting: Dict[str, int] = {}
+        self._seq = {op.output: i for i, op in enumerate(ops)}
+        self._priority = priority or {}
+        self._heap: list = []
+        self.remaining = len(ops)
+        for op in ops:
+            needed = {*op.inputs, *after.get(op.output, ())}
+            pending = sum(1 for name in needed if name in produced)
+            self._waiting[op.output] = pending
+            if not pending:
+                self._push(op)
+
+    def _push(self, op: Operator) -> None:
+        rank = -self._priority.get(op.output, 0)
+        heapq.heappush(self._heap, (rank, self._seq[op.output], op))
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def pop(self) -> Operator:
+        return heapq.heappop(self._heap)[-1]
+
+    def complete(self, op: Operator) -> None:
+        """Mark ``op`` finished and release the consumers now fully satisfied."""
+        self.remaining -= 1
+        for consumer in self._consumers.get(op.output, []):
+            self._waiting[consumer.output] -= 1
+            if not self._waiting[consumer.output]:
+                self._push(consumer)
+
+
+class ConsumerCounts:
+    """Count the operators still due to read each frame.
+
+    :meth:`finish` returns the frames that became dead with an operator's
+    completion: inputs whose last consumer just ran and outputs nobody
+    reads.  Names in ``retain`` are never reported.
+    """
+
+    def __init__(self, ops: List[Operator], retain: Iterable[str]) -> None:
+        self._left = {op.output: 0 for op in ops}
+        for name, readers in consumers_of(ops).items():
+            self._left[name] = len(readers)
+        self._retain: Set[str] = set(retain)
+
+    def finish(self, op: Operator) -> List[str]:
+        dead = []
+        for name in dict.fromkeys(op.inputs):
+            self._left[name] -= 1
+            if not self._left[name] and name not in self._retain:
+                dead.append(name)
+        if not self._left[op.output] and op.output not in self._retain:
+            dead.append(op.output)
+        return dead
@@ -0,0 +1,313 @@
+"""Mergeable sketches for approximate aggregates.
+
+Each sketch summarises a stream of values in bounded memory and can absorb
+another sketch of the same shape, so per-group partial results combine the
+way exact aggregates do (see :mod:`.aggregate`).
+
+* :class:`HyperLogLog` counts distinct values.  With ``precision`` p it
+  keeps ``2**p`` one-byte registers; the relative standard error is
+  ``1.04 / sqrt(2**p)`` — 1.6% at the default p=12 (4 KiB), so estimates
+  fall within ±3.3% about 95% of the time.  Up to 128 distinct values
+  are counted exactly.
+* :class:`KLLSketch` answers quantile queries.  It keeps O(k) values;
+  the rank of a returned value is within about ±1.7% of the requested
+  one (99% confidence) at the default k=200, and exact while fewer than
+  k values have been seen.  Quantiles use the nearest-rank definition.
+* :class:`CountMinSketch` estimates value frequencies and tracks heavy
+  hitters.  A ``width`` x ``depth`` table of counters (default
+  ``eps=0.005``, ``delta=0.01``: 544 x 5) never underestimates and
+  overestimates a count by more than ``eps * n`` with probability at most
+  ``delta``, for ``n`` values added.  The ``4 * k`` candidates with the
+  highest estimates are kept for :meth:`CountMinSketch.top`.  Up to 128
+  distinct values are counted exactly.
+
+Values are hashed with :func:`hash` (salted, as in :mod:`.bloom`), so
+sketches built in processes with different hash seeds refuse to merge.
+"""
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from collections import Counter
+from typing import Any, Hashable, Iterable, List, Tuple
+
+_SALT = "processpipe.sketch"
+_MASK = 2**64 - 1
+_EXACT = 128  # distinct values counted exactly before switching to a sketch
+_RNG = random.Random(0x5EED)
+
+
+def _hash(value: Hashable) -> int:
+    # ints hash to themselves and the tuple hash barely mixes its high bits,
+    # so finish with murmur3's fmix64 to spread every input bit over all 64
+    h = hash((value, _SALT)) & _MASK
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & _MASK
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & _MASK
+    return h ^ (h >> 33)
+
+
+def _check_seed(a: Any, b: Any) -> None:
+    if a._seed != b._seed:
+        raise ValueError("Cannot merge sketches built with different hash seeds")
+
+
+class HyperLogLog:
+    """Distinct count estimate in ``2**precision`` bytes."""
+
+    def __init__(self, precision: int = 12) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self._exact: set | None = set()
+        self._registers: bytearray | None = None
+        self._seed = hash(_SALT)
+
+    def _to_registers(self) -> None:
+        if self._registers is None:
+            self._registers = bytearray(1 << self.precision)
+            self._fill(self._exact)
+            self._exact = None
+
+    def _fill(self, hashes: Iterable[int]) -> None:
+        p = self.precision
+        low = (1 << p) - 1
+        width = 64 - p
+        registers = self._registers
+        for h in hashes:
+            i = h & low
+            rank = width - (h >> p).bit_length() + 1
+            if rank > registers[i]:
+                registers[i] = rank
+
+    def update(self, values: Iterable[Hashable]) -> None:
+        hashes = map(_hash, values)
+        exact = self._exact
+        if exact is not None:
+            for h in hashes:
+                exact.add(h)
+                if len(exact) > _EXACT:
+                    self._to_registers()
+                    break
+            else:
+                return
+        self._fill(hashes)
+
+    def add(self, value: Hashable) -> None:
+        self.update((value,))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        _check_seed(self, other)
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLogs of different precision")
+        if other._exact is not None:
+            if self._exact is not None:
+                self._exact |= other._exact
+                if len(self._exact) > _EXACT:
+                    self._to_registers()
+            else:
+                self._fill(other._exact)
+            return
+        self._to_registers()
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def estimate(self) -> int:
+        if self._exact is not None:
+            return len(self._exact)
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(math.ldexp(1.0, -r) for r in self._registers)
+        zeros = self._registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            raw = m * math.log(m / zeros)  # linear counting for small sets
+        return round(raw)
+
+    @property
+    def nbytes(self) -> int:
+        if self._registers is not None:
+            return len(self._registers)
+        return 8 * len(self._exact)
+
+
+class KLLSketch:
+    """Quantile sketch keeping about ``3 * k`` values (Karnin, Lang, Liberty).
+
+    Values live in levels; level ``h`` values each stand for ``2**h`` inputs.
+    A full level is sorted and every other value (from a random offset) is
+    promoted to the next, halving it.  Capacities shrink geometrically
+    (factor 2/3) towards the lower levels.
+    """
+
+    def __init__(self, k: int = 200) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.n = 0
+        self._levels: List[List[Any]] = [[]]
+        self._size = 0
+        self._limit = self._capacity(0)
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self._levels) - h - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        while self._size >= self._limit:
+            for h, level in enumerate(self._levels):
+                if len(level) >= self._capacity(h):
+                    if h + 1 == len(self._levels):
+                        self._levels.append([])
+                    level.sort()
+                    odd = len(level) % 2
+                    promoted = level[odd + _RNG.getrandbits(1) :: 2]
+                    self._levels[h + 1].extend(promoted)
+                    del level[odd:]
+                    break
+            self._size = sum(map(len, self._levels))
+            self._limit = sum(self._capacity(h) for h in range(len(self._levels)))
+
+    def update(self, values: Iterable[Any]) -> None:
+        values = list(values)
+        self.n += len(values)
+        start = 0
+        while start < len(values):
+            batch = values[start : start + self._limit - self._size]
+            self._levels[0].extend(batch)
+            self._size += len(batch)
+            start += len(batch)
+            self._compress()
+
+    def add(self, value: Any) -> None:
+        self.update((value,))
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for level, extra in zip(self._levels, other._levels):
+            level.extend(extra)
+        self.n += other.n
+        self._size = sum(map(len, self._levels))
+        self._limit = sum(self._capacity(h) for h in range(len(self._levels)))
+        self._compress()
+
+    def quantile(self, q: float) -> Any:
+        """Smallest retained value whose weighted rank reaches ``q``."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        weighted = sorted(
+            (v, 1 << h) for h, level in enumerate(self._levels) for v in level
+        )
+        if not weighted:
+            return None
+        target = q * sum(w for _, w in weighted)
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return weighted[-1][0]
+
+
+class CountMinSketch:
+    """Frequency estimates and the ``k`` most frequent values."""
+
+    def __init__(self, eps: float = 0.005, delta: float = 0.01, k: int = 10) -> None:
+        if not (0 < eps < 1 and 0 < delta < 1):
+            raise ValueError("eps and delta must be between 0 and 1")
+        self.width = math.ceil(math.e / eps)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.k = k
+        self.n = 0
+        self._exact: Counter | None = Counter()
+        self._table: array | None = None
+        self._candidates: dict = {}
+        self._seed = hash(_SALT)
+
+    def _cells(self, value: Hashable) -> List[int]:
+        # hash every row independently: double hashing (h1 + row * h2) makes
+        # values that collide in two rows collide in all of them
+        w = self.width
+        return [row * w + _hash((value, row)) % w for row in range(self.depth)]
+
+    def _estimate(self, cells: List[int]) -> int:
+        table = self._table
+        return min(table[c] for c in cells)
+
+    def _offer(self, value: Hashable, estimate: int) -> None:
+        candidates = self._candidates
+        if value in candidates or len(candidates) < 4 * self.k:
+            candidates[value] = estimate
+            return
+        weakest = min(candidates, key=candidates.__getitem__)
+        if estimate > candidates[weakest]:
+            del candidates[weakest]
+            candidates[value] = estimate
+
+    def _add_counts(self, counts: Iterable[Tuple[Hashable, int]]) -> None:
+        table = self._table
+        for value, count in counts:
+            cells = self._cells(value)
+            for c in cells:
+                table[c] += count
+            self._offer(value, self._estimate(cells))
+
+    def _to_table(self) -> None:
+        if self._table is None:
+            self._table = array("q", bytes(8 * self.width * self.depth))
+            exact, self._exact = self._exact, None
+            self._add_counts(exact.items())
+
+    def update(self, values: Iterable[Hashable]) -> None:
+        counts = Counter(values)
+        self.n += sum(counts.values())
+        if self._exact is not None:
+            self._exact.update(counts)
+            if len(self._exact) > _EXACT:
+                self._to_table()
+            return
+        self._add_counts(counts.items())
+
+    def add(self, value: Hashable) -> None:
+        self.update((value,))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        _check_seed(self, other)
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge count-min sketches of different shape")
+        self.n += other.n
+        if other._exact is not None:
+            if self._exact is None:
+                self._add_counts(other._exact.items())
+                return
+            self._exact.update(other._exact)
+            if len(self._exact) > _EXACT:
+                self._to_table()
+            return
+        self._to_table()
+        self._table = array("q", map(sum, zip(self._table, other._table)))
+        merged = set(self._candidates) | set(other._candidates)
+        self._candidates = {}
+        for value in merged:
+            self._offer(value, self._estimate(self._cells(value)))
+
+    def count(self, value: Hashable) -> int:
+        """Estimated number of times ``value`` was added (never too low)."""
+        if self._exact is not None:
+            return self._exact[value]
+        return self._estimate(self._cells(value))
+
+    def top(self, k: int | None = None) -> List[Tuple[Any, int]]:
+        """Up to ``k`` values with the highest counts, most frequent first."""
+        k = self.k if k is None else k
+        if self._exact is not None:
+            return self._exact.most_common(k)
+        ranked = sorted(self._candidates.items(), key=lambda kv: -kv[1])
+        return ranked[:k]
+
+    @property
+    def nbytes(self) -> int:
+        if self._table is not None:
+            return self._table.itemsize * len(self._table)
+        return 100 * len(self._exact)
@@ -0,0 +1,159 @@
+"""Disk spilling for the frames held in :attr:`ProcessPipe.env`."""
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import weakref
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Set
+
+import pandas as pd
+
+from ..operators import Operator
+from .codec import decode_frame, encode_frame
+from .scheduler import consumers_of
+
+log = logging.getLogger("processpipe")
+
+_SAMPLE_ROWS = 100
+
+
+def estimate_nbytes(df: pd.DataFrame) -> int:
+    """Rough resident size of ``df``, extrapolated from its first rows."""
+    if hasattr(df, "nbytes"):
+        return df.nbytes
+    n = df.shape[0]
+    if not n:
+        return 0
+    sample = {c: df[c][:_SAMPLE_ROWS] for c in df.columns}
+    per_row = 0
+    for values in sample.values():
+        per_row += sum(sys.getsizeof(v) for v in values) / len(values)
+    # per-row container overhead (dict slots for the row form)
+    per_row += 8 * len(sample) + 64
+    return int(per_row * n)
+
+
+class SpillingEnv(MutableMapping):
+    """Frame environment that keeps at most ``budget`` bytes resident.
+
+    When the estimate of resident frames exceeds the budget, the frame whose
+    next consumer comes latest in the plan order is written to ``directory``
+    in the :mod:`codec` format and dropped from memory.  Reading a spilled
+    name loads it back transparently.  Frames are treated as immutable, so a
+    frame spilled twice is only written once.
+    """
+
+    def __init__(self, budget: int, directory: str | None = None) -> None:
+        self.budget = budget
+        self.directory = tempfile.mkdtemp(prefix="processpipe-spill-", dir=directory)
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self.directory, ignore_errors=True
+        )
+        self._resident: Dict[str, pd.DataFrame] = {}
+        self._sizes: Dict[str, int] = {}
+        self._files: Dict[str, str] = {}
+        self._file_ids = itertools.count()
+        self._pinned: Set[str] = set()
+        self._uses: Dict[str, List[int]] = {}
+        self._position: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    # ── schedule ─────────────────────────────────────────────────
+    def plan(self, ops: List[Operator], pinned: Iterable[str] = ()) -> None:
+        """Record the order in which ``ops`` are expected to read frames."""
+        with self._lock:
+            self._position = position = {op.output: i for i, op in enumerate(ops)}
+            self._uses = {
+                name: sorted(position[op.output] for op in readers)
+                for name, readers in consumers_of(ops).items()
+            }
+            self._pinned.update(pinned)
+
+    def pin(self, name: str) -> None:
+        """Never spill ``name`` (e.g. a source frame the caller still holds)."""
+        with self._lock:
+            self._pinned.add(name)
+
+    def finished(self, op: Operator) -> None:
+        """Drop ``op``'s reads from the remaining schedule."""
+        with self._lock:
+            pos = self._position.get(op.output)
+            for name in dict.fromkeys(op.inputs):
+                uses = self._uses.get(name)
+                if uses and pos in uses:
+                    uses.remove(pos)
+
+    def _next_use(self, name: str) -> float:
+        uses = self._uses.get(name)
+        return uses[0] if uses else float("inf")
+
+    # ── spilling ─────────────────────────────────────────────────
+    @property
+    def spilled(self) -> List[str]:
+        return [name for name in self._files if name not in self._resident]
+
+    def _enforce_budget(self, current: str) -> None:
+        while sum(self._sizes[n] for n in self._resident) > self.budget:
+            victims = [
+                n for n in self._resident if n != current and n not in self._pinned
+            ]
+            if not victims:
+                return
+            victim = max(victims, key=lambda n: (self._next_use(n), self._sizes[n]))
+            self._spill(victim)
+
+    def _spill(self, name: str) -> None:
+        df = self._resident.pop(name)
+        if name not in self._files:
+            path = os.path.join(self.directory, f"{next(self._file_ids)}.ppf")
+            with open(path, "wb") as f:
+                f.write(encode_frame(df))
+            self._files[name] = path
+        log.info("spilled '%s' (~%d bytes)", name, self._sizes[name])
+
+    # ── mapping protocol ─────────────────────────────────────────
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        with self._lock:
+            if name in self._resident:
+                return self._resident[name]
+            if name not in self._files:
+                raise KeyError(name)
+            with open(self._files[name], "rb") as f:
+                df = decode_frame(f.read())
+            self._resident[name] = df
+            self._enforce_budget(name)
+            return df
+
+    def __setitem__(self, name: str, df: pd.DataFrame) -> None:
+        with self._lock:
+            self._discard(name)
+            self._resident[name] = df
+            self._sizes[name] = estimate_nbytes(df)
+            self._enforce_budget(name)
+
+    def _discard(self, name: str) -> None:
+        self._resident.pop(name, None)
+        self._sizes.pop(name, None)
+        path = self._files.pop(name, None)
+        if path is not None:
+            os.remove(path)
+
+    def __delitem__(self, name: str) -> None:
+        with self._lock:
+            if name not in self:
+                raise KeyError(name)
+            self._discard(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._resident or name in self._files
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(dict.fromkeys([*self._resident, *self._files])))
+
+    def __len__(self) -> int:
+        return len(set(self._resident) | set(self._files))
@@ -0,0 +1,84 @@
+"""Export of pipeline runs in the Chrome trace-event format.
+
+The files open in ``chrome://tracing`` and https://ui.perfetto.dev.  Each
+operator becomes one complete ("X") event on the process and thread that ran
+it, so overlapping spans show real parallelism and stacked ones show work that
+serialised.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+from ..operators import Operator
+from .profiling import OperatorStats, RunHook
+
+
+def _us(seconds: float) -> float:
+    return round(seconds * 1e6, 3)
+
+
+class TraceHook(RunHook):
+    """Write one span per operator to ``path`` when the run ends."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        self._start = 0.0
+        self._events: List[Dict[str, Any]] = []
+
+    def on_run_start(self, pipe: Any, ops: List[Operator]) -> None:
+        self._start = time.time()
+        self._events = []
+
+    def on_operator_end(self, stats: OperatorStats) -> None:
+        self._events.append(
+            {
+                "name": f"{stats.operator} -> {stats.output}",
+                "cat": "cached" if stats.cached else "operator",
+                "ph": "X",
+                "ts": _us(stats.start - self._start),
+                "dur": _us(stats.wall_time),
+                "pid": stats.pid,
+                "tid": stats.thread,
+                "args": {
+                    "inputs": stats.inputs,
+                    "output": stats.output,
+                    "rows_in": stats.rows_in,
+                    "rows_out": stats.rows_out,
+                    "cpu_ms": round(stats.cpu_time * 1e3, 3),
+                },
+            }
+        )
+
+    def on_run_end(self, pipe: Any) -> None:
+        pid = os.getpid()
+        run = {
+            "name": "run",
+            "cat": "pipeline",
+            "ph": "X",
+            "ts": 0,
+            "dur": _us(time.time() - self._start),
+            "pid": pid,
+            "tid": threading.get_ident(),
+            "args": {
+                "max_workers": pipe.max_workers,
+                "executor": pipe.executor,
+            },
+        }
+        names = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": p,
+                "args": {"name": "driver" if p == pid else f"worker {p}"},
+            }
+            for p in sorted({pid, *(e["pid"] for e in self._events)})
+        ]
+        with open(self.path, "w") as f:
+            json.dump(
+                {"traceEvents": [*names, run, *self._events], "displayTimeUnit": "ms"},
+                f,
+            )
@@ -18,6 +18,7 @@ from .rownumber import RowNumberOperator
 from .delete import DeleteOperator
 from .update import UpdateOperator
 from .case import CaseOperator
+from .window import WindowOperator
 
 __all__ = [
     "Operator",
@@ -40,4 +41,5 @@ __all__ = [
     "DeleteOperator",
     "UpdateOperator",
     "CaseOperator",
+    "WindowOperator",
 ]
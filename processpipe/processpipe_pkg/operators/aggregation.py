@@ -1,21 +1,47 @@
 from __future__ import annotations
 
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Union
 import pandas as pd
 from .base import Operator
+from ..core.aggregate import grouping_sets, parse_agg_map
 from ..core.backend import FrameBackend
 
 
 class AggregationOperator(Operator):
+    """Aggregate ``source`` per ``groupby`` key.
+
+    ``agg_map`` values are a function name, a list of names (outputs
+    ``"{column}_{func}"``) or a named aggregate ``(column, func)`` /
+    ``{"column": ..., "func": ...}`` stored under its key.  ``grouping_sets``
+    (subsets of ``groupby``), ``rollup`` or ``cube`` stack the aggregates of
+    several groupings, with a ``grouping_id`` column telling them apart.
+    """
+
     def __init__(self, source: str,
                  groupby: Union[str, List[str]],
-                 agg_map: Dict[str, str],
-                 *, output: str | None = None):
+                 agg_map: Dict[str, Any],
+                 *, grouping_sets: List[List[str]] | None = None,
+                 rollup: bool = False, cube: bool = False,
+                 output: str | None = None):
         super().__init__(output or f"{source}_agg")
         self.source, self.groupby, self.agg_map = source, groupby, agg_map
+        self.grouping_sets = grouping_sets
+        self.rollup = rollup
+        self.cube = cube
         self.inputs = [source]
+        parse_agg_map(agg_map)
+        self._sets()
+
+    def _sets(self) -> List[List[str]] | None:
+        keys = [self.groupby] if isinstance(self.groupby, str) else self.groupby
+        return grouping_sets(keys, self.grouping_sets,
+                             rollup=self.rollup, cube=self.cube)
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        return backend.groupby_agg(env[self.source],
-                                   self.groupby, self.agg_map)
+        sets = self._sets()
+        if sets is None:
+            return backend.groupby_agg(env[self.source],
+                                       self.groupby, self.agg_map)
+        return backend.groupby_agg(env[self.source], self.groupby,
+                                   self.agg_map, grouping_sets=sets)
@@ -20,12 +20,37 @@ class Operator(abc.ABC):
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         ...
 
-    def execute(self, backend: FrameBackend,
-                env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    @property
+    def is_async(self) -> bool:
+        """True when the subclass implements ``async _aexecute_core``."""
+        return hasattr(self, "_aexecute_core")
+
+    def _check_inputs(self, env: Dict[str, pd.DataFrame]) -> None:
         for k in self.inputs:
             if k not in env:
                 raise KeyError(f"{self.__class__.__name__}: missing '{k}'")
+
+    def execute(self, backend: FrameBackend,
+                env: Dict[str, pd.DataFrame],
+                prefilter=None) -> pd.DataFrame:
+        """Run the operator; ``prefilter`` (a runtime join filter) first
+        narrows its input to the rows that can match."""
+        self._check_inputs(env)
+        if prefilter is not None:
+            env = prefilter.apply(env)
         res = self._execute_core(backend, env)
         log.info("%s -> '%s' shape=%s",
                  self.__class__.__name__, self.output, res.shape)
         return res
+
+    async def aexecute(self, backend: FrameBackend,
+                       env: Dict[str, pd.DataFrame],
+                       prefilter=None) -> pd.DataFrame:
+        """Await ``_aexecute_core``; only valid when :attr:`is_async`."""
+        self._check_inputs(env)
+        if prefilter is not None:
+            env = prefilter.apply(env)
+        res = await self._aexecute_core(backend, env)
+        log.info("%s -> '%s' shape=%s",
+                 self.__class__.__name__, self.output, res.shape)
+        return res
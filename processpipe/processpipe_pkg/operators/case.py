@@ -4,6 +4,7 @@ from typing import Dict, List, Any
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.expr import compile_expression
 
 
 class CaseOperator(Operator):
@@ -17,18 +18,18 @@ class CaseOperator(Operator):
         self.default = default
         self.output_col = output_col
         self.inputs = [source]
+        for cond in conditions:
+            compile_expression(cond)
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        case = getattr(backend, "case", None)
+        if case is not None:
+            return case(env[self.source], self.conditions, self.choices,
+                        self.default, self.output_col)
         df = env[self.source].copy()
-        for row in df._rows:
-            val = self.default
-            for cond, choice in zip(self.conditions, self.choices):
-                try:
-                    if eval(cond, {}, row):
-                        val = choice
-                        break
-                except Exception:
-                    pass
-            row[self.output_col] = val
+        masks = [compile_expression(c).mask(df) for c in self.conditions]
+        for row, *hits in zip(df._rows, *masks):
+            row[self.output_col] = next(
+                (ch for ch, h in zip(self.choices, hits) if h), self.default)
         return df
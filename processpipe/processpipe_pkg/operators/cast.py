@@ -16,6 +16,9 @@ class CastOperator(Operator):
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        cast = getattr(backend, "cast", None)
+        if cast is not None:
+            return cast(env[self.source], self.casts)
         df = env[self.source].copy()
         for row in df._rows:
             for col, func in self.casts.items():
@@ -4,6 +4,8 @@ from typing import Dict
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.expr import compile_expression
+from ..core.frame import take
 
 
 class DeleteOperator(Operator):
@@ -12,16 +14,10 @@ class DeleteOperator(Operator):
         self.source = source
         self.condition = condition
         self.inputs = [source]
+        compile_expression(condition)
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         df = env[self.source]
-        rows = []
-        for row in df._rows:
-            try:
-                keep = not eval(self.condition, {}, row)
-            except Exception:
-                keep = True
-            if keep:
-                rows.append(row.copy())
-        return pd.DataFrame(rows)
+        hit = compile_expression(self.condition).mask(df)
+        return take(df, [i for i, h in enumerate(hit) if not h])
@@ -1,33 +1,94 @@
 from __future__ import annotations
 
+from array import array
 from typing import Dict, List
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.frame import nrows, take
+from ..core.keystore import DiskKeyMap
+
+_hash = hash  # module level so tests can force collisions
 
 
 class DropDuplicateOperator(Operator):
-    def __init__(self, source: str, subset: List[str] | None = None,
-                 *, keep: str = "first", output: str | None = None) -> None:
+    """Keep one row per distinct ``subset`` key (all columns by default).
+
+    Keys are seen in waves of ``chunk_size`` rows.  Each distinct key is
+    remembered by its hash and the position of its first row; a hash hit is
+    confirmed by comparing the actual key values, and keys whose hash is
+    already taken by another key are kept exactly on the side.  Once more
+    than ``max_keys`` distinct keys are seen, the hashes move to a SQLite
+    file under ``spill_dir`` and are looked up a chunk at a time.
+
+    Rows come out in order of each key's first occurrence; ``keep="last"``
+    puts the key's last row in that place.
+    """
+
+    def __init__(self, source: str, subset: str | List[str] | None = None,
+                 *, keep: str = "first", chunk_size: int = 65536,
+                 max_keys: int | None = None, spill_dir: str | None = None,
+                 output: str | None = None) -> None:
         super().__init__(output or f"{source}_dedup")
         self.source = source
-        self.subset = subset
+        self.subset = [subset] if isinstance(subset, str) else subset
         self.keep = keep
+        self.chunk_size = chunk_size
+        self.max_keys = max_keys
+        self.spill_dir = spill_dir
         self.inputs = [source]
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if max_keys is not None and max_keys < 0:
+            raise ValueError("max_keys must not be negative")
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         df = env[self.source]
-        subset = self.subset or df.columns
-        seen = {}
-        rows = []
-        for row in df._rows:
-            key = tuple(row.get(c) for c in subset)
-            if key not in seen:
-                seen[key] = row
-                rows.append(row.copy())
-            elif self.keep == "last":
-                seen[key] = row
-        if self.keep == "last":
-            rows = [seen[key].copy() for key in seen]
-        return pd.DataFrame(rows)
+        n = nrows(df)
+        columns = [df[c] for c in (self.subset or df.columns)]
+        firsts: array = array("q")
+        lasts: array = array("q")
+        memory: Dict[int, int] | None = {}
+        exact: Dict[tuple, int] = {}  # keys whose hash belongs to another key
+        disk = None
+
+        def key_at(pos: int) -> tuple:
+            return tuple(col[pos] for col in columns)
+
+        try:
+            for start in range(0, n, self.chunk_size):
+                stop = min(n, start + self.chunk_size)
+                if columns:
+                    keys = list(zip(*(col[start:stop] for col in columns)))
+                else:
+                    keys = [()] * (stop - start)
+                hashes = [_hash(k) for k in keys]
+                known = memory if disk is None else disk.lookup(set(hashes))
+                added = []
+                for pos, key, h in zip(range(start, stop), keys, hashes):
+                    slot = known.get(h)
+                    if slot is not None and key_at(firsts[slot]) != key:
+                        slot = exact.get(key)
+                        if slot is None:
+                            slot = exact[key] = len(firsts)
+                            firsts.append(pos)
+                            lasts.append(pos)
+                            continue
+                    if slot is None:
+                        slot = known[h] = len(firsts)
+                        firsts.append(pos)
+                        lasts.append(pos)
+                        added.append((h, slot))
+                    else:
+                        lasts[slot] = pos
+                if disk is not None:
+                    disk.insert(added)
+                elif self.max_keys is not None and len(memory) > self.max_keys:
+                    disk = DiskKeyMap(self.spill_dir)
+                    disk.insert(memory.items())
+                    memory = None
+        finally:
+            if disk is not None:
+                disk.close()
+        return take(df, lasts if self.keep == "last" else firsts)
@@ -17,6 +17,9 @@ class FillNAOperator(Operator):
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        fill_na = getattr(backend, "fill_na", None)
+        if fill_na is not None:
+            return fill_na(env[self.source], self.value, self.columns)
         df = env[self.source].copy()
         cols = self.columns or df.columns
         for row in df._rows:
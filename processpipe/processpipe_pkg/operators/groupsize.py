@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.index import group_index
 
 
 class GroupSizeOperator(Operator):
-    def __init__(self, source: str, groupby: str,
+    def __init__(self, source: str, groupby: str | List[str],
                  *, output: str | None = None):
         super().__init__(output or f"{source}_counts")
         self.source, self.groupby = source, groupby
@@ -15,10 +16,9 @@ class GroupSizeOperator(Operator):
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        df = env[self.source].copy()
-        group_sizes = df.groupby(self.groupby).transform("size")
-        if isinstance(group_sizes, pd.DataFrame):
-            df["group_size"] = group_sizes.iloc[:, 0]
-        else:
-            df["group_size"] = group_sizes
+        source = env[self.source]
+        keys = [self.groupby] if isinstance(self.groupby, str) else self.groupby
+        index = group_index(backend, source, keys)
+        df = source.copy()
+        df["group_size"] = index.broadcast(index.sizes())
         return df
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import functools
+import logging
 from typing import Dict, List, Tuple
 
 import pandas as pd
 
 from ..core.backend import FrameBackend
+from ..core.joins import JOIN_TYPES, PREDICATES, hash_join
 from .base import Operator
 
+log = logging.getLogger("processpipe")
+
 
 class JoinOperator(Operator):
+    """Join two frames on key pairs.
+
+    ``on`` lists ``(left_col, right_col)`` pairs (or names shared by both
+    inputs); ``conditions`` gives, per pair, ``"eq"`` or one of ``"neq"``,
+    ``"gt"``, ``"gte"``, ``"lt"``, ``"lte"``.  Columns present on both sides
+    are renamed with ``suffixes``.  After a run, :attr:`join_stats` holds the
+    build/probe sizes reported by the back-end's ``hash_join`` (or by
+    :func:`~.joins.hash_join` for back-ends without one).
+    """
+
     def __init__(
         self,
         left: str,
@@ -18,6 +33,7 @@ class JoinOperator(Operator):
         how: str = "inner",
         conditions: List[str] | None = None,
         output: str | None = None,
+        suffixes: Tuple[str, str] = ("_left", "_right"),
     ) -> None:
         super().__init__(output or f"{left}_{how}_join_{right}")
         self.left = left
@@ -32,7 +48,19 @@ class JoinOperator(Operator):
         else:
             self.on = [(c, c) for c in on]  # type: ignore[arg-type]
         self.conditions = conditions or ["eq"] * len(self.on)
+        if how not in JOIN_TYPES:
+            raise ValueError(f"Unsupported join type: {how}")
+        for cond in self.conditions:
+            if cond != "eq" and cond not in PREDICATES:
+                raise ValueError(f"Unsupported join condition: {cond}")
+        self.suffixes = tuple(suffixes)
         self.inputs = [left, right]
+        self._join_stats = None
+
+    @property
+    def join_stats(self):
+        """``JoinStats`` of the last execution, or ``None``."""
+        return self._join_stats
 
     def _execute_core(
         self, backend: FrameBackend, env: Dict[str, pd.DataFrame]
@@ -46,53 +74,21 @@ class JoinOperator(Operator):
         eq_pairs = [p for p, c in zip(self.on, self.conditions) if c == "eq"]
         neq_pairs = [(p, c) for p, c in zip(self.on, self.conditions) if c != "eq"]
 
-        on_cols = [lcol for lcol, _ in eq_pairs]
-        dup_cols = set(left_df.columns) & set(right_df.columns) - set(on_cols)
-
-        def _rename(df, suffix):
-            rows = []
-            for row in df._rows:
-                new_row = {}
-                for k, v in row.items():
-                    if k in on_cols:
-                        new_row[k] = v
-                    elif k in dup_cols:
-                        new_row[f"{k}{suffix}"] = v
-                    else:
-                        new_row[k] = v
-                rows.append(new_row)
-            if hasattr(pd.DataFrame, "from_rows"):
-                return pd.DataFrame.from_rows(rows)
-            cols: Dict[str, List] = {}
-            for r in rows:
-                for k, v in r.items():
-                    cols.setdefault(k, []).append(v)
-            return pd.DataFrame(cols)
-
-        left_df = _rename(left_df, "_left")
-        right_df = _rename(right_df, "_right")
-
-        merged = backend.merge(left_df, right_df, on=on_cols, how="left")
-        if self.how == "inner":
-            right_columns = [c for c in right_df.columns if c not in on_cols]
-            if right_columns:
-                cond = " and ".join(f"{c} is not None" for c in right_columns)
-                merged = backend.query(merged, cond)
-
-        if neq_pairs:
-            expr_parts = []
-            for (lcol, rcol), op in neq_pairs:
-                left_name = f"{lcol}_left"
-                right_name = f"{rcol}_right"
-                if op == "neq":
-                    expr_parts.append(f"{left_name} != {right_name}")
-                elif op == "gt":
-                    expr_parts.append(f"{left_name} > {right_name}")
-                elif op == "gte":
-                    expr_parts.append(f"{left_name} >= {right_name}")
-                elif op == "lt":
-                    expr_parts.append(f"{left_name} < {right_name}")
-                elif op == "lte":
-                    expr_parts.append(f"{left_name} <= {right_name}")
-            merged = backend.query(merged, " and ".join(expr_parts))
+        # back-ends without their own hash_join use the shared kernel
+        join = getattr(backend, "hash_join", None)
+        if join is None:
+            join = functools.partial(
+                hash_join, cache=getattr(backend, "index_cache", None)
+            )
+        merged, self._join_stats = join(
+            left_df,
+            right_df,
+            left_on=[lcol for lcol, _ in eq_pairs],
+            right_on=[rcol for _, rcol in eq_pairs],
+            how=self.how,
+            predicates=[(lcol, rcol, c) for (lcol, rcol), c in neq_pairs],
+            suffixes=self.suffixes,
+        )
+        log.debug("%s -> '%s' %s", self.__class__.__name__, self.output,
+                  self._join_stats)
         return merged
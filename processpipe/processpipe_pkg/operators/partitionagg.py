@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Any, Dict, List
 import pandas as pd
 from .base import Operator
+from ..core.aggregate import accumulator
 from ..core.backend import FrameBackend
+from ..core.index import group_index
+
+
+def _aggregate(values: List[Any], func: str) -> Any:
+    acc = accumulator(func)
+    acc.update(values)
+    return acc.result()
 
 
 class PartitionAggOperator(Operator):
@@ -14,29 +22,18 @@ class PartitionAggOperator(Operator):
         self.groupby = groupby
         self.agg_map = agg_map
         self.inputs = [source]
+        for func in agg_map.values():
+            accumulator(func)
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        df = env[self.source].copy()
-        groups: Dict[tuple, List[int]] = {}
-        for idx, row in enumerate(df._rows):
-            key = tuple(row.get(c) for c in self.groupby)
-            groups.setdefault(key, []).append(idx)
+        source = env[self.source]
+        keys = [self.groupby] if isinstance(self.groupby, str) else self.groupby
+        index = group_index(backend, source, keys)
+        df = source.copy()
         for col, func in self.agg_map.items():
-            for key, idxs in groups.items():
-                values = [df._rows[i].get(col) for i in idxs]
-                if func == "sum":
-                    val = sum(values)
-                elif func in {"mean", "avg"}:
-                    val = sum(values) / len(values) if values else None
-                elif func == "max":
-                    val = max(values)
-                elif func == "min":
-                    val = min(values)
-                elif func == "count":
-                    val = len(values)
-                else:
-                    val = None
-                for i in idxs:
-                    df._rows[i][f"{col}_{func}"] = val
+            column = source[col]
+            per_group = [_aggregate([column[i] for i in members], func)
+                         for members in index.groups()]
+            df[f"{col}_{func}"] = index.broadcast(per_group)
         return df
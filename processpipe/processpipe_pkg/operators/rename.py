@@ -16,6 +16,9 @@ class RenameOperator(Operator):
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        rename = getattr(backend, "rename", None)
+        if rename is not None:
+            return rename(env[self.source], self.columns)
         df = env[self.source].copy()
         for row in df._rows:
             for old, new in self.columns.items():
@@ -1,40 +1,181 @@
 from __future__ import annotations
 
-from typing import Dict
+import operator
+import re
+from collections import deque
+from datetime import timedelta
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
 
+AGGS = ("sum", "mean", "avg", "count", "min", "max")
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _parse_window(window: Any) -> int | timedelta:
+    """Row count, or a time span given as ``timedelta`` or e.g. ``"7d"``."""
+    if isinstance(window, str):
+        m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", window)
+        if m is None:
+            raise ValueError(f"Invalid rolling window: {window!r}")
+        window = timedelta(seconds=float(m.group(1)) * _UNITS[m.group(2)])
+    if isinstance(window, timedelta):
+        if window <= timedelta(0):
+            raise ValueError("Rolling time window must be positive")
+        return window
+    window = int(window)
+    if window < 1:
+        raise ValueError("Rolling window must be at least 1 row")
+    return window
+
+
+def _window_label(span: timedelta) -> str:
+    """``span`` in its largest whole unit out of d, h, m and s, e.g. ``"7d"``."""
+    seconds = span / timedelta(seconds=1)
+    for unit in "dhm":
+        count, rest = divmod(seconds, _UNITS[unit])
+        if not rest:
+            return f"{int(count)}{unit}"
+    if seconds == int(seconds):
+        return f"{int(seconds)}s"
+    return f"{seconds:.6f}".rstrip("0") + "s"
+
+
+def _time_starts(times: Sequence[Any], span: timedelta) -> List[int]:
+    """First position inside ``(t - span, t]`` for each of the sorted times."""
+    if times and isinstance(times[0], (int, float)):
+        span = span.total_seconds()
+    starts = []
+    start = 0
+    for t in times:
+        lower = t - span
+        while times[start] <= lower:
+            start += 1
+        starts.append(start)
+    return starts
+
+
+def _window_sums(values: Sequence[Any],
+                 starts: Sequence[int]) -> List[Tuple[Any, int]]:
+    """Running ``(sum, count)`` of the non-null values of each window."""
+    out = []
+    total, count, lo = 0, 0, 0
+    for i, v in enumerate(values):
+        if v is not None:
+            total += v
+            count += 1
+        while lo < starts[i]:
+            old = values[lo]
+            if old is not None:
+                total -= old
+                count -= 1
+                if not count:
+                    total = 0  # no float residue from an emptied window
+            lo += 1
+        out.append((total, count))
+    return out
+
+
+def _window_extremes(values: Sequence[Any], starts: Sequence[int],
+                     beats: Callable[[Any, Any], bool]) -> List[Any]:
+    """Min or max of each window with a monotonic deque of positions."""
+    out = []
+    best: deque = deque()
+    for i, v in enumerate(values):
+        if v is not None:
+            while best and not beats(values[best[-1]], v):
+                best.pop()
+            best.append(i)
+        while best and best[0] < starts[i]:
+            best.popleft()
+        out.append(values[best[0]] if best else None)
+    return out
+
 
 class RollingAggOperator(Operator):
-    def __init__(self, source: str, on: str, window: int, agg: str,
-                 *, output: str | None = None) -> None:
+    """Aggregate ``on`` over a sliding window ending at each row.
+
+    ``window`` is a number of rows, or a time span (``timedelta`` or a string
+    such as ``"30d"``, ``"12h"``) over the single ``order_by`` column, whose
+    window holds the rows with a timestamp in ``(t - span, t]`` up to the
+    current one.  With ``partition_by`` each group has its own windows; with
+    ``order_by`` rows are windowed in that order.  Results are written to
+    ``output_col`` (default ``"{on}_{agg}{window}"``, with a time span written
+    as e.g. ``7d``) in the input's row order.  Null values are skipped; a
+    window without values gives ``None`` (``0`` for ``count``), as does a row
+    without a timestamp.  Each aggregate is a single pass: running sums for
+    ``sum``/``mean``/``count`` and a monotonic deque for ``min``/``max``.
+    """
+
+    def __init__(self, source: str, on: str, window: int | str | timedelta,
+                 agg: str, *, partition_by: str | List[str] | None = None,
+                 order_by: str | List[str] | None = None,
+                 output_col: str | None = None,
+                 output: str | None = None) -> None:
         super().__init__(output or f"{source}_rolling")
         self.source = source
         self.on = on
-        self.window = int(window)
+        span = _parse_window(window)
+        self.window = span if isinstance(span, int) else _window_label(span)
         self.agg = agg
+        self.partition_by = ([partition_by] if isinstance(partition_by, str)
+                             else list(partition_by or []))
+        self.order_by = ([order_by] if isinstance(order_by, str)
+                         else list(order_by or []))
+        self.output_col = output_col or f"{on}_{agg}{self.window}"
         self.inputs = [source]
+        if agg not in AGGS:
+            raise ValueError(f"Unsupported rolling aggregation '{agg}'")
+        if not isinstance(span, int) and len(self.order_by) != 1:
+            raise ValueError("Time windows need exactly one order_by column")
+
+    def _aggregate(self, values: List[Any], starts: List[int]) -> List[Any]:
+        if self.agg == "min":
+            return _window_extremes(values, starts, operator.lt)
+        if self.agg == "max":
+            return _window_extremes(values, starts, operator.gt)
+        sums = _window_sums(values, starts)
+        if self.agg == "count":
+            return [count for _, count in sums]
+        if self.agg == "sum":
+            return [total if count else None for total, count in sums]
+        return [total / count if count else None for total, count in sums]
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        df = env[self.source].copy()
-        values = [row.get(self.on) for row in df._rows]
-        results = []
-        for i in range(len(values)):
-            start = max(0, i - self.window + 1)
-            window_vals = values[start : i + 1]
-            if self.agg == "sum":
-                val = sum(window_vals)
-            elif self.agg in {"mean", "avg"}:
-                val = sum(window_vals) / len(window_vals) if window_vals else None
-            elif self.agg == "max":
-                val = max(window_vals)
-            elif self.agg == "min":
-                val = min(window_vals)
+        df = env[self.source]
+        values = df[self.on]
+        span = _parse_window(self.window)
+        if self.partition_by:
+            keys = zip(*(df[c] for c in self.partition_by))
+        else:
+            keys = repeat(())
+        groups: Dict[tuple, List[int]] = {}
+        for pos, key in zip(range(len(values)), keys):
+            members = groups.get(key)
+            if members is None:
+                groups[key] = [pos]
+            else:
+                members.append(pos)
+        order = [df[c] for c in self.order_by]
+        results: List[Any] = [None] * len(values)
+        for positions in groups.values():
+            if order:
+                # stable, nulls last
+                positions.sort(key=lambda p: [(col[p] is None, col[p])
+                                              for col in order])
+            if isinstance(span, int):
+                starts = [max(0, i - span + 1) for i in range(len(positions))]
             else:
-                val = None
-            results.append(val)
-        for row, val in zip(df._rows, results):
-            row[f"{self.on}_{self.agg}{self.window}"] = val
-        return df
+                times = order[0]
+                positions = [p for p in positions if times[p] is not None]
+                starts = _time_starts([times[p] for p in positions], span)
+            window_vals = [values[p] for p in positions]
+            for p, val in zip(positions, self._aggregate(window_vals, starts)):
+                results[p] = val
+        out = df.copy()
+        out[self.output_col] = results
+        return out
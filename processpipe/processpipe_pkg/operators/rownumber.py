@@ -4,6 +4,8 @@ from typing import Dict, List
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.frame import nrows, take
+from ..core.index import group_index
 
 
 class RowNumberOperator(Operator):
@@ -18,18 +20,24 @@ class RowNumberOperator(Operator):
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        df = env[self.source].copy()
+        source = env[self.source]
+        positions = list(range(nrows(source)))
         if self.order_by:
-            df._rows.sort(key=lambda r: tuple(r.get(c) for c in self.order_by))
+            if len(self.order_by) == 1:
+                order = source[self.order_by[0]]
+            else:
+                order = list(zip(*(source[c] for c in self.order_by)))
+            positions.sort(key=order.__getitem__)
+        numbers = [0] * len(positions)
         if self.partition_by:
-            groups: Dict[tuple, List[int]] = {}
-            for idx, row in enumerate(df._rows):
-                key = tuple(row.get(c) for c in self.partition_by)
-                groups.setdefault(key, []).append(idx)
-            for idxs in groups.values():
-                for pos, i in enumerate(idxs):
-                    df._rows[i]["row_number"] = pos + 1
+            index = group_index(backend, source, self.partition_by)
+            ids, seen = index.ids, [0] * len(index)
+            for pos in positions:
+                seen[ids[pos]] += 1
+                numbers[pos] = seen[ids[pos]]
         else:
-            for pos, row in enumerate(df._rows):
-                row["row_number"] = pos + 1
+            for n, pos in enumerate(positions, 1):
+                numbers[pos] = n
+        df = take(source, positions) if self.order_by else source.copy()
+        df["row_number"] = [numbers[pos] for pos in positions]
         return df
@@ -4,23 +4,43 @@ from typing import Dict, List
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.frame import take
+from ..core.ordering import sort_positions
 
 
 class SortOperator(Operator):
-    def __init__(self, source: str, by: str | List[str], *, ascending: bool = True,
+    """Stable sort on ``by`` columns.
+
+    ``ascending`` is given once or per column; nulls go to the end (or the
+    start, with ``na_position="first"``) whatever the direction.
+    """
+
+    def __init__(self, source: str, by: str | List[str], *,
+                 ascending: bool | List[bool] = True,
+                 na_position: str = "last",
                  output: str | None = None) -> None:
         super().__init__(output or f"{source}_sorted")
         self.source = source
         self.by = [by] if isinstance(by, str) else list(by)
         self.ascending = ascending
+        self.na_position = na_position
         self.inputs = [source]
+        if na_position not in ("first", "last"):
+            raise ValueError(f"Unsupported na_position: {na_position}")
+        if len(self._directions()) != len(self.by):
+            raise ValueError("ascending must be a bool or one per column")
+
+    def _directions(self) -> List[bool]:
+        if isinstance(self.ascending, (list, tuple)):
+            return list(self.ascending)
+        return [self.ascending] * len(self.by)
+
+    def _order(self, df: pd.DataFrame) -> List[int]:
+        return sort_positions([df[c] for c in self.by], self._directions(),
+                              self.na_position == "first")
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         df = env[self.source]
-        rows = sorted(
-            df._rows,
-            key=lambda r: tuple(r.get(c) for c in self.by),
-            reverse=not self.ascending,
-        )
-        return pd.DataFrame(rows)
+        return take(df, self._order(df))
+
@@ -22,12 +22,20 @@ class StringOperator(Operator):
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        df = env[self.source].copy()
         target = self.new_column or self.column
+        method = getattr(backend, f"str_{self.op}", None)
+        if self.op == "contains" and method is not None:
+            return method(env[self.source], self.column, self.pattern, target)
+        if self.op == "replace" and method is not None:
+            return method(env[self.source], self.column, self.pattern,
+                          self.replacement or "", target)
+        df = env[self.source].copy()
         for row in df._rows:
-            val = str(row.get(self.column, ""))
-            if self.op == "contains":
-                row[target] = bool(re.search(self.pattern, val))
+            val = row.get(self.column)
+            if val is None:
+                row[target] = None
+            elif self.op == "contains":
+                row[target] = bool(re.search(self.pattern, str(val)))
             elif self.op == "replace":
-                row[target] = re.sub(self.pattern, self.replacement or "", val)
+                row[target] = re.sub(self.pattern, self.replacement or "", str(val))
         return df
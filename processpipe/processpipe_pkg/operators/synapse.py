@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 from typing import Dict
 import pandas as pd
 from .base import Operator
@@ -17,3 +19,13 @@ class SynapseNotebookOperator(Operator):
     def _execute_core(self, backend: FrameBackend, env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         # Placeholder for real REST API interaction. For now just echo back.
         return env[self.source]
+
+    async def _aexecute_core(
+        self, backend: FrameBackend, env: Dict[str, pd.DataFrame]
+    ) -> pd.DataFrame:
+        # The synchronous call blocks until the notebook run finishes, so run
+        # it in a worker thread to let other operators progress meanwhile.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self._execute_core, backend, env)
+        )
@@ -1,14 +1,138 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from heapq import nlargest, nsmallest
+from itertools import count, repeat
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.frame import nrows, take
+from ..core.index import group_index
+from ..core.ordering import Descending
+
+
+def _as_list(value: Any) -> List[Any]:
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _metric_spec(metric: Any, largest: Any) -> tuple:
+    """``(metrics, largest)`` lists of equal length."""
+    metrics, largest = _as_list(metric), _as_list(largest)
+    if len(largest) == 1:
+        largest = largest * len(metrics)
+    if len(largest) != len(metrics):
+        raise ValueError("largest must be a bool or one per metric")
+    return metrics, largest
+
+
+def _ranks(columns: Sequence[List[Any]], largest: Sequence[bool]) -> Iterator[tuple]:
+    """Lazy rank per row, smallest best, nulls last."""
+    parts = []
+    for values, big in zip(columns, largest):
+        if big:
+            parts.append((v is None, Descending(v)) for v in values)
+        else:
+            parts.append((v is None, v) for v in values)
+    return zip(*parts)
+
+
+def _best(n: int, items: Iterable[Any], key: Callable[[Any], Any],
+          reverse: bool = False) -> List[Any]:
+    """The ``n`` items with the smallest keys (largest with ``reverse``),
+    best first; a heap of ``n``, and ties keep the order of ``items``."""
+    return (nlargest if reverse else nsmallest)(n, items, key=key)
+
+
+def _sort_keys(df: pd.DataFrame, metrics: Sequence[str],
+               largest: Sequence[bool]) -> tuple:
+    """Per-row keys and whether larger keys rank first (nulls rank last)."""
+    columns = [df[col] for col in metrics]
+    largest = list(largest)
+    if len(set(largest)) > 1:
+        # mixed directions: negate numeric descending columns
+        for i, values in enumerate(columns):
+            if largest[i] and all(v is None or type(v) in (int, float)
+                                  for v in values):
+                columns[i] = [None if v is None else -v for v in values]
+                largest[i] = False
+    reverse = largest[0]
+    if any(big != reverse for big in largest):
+        return list(_ranks(columns, largest)), False
+    if any(None in values for values in columns):
+        columns = [[(v is not None if reverse else v is None, v) for v in values]
+                   for values in columns]
+    if len(columns) == 1:
+        return columns[0], reverse
+    return list(zip(*columns)), reverse
+
+
+class TopNAccumulator:
+    """Running top ``n`` rows (per group) over frames fed in chunks.
+
+    Only ``n`` rows per group are held between :meth:`add` calls.  Rows are
+    ranked on ``metric`` (a column or list of columns, with ``largest`` given
+    once or per column); nulls rank last and ties keep the order in which
+    rows arrived.
+    """
+
+    def __init__(self, n: int, metric: str | Sequence[str],
+                 *, largest: bool | Sequence[bool] = True,
+                 group_keys: Sequence[str] | None = None) -> None:
+        self.n = int(n)
+        self.metrics, self.largest = _metric_spec(metric, largest)
+        self.group_keys = list(group_keys or [])
+        # per group, in order of first appearance: (rank, seq, row) entries,
+        # best first; ``seq`` numbers rows by arrival and breaks rank ties
+        self._held: Dict[Any, List[tuple]] = {}
+        self._seen = 0
+
+    def add(self, df: pd.DataFrame) -> None:
+        """Fold the rows of ``df`` into the running result."""
+        start = self._seen
+        self._seen += nrows(df)
+        ranks = _ranks([df[col] for col in self.metrics], self.largest)
+        if self.group_keys:
+            groups = zip(*(df[k] for k in self.group_keys))
+        else:
+            groups = repeat(())  # a single group
+        offered: Dict[Any, List[tuple]] = {}
+        for seq, rank, group in zip(count(start), ranks, groups):
+            self._held.setdefault(group, [])
+            # the row itself is only built for entries that are kept
+            offered.setdefault(group, []).append((rank, seq, None))
+        columns = df.columns
+        data = [df[c] for c in columns]
+
+        def row_at(pos: int) -> Dict[str, Any]:
+            return {c: values[pos] for c, values in zip(columns, data)}
+
+        for group, entries in offered.items():
+            kept = _best(self.n, [*self._held[group], *entries], key=itemgetter(0, 1))
+            # entries numbered from ``start`` arrived in this chunk
+            self._held[group] = [
+                (rank, seq, row_at(seq - start) if seq >= start else row)
+                for rank, seq, row in kept
+            ]
+
+    def result(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [dict(e[2]) for held in self._held.values() for e in held]
+        )
 
 
 class TopNOperator(Operator):
-    def __init__(self, source: str, n: int, metric: str,
-                 *, largest: bool = True, per_group: bool = False,
+    """Keep the ``n`` best rows by ``metric``, overall or per group.
+
+    ``metric`` may list several columns (``largest`` then applies to all of
+    them or is given per column).  Rows are picked with a heap of ``n`` per
+    group; nulls rank last and ties keep input order.  Rows come back best
+    first, with groups in order of first appearance.  For input arriving in
+    chunks use :class:`TopNAccumulator`.
+    """
+
+    def __init__(self, source: str, n: int, metric: str | List[str],
+                 *, largest: bool | List[bool] = True, per_group: bool = False,
                  group_keys: List[str] | None = None,
                  output: str | None = None) -> None:
         super().__init__(output or f"{source}_top{n}")
@@ -23,23 +147,14 @@ class TopNOperator(Operator):
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         df = env[self.source]
+        metrics, largest = _metric_spec(self.metric, self.largest)
+        keys, reverse = _sort_keys(df, metrics, largest)
         if self.per_group and self.group_keys:
-            groups: Dict[tuple, list] = {}
-            for row in df._rows:
-                key = tuple(row.get(k) for k in self.group_keys)
-                groups.setdefault(key, []).append(row)
-            rows: List[dict] = []
-            for g_rows in groups.values():
-                sorted_rows = sorted(
-                    g_rows,
-                    key=lambda r: r.get(self.metric),
-                    reverse=self.largest,
-                )
-                rows.extend(sorted_rows[: self.n])
+            buckets = group_index(backend, df, self.group_keys).groups()
         else:
-            rows = sorted(
-                df._rows,
-                key=lambda r: r.get(self.metric),
-                reverse=self.largest,
-            )[: self.n]
-        return pd.DataFrame([r.copy() for r in rows])
+            buckets = [range(len(keys))]
+        positions: List[int] = []
+        for members in buckets:
+            # stable: equal keys keep input order, like a sort then slice
+            positions.extend(_best(self.n, members, keys.__getitem__, reverse))
+        return take(df, positions)
@@ -4,6 +4,7 @@ from typing import Dict, Mapping, Any
 import pandas as pd
 from .base import Operator
 from ..core.backend import FrameBackend
+from ..core.expr import compile_expression
 
 
 class UpdateOperator(Operator):
@@ -14,16 +15,16 @@ class UpdateOperator(Operator):
         self.condition = condition
         self.set_map = dict(set_map)
         self.inputs = [source]
+        compile_expression(condition)
 
     def _execute_core(self, backend: FrameBackend,
                       env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        where = getattr(backend, "where", None)
+        if where is not None:
+            return where(env[self.source], self.condition, self.set_map)
         df = env[self.source].copy()
-        for row in df._rows:
-            try:
-                cond = bool(eval(self.condition, {}, row))
-            except Exception:
-                cond = False
-            if cond:
-                for col, val in self.set_map.items():
-                    row[col] = val
+        hit = compile_expression(self.condition).mask(df)
+        for row, h in zip(df._rows, hit):
+            if h:
+                row.update(self.set_map)
         return df
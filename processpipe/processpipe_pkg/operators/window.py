@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+import pandas as pd
+from .base import Operator
+from ..core.backend import FrameBackend
+from ..core.frame import nrows
+from ..core.index import group_index
+from ..core.ordering import sort_positions
+
+RANKING = ("row_number", "rank", "dense_rank", "percent_rank")
+OFFSET = ("lag", "lead")
+RUNNING = ("cumsum", "cummin", "cummax")
+FUNCS = RANKING + OFFSET + RUNNING
+
+
+def _spec(name: str, spec: str | Dict[str, Any]) -> Dict[str, Any]:
+    """One window expression as ``{"func", "column", "offset", "default"}``."""
+    spec = {"func": spec} if isinstance(spec, str) else dict(spec)
+    func = spec.get("func")
+    if func not in FUNCS:
+        raise ValueError(f"Unsupported window function '{func}' for '{name}'")
+    if func not in RANKING and not spec.get("column"):
+        raise ValueError(f"Window function '{func}' for '{name}' needs a column")
+    spec.setdefault("column", None)
+    spec.setdefault("offset", 1)
+    spec.setdefault("default", None)
+    if int(spec["offset"]) < 0:
+        raise ValueError("Window offset must not be negative")
+    return spec
+
+
+def _ranks(part: List[int], peers: List[bool], func: str) -> List[Any]:
+    """``rank``/``dense_rank``/``percent_rank`` of the ordered ``part``.
+
+    ``peers[i]`` is true when row ``i`` ties with row ``i - 1``.
+    """
+    out = []
+    rank = dense = 0
+    for i in range(len(part)):
+        if not peers[i]:
+            rank = i + 1
+            dense += 1
+        out.append(dense if func == "dense_rank" else rank)
+    if func == "percent_rank":
+        last = len(part) - 1
+        out = [(r - 1) / last if last else 0.0 for r in out]
+    return out
+
+
+def _running(values: List[Any], func: str) -> List[Any]:
+    """Running sum, min or max of the non-null ``values`` (``None`` until one)."""
+    out = []
+    acc = None
+    for v in values:
+        if v is not None:
+            if acc is None:
+                acc = v
+            elif func == "cumsum":
+                acc += v
+            elif func == "cummin":
+                if v < acc:
+                    acc = v
+            elif v > acc:
+                acc = v
+        out.append(acc)
+    return out
+
+
+class WindowOperator(Operator):
+    """Several SQL window functions over one sort and partitioning.
+
+    ``functions`` maps each output column to a function name or a spec
+    ``{"func": ..., "column": ..., "offset": 1, "default": None}``:
+    ``row_number``, ``rank``, ``dense_rank`` and ``percent_rank`` number the
+    rows of each ``partition_by`` group in ``order_by`` order (rows with
+    equal ``order_by`` values are peers and share a rank); ``lag``/``lead``
+    read ``column`` ``offset`` rows back/ahead, ``default`` past the
+    partition edge; ``cumsum``, ``cummin`` and ``cummax`` run over
+    ``column`` up to the current row, skipping nulls.  Rows keep their input
+    order.
+    """
+
+    def __init__(self, source: str, functions: Dict[str, str | Dict[str, Any]],
+                 *, partition_by: str | List[str] | None = None,
+                 order_by: str | List[str] | None = None,
+                 ascending: bool | List[bool] = True,
+                 na_position: str = "last",
+                 output: str | None = None) -> None:
+        super().__init__(output or f"{source}_window")
+        self.source = source
+        self.functions = {col: _spec(col, spec) for col, spec in functions.items()}
+        self.partition_by = ([partition_by] if isinstance(partition_by, str)
+                             else list(partition_by or []))
+        self.order_by = ([order_by] if isinstance(order_by, str)
+                         else list(order_by or []))
+        self.ascending = ascending
+        self.na_position = na_position
+        self.inputs = [source]
+        if not self.functions:
+            raise ValueError("WindowOperator needs at least one function")
+        if na_position not in ("first", "last"):
+            raise ValueError(f"Unsupported na_position: {na_position}")
+        if len(self._directions()) != len(self.order_by):
+            raise ValueError("ascending must be a bool or one per order_by column")
+
+    def _directions(self) -> List[bool]:
+        if isinstance(self.ascending, (list, tuple)):
+            return list(self.ascending)
+        return [self.ascending] * len(self.order_by)
+
+    def _partitions(self, backend: FrameBackend,
+                    df: pd.DataFrame) -> List[List[int]]:
+        """Row positions of each partition, in window order."""
+        order = [df[c] for c in self.order_by]
+        if order:
+            positions = sort_positions(order, self._directions(),
+                                       self.na_position == "first")
+        else:
+            positions = list(range(nrows(df)))
+        if not self.partition_by:
+            return [positions] if positions else []
+        index = group_index(backend, df, self.partition_by)
+        ids = index.ids
+        parts: List[List[int]] = [[] for _ in range(len(index))]
+        for pos in positions:
+            parts[ids[pos]].append(pos)
+        return parts
+
+    def _execute_core(self, backend: FrameBackend,
+                      env: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        df = env[self.source]
+        n = nrows(df)
+        values = {spec["column"]: df[spec["column"]]
+                  for spec in self.functions.values() if spec["column"]}
+        order = [df[c] for c in self.order_by]
+        needs_peers = any(spec["func"] in RANKING[1:]
+                          for spec in self.functions.values())
+        results = {col: [None] * n for col in self.functions}
+        for part in self._partitions(backend, df):
+            if needs_peers:
+                # without order_by every row of a partition is a peer
+                keys = [tuple(col[p] for col in order) for p in part]
+                peers = [False] + [a == b for a, b in zip(keys, keys[1:])]
+            for col, spec in self.functions.items():
+                func = spec["func"]
+                if func == "row_number":
+                    computed = range(1, len(part) + 1)
+                elif func in RANKING:
+                    computed = _ranks(part, peers, func)
+                elif func in OFFSET:
+                    shift = int(spec["offset"])
+                    if func == "lag":
+                        shift = -shift
+                    vals = values[spec["column"]]
+                    size = len(part)
+                    computed = [vals[part[i + shift]] if 0 <= i + shift < size
+                                else spec["default"] for i in range(size)]
+                else:
+                    vals = values[spec["column"]]
+                    computed = _running([vals[p] for p in part], func)
+                target = results[col]
+                for pos, value in zip(part, computed):
+                    target[pos] = value
+        out = df.copy()
+        for col, computed in results.items():
+            out[col] = computed
+        return out
@@ -46,15 +46,15 @@ def load_plan(path: str | Path) -> ProcessPipe:
         elif op_type == "union":
             pipe.union(op["left"], op["right"], output=op.get("output"))
         elif op_type == "aggregate":
-            pipe.aggregate(op["source"], groupby=op["groupby"], agg_map=op["agg_map"], output=op.get("output"))
+            pipe.aggregate(op["source"], groupby=op["groupby"], agg_map=op["agg_map"], grouping_sets=op.get("grouping_sets"), rollup=op.get("rollup", False), cube=op.get("cube", False), output=op.get("output"))
         elif op_type == "group_size":
             pipe.group_size(op["source"], groupby=op["groupby"], output=op.get("output"))
         elif op_type == "filter":
             pipe.filter(op["source"], predicate=op["predicate"], output=op.get("output"))
         elif op_type == "rolling_agg":
-            pipe.rolling_agg(op["source"], on=op["on"], window=op["window"], agg=op["agg"], output=op.get("output"))
+            pipe.rolling_agg(op["source"], on=op["on"], window=op["window"], agg=op["agg"], partition_by=op.get("partition_by"), order_by=op.get("order_by"), output_col=op.get("output_col"), output=op.get("output"))
         elif op_type == "sort":
-            pipe.sort(op["source"], by=op["by"], ascending=op.get("ascending", True), output=op.get("output"))
+            pipe.sort(op["source"], by=op["by"], ascending=op.get("ascending", True), na_position=op.get("na_position", "last"), output=op.get("output"))
         elif op_type == "top_n":
             pipe.top_n(op["source"], n=op["n"], metric=op["metric"], largest=op.get("largest", True), per_group=op.get("per_group", False), group_keys=op.get("group_keys"), output=op.get("output"))
         elif op_type == "fill_na":
@@ -66,7 +66,7 @@ def load_plan(path: str | Path) -> ProcessPipe:
         elif op_type == "string_op":
             pipe.string_op(op["source"], column=op["column"], op=op["op"], pattern=op["pattern"], replacement=op.get("replacement"), new_column=op.get("new_column"), output=op.get("output"))
         elif op_type == "drop_duplicates":
-            pipe.drop_duplicates(op["source"], subset=op.get("subset"), keep=op.get("keep", "first"), output=op.get("output"))
+            pipe.drop_duplicates(op["source"], subset=op.get("subset"), keep=op.get("keep", "first"), chunk_size=op.get("chunk_size", 65536), max_keys=op.get("max_keys"), spill_dir=op.get("spill_dir"), output=op.get("output"))
         elif op_type == "partition_agg":
             pipe.partition_agg(op["source"], groupby=op["groupby"], agg_map=op["agg_map"], output=op.get("output"))
         elif op_type == "row_number":
@@ -77,6 +77,8 @@ def load_plan(path: str | Path) -> ProcessPipe:
             pipe.update(op["source"], condition=op["condition"], set_map=op["set"], output=op.get("output"))
         elif op_type == "case":
             pipe.case(op["source"], conditions=op["conditions"], choices=op["choices"], default=op.get("default"), output_col=op.get("output_col", "case"), output=op.get("output"))
+        elif op_type == "window":
+            pipe.window(op["source"], functions=op["functions"], partition_by=op.get("partition_by"), order_by=op.get("order_by"), ascending=op.get("ascending", True), na_position=op.get("na_position", "last"), output=op.get("output"))
         else:
             raise ValueError(f"Unsupported operation type: {op_type}")
 
@@ -0,0 +1,141 @@
+import pandas as pd
+import pytest
+
+from processpipe import AggregationOperator, ProcessPipe
+from processpipe.processpipe_pkg.core.aggregate import parse_agg_map
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+
+
+def _sales(frame=pd.DataFrame):
+    return frame(
+        {
+            "region": ["n", "s", "n", "n", "s"],
+            "shop": [1, 2, 1, 3, 2],
+            "amount": [10, 5, None, 7, 1],
+        }
+    )
+
+
+def _aggregate(df, groupby, agg_map, backend=None, **kwargs):
+    op = AggregationOperator("t", groupby, agg_map, **kwargs)
+    return op.execute(backend or InMemoryBackend(), {"t": df})
+
+
+def test_parse_agg_map_forms():
+    assert parse_agg_map(
+        {
+            "a": "sum",
+            "b": ["min", "max"],
+            "total": ("a", "sum"),
+            "top": {"column": "b", "func": "max"},
+        }
+    ) == [
+        ("a", "a", "sum"),
+        ("b_min", "b", "min"),
+        ("b_max", "b", "max"),
+        ("total", "a", "sum"),
+        ("top", "b", "max"),
+    ]
+    with pytest.raises(ValueError, match="Unsupported aggregation 'median'"):
+        parse_agg_map({"a": "median"})
+    with pytest.raises(ValueError, match="Duplicate"):
+        parse_agg_map({"a_sum": "max", "a": ["sum"]})
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, ColumnarFrame])
+def test_several_functions_per_column(frame):
+    out = _aggregate(
+        _sales(frame),
+        "region",
+        {"amount": ["sum", "count", "max", "mean"], "rows": ("shop", "count")},
+    )
+    assert type(out) is frame
+    assert out.to_dict() == {
+        "region": ["n", "s"],
+        "amount_sum": [17, 6],
+        "amount_count": [3, 2],
+        "amount_max": [10, 5],
+        "amount_mean": [8.5, 3.0],
+        "rows": [3, 2],
+    }
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, ColumnarFrame])
+def test_rollup_from_one_pass(frame):
+    backend = InMemoryBackend()
+    out = _aggregate(
+        _sales(frame),
+        ["region", "shop"],
+        {"amount": ["sum", "min"]},
+        backend,
+        rollup=True,
+    )
+    assert out.to_dict() == {
+        "region": ["n", "s", "n", "n", "s", None],
+        "shop": [1, 2, 3, None, None, None],
+        "amount_sum": [10, 6, 7, 17, 6, 23],
+        "amount_min": [10, 1, 7, 7, 1, 1],
+        "grouping_id": [0, 0, 0, 1, 1, 3],
+    }
+    assert backend.index_cache.stats()["misses"] == 1
+
+
+def test_empty_input_keeps_schema_and_grand_total():
+    empty = ColumnarFrame({"region": [], "shop": [], "amount": []})
+    agg_map = {"amount": ["sum", "count"]}
+    out = _aggregate(empty, ["region", "shop"], agg_map, rollup=True)
+    assert out.to_dict() == {
+        "region": [None],
+        "shop": [None],
+        "amount_sum": [None],
+        "amount_count": [0],
+        "grouping_id": [3],
+    }
+    plain = _aggregate(empty, ["region"], agg_map)
+    assert plain.columns == ["region", "amount_sum", "amount_count"]
+    assert len(plain) == 0
+
+
+def test_cube_and_grouping_sets():
+    cube = _aggregate(_sales(), ["region", "shop"], {"amount": "count"}, cube=True)
+    assert cube["grouping_id"] == [0, 0, 0, 1, 1, 2, 2, 2, 3]
+    assert cube["shop"][5:8] == [1, 2, 3]
+    assert cube["amount"][5:] == [2, 2, 1, 5]
+    sets = _aggregate(
+        _sales(),
+        ["region", "shop"],
+        {"amount": "sum"},
+        grouping_sets=[["shop"], "region"],
+    )
+    assert sets.to_dict() == {
+        "region": [None, None, None, "n", "s"],
+        "shop": [1, 2, 3, None, None],
+        "amount": [10, 6, 7, 17, 6],
+        "grouping_id": [2, 2, 2, 1, 1],
+    }
+
+
+def test_grouping_options_are_validated():
+    with pytest.raises(ValueError, match="not in groupby"):
+        AggregationOperator("t", "a", {"b": "sum"}, grouping_sets=[["c"]])
+    with pytest.raises(ValueError, match="only one"):
+        AggregationOperator("t", "a", {"b": "sum"}, rollup=True, cube=True)
+
+
+def test_plan_with_rollup():
+    plan = {
+        "dataframes": {"sales": _sales()},
+        "operations": [
+            {
+                "type": "aggregate",
+                "source": "sales",
+                "groupby": ["region"],
+                "agg_map": {"total": {"column": "amount", "func": "sum"}},
+                "rollup": True,
+            }
+        ],
+    }
+    out = ProcessPipe.build_pipe(plan).run()
+    assert out["total"] == [17, 6, 23]
+    assert out["grouping_id"] == [0, 0, 1]
@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from processpipe import ProcessPipe, SynapseNotebookOperator
+from processpipe.processpipe_pkg.operators import Operator
+
+
+class SleepOperator(Operator):
+    """I/O-bound operator: waits ``delay`` seconds and echoes its input."""
+
+    def __init__(self, source, delay, *, output):
+        super().__init__(output)
+        self.source = source
+        self.delay = delay
+        self.inputs = [source]
+        self.cancelled = False
+
+    def _execute_core(self, backend, env):
+        time.sleep(self.delay)
+        return env[self.source]
+
+    async def _aexecute_core(self, backend, env):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return env[self.source]
+
+
+def _frame():
+    return pd.DataFrame({"id": [1, 2], "amount": [10, 40]})
+
+
+def test_arun_matches_run():
+    def build():
+        return (
+            ProcessPipe()
+            .add_dataframe("orders", _frame())
+            ._append(SynapseNotebookOperator("orders", output="remote"))
+            .filter("remote", predicate="amount > 20", output="big")
+        )
+
+    assert_frame_equal(asyncio.run(build().arun()), build().run())
+
+
+def test_async_operators_interleave():
+    pipe = ProcessPipe().add_dataframe("orders", _frame())
+    for i in range(5):
+        pipe._append(SleepOperator("orders", 0.2, output=f"remote{i}"))
+    start = time.perf_counter()
+    asyncio.run(pipe.arun())
+    assert time.perf_counter() - start < 0.6
+    assert all(f"remote{i}" in pipe.env for i in range(5))
+
+
+def test_per_operator_timeout():
+    pipe = (
+        ProcessPipe()
+        .add_dataframe("orders", _frame())
+        ._append(SleepOperator("orders", 5, output="slow"))
+    )
+    with pytest.raises(TimeoutError):
+        asyncio.run(pipe.arun(timeout={"slow": 0.05}))
+
+
+def test_cancellation_propagates_to_operators():
+    slow = SleepOperator("orders", 5, output="slow")
+    pipe = ProcessPipe().add_dataframe("orders", _frame())._append(slow)
+
+    async def main():
+        task = asyncio.ensure_future(pipe.arun())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert slow.cancelled
@@ -0,0 +1,116 @@
+import pandas as pd
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+
+
+class RowBackend:
+    """Back-end without the column-wise methods: operators use row loops."""
+
+    def __init__(self):
+        self._inner = InMemoryBackend()
+
+    def merge(self, left, right, *, on, how="left"):
+        return self._inner.merge(left, right, on=on, how=how)
+
+    def concat(self, frames, *, ignore_index=True):
+        return self._inner.concat(frames, ignore_index=ignore_index)
+
+    def groupby_agg(self, df, groupby, agg_map):
+        return self._inner.groupby_agg(df, groupby, agg_map)
+
+    def query(self, df, expr):
+        return self._inner.query(df, expr)
+
+
+def _run(backend):
+    df = pd.DataFrame(
+        {
+            "id": ["1", "2", "x", None],
+            "name": ["ann", None, "bob", "cy"],
+            "score": [10, 55, None, 80],
+        }
+    )
+    return (
+        ProcessPipe(backend=backend)
+        .add_dataframe("raw", df)
+        .cast("raw", casts={"id": int, "missing": int}, output="typed")
+        .fill_na("typed", value=0, columns=["score"], output="filled")
+        .rename("filled", columns={"name": "who", "who": "person"}, output="named")
+        .string_op(
+            "named",
+            column="person",
+            op="replace",
+            pattern="[aeiou]",
+            replacement="_",
+            new_column="masked",
+            output="masked",
+        )
+        .string_op(
+            "masked", column="person", op="contains", pattern="^b", output="flag"
+        )
+        .update(
+            "flag", condition="score > 50", set_map={"tier": "gold"}, output="upd"
+        )
+        .case(
+            "upd",
+            conditions=["score > 70", "score > 5"],
+            choices=["a", "b"],
+            default="c",
+            output_col="grade",
+            output="graded",
+        )
+        .run()
+    )
+
+
+def test_column_methods_match_row_fallback(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fast = _run(InMemoryBackend())
+    slow = _run(RowBackend())
+    # the row loop leaves "tier" unset on unmatched rows, so only the
+    # column order can differ
+    assert fast.to_dict() == slow.to_dict()
+    assert fast["id"] == [1, 2, "x", None]
+    assert fast["score"] == [10, 55, 0, 80]
+    assert fast["masked"] == ["_nn", None, "b_b", "cy"]
+    assert fast["tier"] == [None, "gold", None, "gold"]
+    assert fast["grade"] == ["b", "b", "c", "a"]
+
+
+def _ragged(backend):
+    df = pd.DataFrame([{"k": 1, "s": "ab"}, {"k": 2}, {"k": 3, "s": None}])
+    return (
+        ProcessPipe(backend=backend)
+        .add_dataframe("raw", df)
+        .string_op(
+            "raw",
+            column="s",
+            op="replace",
+            pattern="a",
+            replacement="_",
+            output="replaced",
+        )
+        .string_op(
+            "replaced",
+            column="s",
+            op="contains",
+            pattern="None",
+            new_column="hit",
+            output="flagged",
+        )
+        .update("flagged", condition="k > 1", set_map={"tier": "gold"}, output="upd")
+        .run()
+    )
+
+
+def test_ragged_rows_keep_nulls_and_unmatched_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fast = _ragged(InMemoryBackend())
+    slow = _ragged(RowBackend())
+    assert fast.to_dict() == slow.to_dict()
+    assert fast["s"] == ["_b", None, None]
+    assert fast["hit"] == [False, None, None]
+    for out in (fast, slow):
+        assert "tier" not in out._rows[0]
+        assert [r.get("tier") for r in out._rows] == [None, "gold", "gold"]
@@ -0,0 +1,73 @@
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.cache import ResultCache
+
+
+def _pipe(cache, amounts):
+    orders = pd.DataFrame({"cust_id": [1, 1, 2], "amount": amounts})
+    customers = pd.DataFrame({"cust_id": [1, 2], "region": ["east", "west"]})
+    return (
+        ProcessPipe(cache=cache)
+        .add_dataframe("orders", orders)
+        .add_dataframe("customers", customers)
+        .cast("customers", casts={"cust_id": int}, output="cust")
+        .join("orders", "cust", on="cust_id", output="joined")
+        .aggregate(
+            "joined", groupby="region", agg_map={"amount": "sum"}, output="totals"
+        )
+    )
+
+
+def test_second_run_is_served_from_cache(tmp_path):
+    cache = ResultCache(tmp_path)
+    first = _pipe(cache, [10, 40, 200]).run()
+    assert cache.stats()["misses"] == 3
+
+    second = _pipe(cache, [10, 40, 200]).run()
+    assert_frame_equal(second, first)
+    assert cache.stats()["hits"] == 3
+
+
+def test_changed_input_only_misses_downstream(tmp_path):
+    cache = ResultCache(tmp_path)
+    _pipe(cache, [10, 40, 200]).run()
+    result = _pipe(cache, [10, 40, 300]).run()
+    # the customer cast is reused, the join and aggregate recompute
+    assert cache.hits == 1
+    assert result["amount"] == [50, 300]
+
+
+def test_size_limit_evicts_entries(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=1)
+    _pipe(cache, [10, 40, 200]).run()
+    assert cache.stats()["entries"] == 0
+    assert cache.evictions == 3
+
+
+def _double(v):
+    return v * 2
+
+
+def _triple(v):
+    return v * 3
+
+
+def test_editing_a_function_body_misses(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+
+    def run():
+        return (
+            ProcessPipe(cache=cache)
+            .add_dataframe("t", pd.DataFrame({"v": [1, 2]}))
+            .cast("t", casts={"v": _double}, output="out")
+            .run()
+        )
+
+    assert run()["v"] == [2, 4]
+    assert run()["v"] == [2, 4] and cache.hits == 1
+    # same module and qualname, new body
+    monkeypatch.setattr(_double, "__code__", _triple.__code__)
+    assert run()["v"] == [3, 6]
+    assert cache.hits == 1
@@ -43,6 +43,26 @@ def test_cli_dag(tmp_path):
     assert "JoinOperator" in result.output
 
 
+def test_cli_run_with_cache(tmp_path):
+    plan_path = _create_plan(tmp_path)
+    cache_dir = tmp_path / "cache"
+    runner = CliRunner()
+    runner.invoke(main, ["run", str(plan_path), "--cache-dir", str(cache_dir)])
+    result = runner.invoke(
+        main, ["run", str(plan_path), "--cache-dir", str(cache_dir)]
+    )
+    assert result.exit_code == 0
+    assert "'hits': 1" in result.output
+
+
+def test_cli_run_target(tmp_path):
+    plan_path = _create_plan(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(main, ["run", str(plan_path), "--target", "df1"])
+    assert result.exit_code == 0
+    assert "v2" not in result.output
+
+
 def test_python_module_entrypoint(tmp_path):
     plan_path = _create_plan(tmp_path)
     res = subprocess.run(
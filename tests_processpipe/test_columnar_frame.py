@@ -0,0 +1,100 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.codec import decode_frame, encode_frame
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+
+
+def test_typed_storage_and_round_trip():
+    rows = pd.DataFrame(
+        {"id": [1, 2, 3], "v": [1.5, None, 2.0], "s": ["a", "b", None]}
+    )
+    frame = ColumnarFrame(rows)
+    assert isinstance(frame._data["id"], array)
+    assert isinstance(frame._data["v"], array)
+    assert frame.shape == (3, 3) and len(frame) == 3
+    assert frame["v"] == [1.5, None, 2.0]
+    assert frame.to_frame().to_dict() == rows.to_dict()
+    assert decode_frame(encode_frame(frame)).to_dict() == rows.to_dict()
+    assert isinstance(decode_frame(encode_frame(frame)), ColumnarFrame)
+
+
+def test_row_edits_are_honoured():
+    frame = ColumnarFrame({"a": [1, 2]}).copy()
+    for row in frame._rows:
+        row["b"] = row["a"] * 10
+    assert frame.columns == ["a", "b"]
+    assert frame["b"] == [10, 20]
+    again = frame.copy()
+    assert again._row_list is None and again["b"] == [10, 20]
+
+
+def test_concurrent_row_and_column_readers_agree():
+    for _ in range(20):
+        frame = ColumnarFrame({"a": list(range(2000)), "b": ["x"] * 2000})
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            rows = [pool.submit(lambda: frame._rows) for _ in range(2)]
+            cols = [pool.submit(frame.__getitem__, "a") for _ in range(6)]
+            built = [f.result() for f in rows]
+            assert all(f.result() == list(range(2000)) for f in cols)
+        assert built[0] is built[1]
+        assert [r["a"] for r in built[0]] == frame["a"] == list(range(2000))
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_matches_row_frames(how):
+    left = pd.DataFrame({"k": [1, 2, 2, 4], "x": ["a", "b", "c", "d"]})
+    right = pd.DataFrame({"k": [2, 3, 4], "x": [20, 30, 40], "y": [0.2, 0.3, 0.4]})
+    expected = left.merge(right, on="k", how=how)
+    got = ColumnarFrame(left).merge(ColumnarFrame(right), on="k", how=how)
+    assert got.to_dict() == expected.to_dict()
+
+
+def _pipeline(columnar):
+    orders = pd.DataFrame(
+        {
+            "order_id": list(range(12)),
+            "cust_id": [i % 4 for i in range(12)],
+            "amount": [float(i * 7 % 50) if i % 5 else None for i in range(12)],
+        }
+    )
+    customers = pd.DataFrame({"cust_id": [0, 1, 2], "region": ["e", "w", "e"]})
+    return (
+        ProcessPipe(columnar=columnar)
+        .add_dataframe("orders", orders)
+        .add_dataframe("customers", customers)
+        .fill_na("orders", value=0.0, columns=["amount"], output="filled")
+        .join("filled", "customers", on="cust_id", how="left", output="joined")
+        .case(
+            "joined",
+            conditions=["amount > 30", "amount > 10"],
+            choices=["big", "mid"],
+            default="small",
+            output_col="band",
+            output="banded",
+        )
+        .delete("banded", condition="region == 'w'", output="kept")
+        .group_size("kept", groupby="band", output="sized")
+        .partition_agg(
+            "sized", groupby=["region"], agg_map={"amount": "sum"}, output="part"
+        )
+        .sort("part", by="amount", ascending=False, output="sorted")
+        .row_number("sorted", partition_by=["band"], output="numbered")
+        .aggregate(
+            "numbered",
+            groupby="band",
+            agg_map={"amount": "max", "group_size": "max"},
+            output="final",
+        )
+    )
+
+
+def test_pipeline_results_match_row_frames():
+    rows = _pipeline(False).run()
+    columns = _pipeline(True).run()
+    assert isinstance(_pipeline(True).env["orders"], ColumnarFrame)
+    assert columns.to_dict() == rows.to_dict()
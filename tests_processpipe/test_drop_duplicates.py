@@ -0,0 +1,102 @@
+import os
+import random
+
+import pandas as pd
+import pytest
+
+from processpipe import DropDuplicateOperator, ProcessPipe
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+from processpipe.processpipe_pkg.operators import dropduplicate
+
+
+def _frame(frame=pd.DataFrame, size=400):
+    rng = random.Random(5)
+    return frame(
+        {
+            "user": [rng.choice([None, 1, 2, 3, 4]) for _ in range(size)],
+            "page": [rng.choice(["a", "b", None]) for _ in range(size)],
+            "i": list(range(size)),
+        }
+    )
+
+
+def _dedup(df, subset=None, **kwargs):
+    op = DropDuplicateOperator("t", subset, **kwargs)
+    return op.execute(InMemoryBackend(), {"t": df})
+
+
+def _reference(df, subset, keep):
+    seen = {}
+    for row in df._rows:
+        key = tuple(row.get(c) for c in subset)
+        if key not in seen or keep == "last":
+            seen[key] = row["i"]
+    return list(seen.values())
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, ColumnarFrame])
+@pytest.mark.parametrize("keep", ["first", "last"])
+@pytest.mark.parametrize("chunk_size", [7, 65536])
+def test_matches_dict_dedup(frame, keep, chunk_size):
+    df = _frame(frame)
+    out = _dedup(df, ["user", "page"], keep=keep, chunk_size=chunk_size)
+    assert type(out) is frame
+    assert out["i"] == _reference(df, ["user", "page"], keep)
+
+
+def test_keep_last_keeps_first_occurrence_order():
+    df = pd.DataFrame({"k": [1, 2, 1, 3, 2], "v": [10, 20, 30, 40, 50]})
+    out = _dedup(df, "k", keep="last")
+    assert out["k"] == [1, 2, 3]
+    assert out["v"] == [30, 50, 40]
+
+
+def test_default_subset_is_all_columns():
+    df = pd.DataFrame([{"a": 1, "b": 2}, {"a": 1}, {"a": 1, "b": 2}, {"a": 1}])
+    assert _dedup(df)._rows == [{"a": 1, "b": 2}, {"a": 1}]
+
+
+def test_hash_collisions_are_verified(monkeypatch):
+    monkeypatch.setattr(dropduplicate, "_hash", lambda key: 0)
+    df = _frame(size=100)
+    for keep in ("first", "last"):
+        out = _dedup(df, ["user", "page"], keep=keep, chunk_size=9)
+        assert out["i"] == _reference(df, ["user", "page"], keep)
+
+
+@pytest.mark.parametrize("keep", ["first", "last"])
+def test_spills_key_hashes_past_max_keys(tmp_path, keep):
+    rng = random.Random(8)
+    keys = [rng.randrange(300) for _ in range(2000)]
+    df = ColumnarFrame({"k": keys, "i": list(range(2000))})
+    out = _dedup(df, "k", keep=keep, chunk_size=100, max_keys=50,
+                 spill_dir=str(tmp_path))
+    assert out["i"] == _reference(df, ["k"], keep)
+    assert os.listdir(tmp_path) == []
+
+
+def test_spilled_collisions(tmp_path, monkeypatch):
+    monkeypatch.setattr(dropduplicate, "_hash", lambda key: key[0] % 3)
+    df = pd.DataFrame({"k": [i % 20 for i in range(200)], "i": list(range(200))})
+    out = _dedup(df, "k", keep="last", chunk_size=16, max_keys=2,
+                 spill_dir=str(tmp_path))
+    assert out["i"] == _reference(df, ["k"], "last")
+
+
+def test_build_pipe_passes_spill_options(tmp_path):
+    df = pd.DataFrame({"user": [1, 2, 1, 3, 3], "i": [0, 1, 2, 3, 4]})
+    plan = {
+        "dataframes": {"clicks": df},
+        "operations": [
+            {
+                "type": "drop_duplicates",
+                "source": "clicks",
+                "subset": ["user"],
+                "max_keys": 1,
+                "chunk_size": 2,
+                "spill_dir": str(tmp_path),
+            }
+        ],
+    }
+    assert ProcessPipe.build_pipe(plan).run()["i"] == [0, 1, 3]
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from processpipe import ProcessPipe
+
+
+def _pipe():
+    orders = pd.DataFrame({"cust_id": [1, 1, 2], "amount": [10, 40, 200]})
+    return (
+        ProcessPipe()
+        .add_dataframe("orders", orders)
+        .filter("orders", predicate="amount > 20", output="big")
+        .fill_na("big", value=0, output="filled")
+        .sort("filled", by="amount", output="sorted")
+    )
+
+
+def test_intermediates_kept_by_default():
+    pipe = _pipe()
+    pipe.run()
+    assert {"orders", "big", "filled", "sorted"} <= set(pipe.env)
+
+
+def test_keep_list_evicts_dead_intermediates():
+    pipe = _pipe()
+    result = pipe.run(keep=["big"])
+    assert set(pipe.env) == {"orders", "big", "sorted"}
+    assert result["amount"] == [40, 200]
@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.expr import compile_expression
+
+
+def test_expression_is_compiled_once():
+    assert compile_expression("a > 1") is compile_expression("a > 1")
+    assert compile_expression("abs(a) > b").names == ("abs", "a", "b")
+
+
+def test_mask_treats_row_errors_as_false():
+    df = pd.DataFrame({"a": [1, None, 5, "x"]})
+    assert compile_expression("a > 2").mask(df) == [False, False, True, False]
+    # a column that does not exist makes every row unknown
+    assert compile_expression("missing > 2").mask(df) == [False] * 4
+
+
+def test_builtins_are_shadowed_by_columns():
+    df = pd.DataFrame({"len": [1, 3]})
+    assert compile_expression("len > 2").mask(df) == [False, True]
+    df = pd.DataFrame({"s": ["ab", "abcd"]})
+    assert compile_expression("len(s) > 2 and s.startswith('a')").mask(df) == [
+        False,
+        True,
+    ]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "__import__('os')",
+        "open('x')",
+        "a.__class__",
+        "[x for x in a]",
+        "(lambda: 1)()",
+        "a >",
+    ],
+)
+def test_unsafe_or_invalid_expressions_are_rejected(expr):
+    with pytest.raises(ValueError):
+        compile_expression(expr)
+
+
+def test_operators_share_the_engine():
+    df = pd.DataFrame({"v": [1, 5, 9, None]})
+    pipe = (
+        ProcessPipe()
+        .add_dataframe("src", df)
+        .case(
+            "src",
+            conditions=["v > 6", "v > 2"],
+            choices=["high", "mid"],
+            default="low",
+            output_col="band",
+            output="banded",
+        )
+        .update("banded", condition="band == 'mid'", set_map={"v": 0}, output="upd")
+        .delete("upd", condition="v == 0", output="out")
+    )
+    out = pipe.run()
+    assert out["band"] == ["low", "high", "low"]
+    assert out["v"] == [1, 9, None]
+    with pytest.raises(ValueError):
+        pipe.delete("src", condition="import os")
+
+
+def test_rows_lacking_a_column_never_match():
+    df = pd.DataFrame([{"k": 1, "a": None}, {"k": 2}, {"k": 3, "a": 4}])
+    assert compile_expression("a is None").mask(df) == [True, False, False]
+    pipe = (
+        ProcessPipe()
+        .add_dataframe("src", df)
+        .filter("src", predicate="a is None", output="kept")
+        .delete("src", condition="a is None", output="deleted")
+        .update("src", condition="a is None", set_map={"b": 1}, output="upd")
+    )
+    pipe.run()
+    assert pipe.env["kept"]["k"] == [1]
+    assert pipe.env["deleted"]["k"] == [2, 3]
+    assert [row.get("b", "unset") for row in pipe.env["upd"]._rows] == [
+        1,
+        "unset",
+        "unset",
+    ]
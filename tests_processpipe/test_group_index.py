@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+from processpipe.processpipe_pkg.core.index import GroupIndex, group_index
+
+
+def _events(frame=pd.DataFrame):
+    return frame(
+        {
+            "cust": ["a", "b", "a", None, "b", "a"],
+            "day": [3, 1, 1, 2, 2, 2],
+            "amount": [30, 1, 10, 5, 2, 20],
+        }
+    )
+
+
+def test_group_index_layout():
+    index = GroupIndex(_events(), ["cust"])
+    assert index.keys == [("a",), ("b",), (None,)]
+    assert list(index.ids) == [0, 1, 0, 2, 1, 0]
+    assert [list(m) for m in index.groups()] == [[0, 2, 5], [1, 4], [3]]
+    assert list(index.members(1)) == [1, 4]
+    assert index.sizes() == [3, 2, 1]
+    assert index.broadcast(["x", "y", "z"]) == ["x", "y", "x", "z", "y", "x"]
+    empty = GroupIndex(pd.DataFrame([]), ["cust"])
+    assert len(empty) == 0 and empty.sizes() == []
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, ColumnarFrame])
+def test_grouping_operators_share_one_index(frame):
+    backend = InMemoryBackend()
+    pipe = (
+        ProcessPipe(backend=backend)
+        .add_dataframe("events", _events(frame))
+        .group_size("events", groupby="cust", output="sizes")
+        .partition_agg(
+            "events", groupby=["cust"], agg_map={"amount": "sum"}, output="totals"
+        )
+        .row_number(
+            "events", partition_by=["cust"], order_by=["day"], output="numbered"
+        )
+        .top_n(
+            "events",
+            n=1,
+            metric="amount",
+            per_group=True,
+            group_keys=["cust"],
+            output="best",
+        )
+        .aggregate("events", groupby="cust", agg_map={"amount": "max"}, output="agg")
+    )
+    pipe.run()
+    env = pipe.env
+    assert env["sizes"]["group_size"] == [3, 2, 3, 1, 2, 3]
+    assert env["totals"]["amount_sum"] == [60, 3, 60, 5, 3, 60]
+    assert env["numbered"].to_dict() == {
+        "cust": ["b", "a", None, "b", "a", "a"],
+        "day": [1, 1, 2, 2, 2, 3],
+        "amount": [1, 10, 5, 2, 20, 30],
+        "row_number": [1, 1, 1, 2, 2, 3],
+    }
+    assert env["best"]["amount"] == [30, 2, 5]
+    assert env["agg"].to_dict() == {"cust": ["a", "b", None], "amount": [30, 2, 5]}
+    # the first operator hashed the keys, the other four reused its index
+    assert backend.index_cache.stats()["misses"] == 1
+    assert backend.index_cache.stats()["hits"] == 4
+    assert (env["events"], ("group", ("cust",))) in backend.index_cache
+
+
+def test_without_a_cache_the_index_is_built_each_time():
+    df = _events()
+    assert group_index(object(), df, ["cust"]) is not group_index(
+        object(), df, ["cust"]
+    )
+    backend = InMemoryBackend()
+    assert group_index(backend, df, ["cust"]) is group_index(backend, df, ["cust"])
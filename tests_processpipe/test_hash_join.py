@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+from processpipe import JoinOperator, ProcessPipe
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+
+
+def _join(how, frame=pd.DataFrame, **kwargs):
+    left = frame({"k": [1, 2, 2, 4], "v": ["a", "b", "c", None]})
+    right = frame({"key": [2, 3, 4], "v": [20, 30, None], "w": [0.2, 0.3, None]})
+    op = JoinOperator("l", "r", [("k", "key")], how=how, **kwargs)
+    out = op.execute(InMemoryBackend(), {"l": left, "r": right})
+    return op, out
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, ColumnarFrame])
+def test_join_types(frame):
+    _, inner = _join("inner", frame)
+    # the null payload of key 4 survives an inner join
+    assert inner.to_dict() == {
+        "k": [2, 2, 4],
+        "v_left": ["b", "c", None],
+        "key": [2, 2, 4],
+        "v_right": [20, 20, None],
+        "w": [0.2, 0.2, None],
+    }
+    _, outer = _join("outer", frame)
+    assert outer["k"] == [1, 2, 2, 4, None]
+    assert outer["key"] == [None, 2, 2, 4, 3]
+    _, right = _join("right", frame)
+    assert right["key"] == [2, 2, 4, 3]
+    _, semi = _join("semi", frame)
+    assert semi.to_dict() == {"k": [2, 2, 4], "v": ["b", "c", None]}
+    _, anti = _join("anti", frame)
+    assert anti.to_dict() == {"k": [1], "v": ["a"]}
+
+
+def test_stats_and_suffixes():
+    op, out = _join("left", suffixes=("_l", "_r"))
+    assert out.columns == ["k", "v_l", "key", "v_r", "w"]
+    stats = op.join_stats
+    assert (stats.build_side, stats.build_rows, stats.probe_rows) == ("right", 3, 4)
+    assert (stats.candidate_pairs, stats.output_rows) == (3, 4)
+
+
+class MergeOnlyBackend:
+    """Back-end without ``hash_join``."""
+
+    def merge(self, left, right, *, on, how="left"):
+        return left.merge(right, on=on, how=how)
+
+
+def test_backends_without_hash_join_honour_how_and_suffixes():
+    left = pd.DataFrame({"k": [1, 2, 4], "v": ["a", "b", "c"]})
+    right = pd.DataFrame({"k": [2, 3, 4], "v": [20, 30, None]})
+    op = JoinOperator("l", "r", "k", how="outer", suffixes=("_l", "_r"))
+    out = op.execute(MergeOnlyBackend(), {"l": left, "r": right})
+    assert out.to_dict() == {
+        "k": [1, 2, 4, 3],
+        "v_l": ["a", "b", "c", None],
+        "v_r": [None, 20, None, 30],
+    }
+    op = JoinOperator("l", "r", "k")
+    # the null right value of key 4 does not drop the match
+    assert op.execute(MergeOnlyBackend(), {"l": left, "r": right})["k"] == [2, 4]
+
+
+def test_predicates_are_part_of_the_join_condition():
+    left = pd.DataFrame({"id": [1, 2], "lo": [5, 5]})
+    right = pd.DataFrame({"id": [1, 1, 2], "x": [3, 7, 9]})
+    pipe = (
+        ProcessPipe()
+        .add_dataframe("l", left)
+        .add_dataframe("r", right)
+        .join(
+            "l",
+            "r",
+            on=[("id", "id"), ("lo", "x")],
+            conditions=["eq", "lt"],
+            how="left",
+        )
+    )
+    out = pipe.run()
+    assert out.to_dict() == {"id": [1, 2], "lo": [5, 5], "x": [7, 9]}
+
+
+def test_unknown_join_type_is_rejected():
+    with pytest.raises(ValueError):
+        JoinOperator("l", "r", "k", how="sideways")
@@ -0,0 +1,66 @@
+import gc
+
+import pandas as pd
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+
+
+def _star(backend):
+    items = pd.DataFrame({"sku_id": [1, 2], "price": [9.5, 3.0]})
+    orders = pd.DataFrame({"sku_id": [1, 2, 2, 1, 1], "qty": [1, 2, 3, 4, 5]})
+    late = pd.DataFrame({"sku_id": [2, 1, 2, 2], "qty": [7, 8, 9, 10]})
+    return (
+        ProcessPipe(backend=backend)
+        .add_dataframe("items", items)
+        .add_dataframe("orders", orders)
+        .add_dataframe("late", late)
+        .join("orders", "items", on="sku_id", how="left", output="orders_j")
+        .join("late", "items", on="sku_id", how="left", output="late_j")
+        .union("orders_j", "late_j", output="all")
+    )
+
+
+def test_second_join_reuses_dimension_index():
+    backend = InMemoryBackend()
+    pipe = _star(backend)
+    out = pipe.run()
+    assert out["price"] == [9.5, 3.0, 3.0, 9.5, 9.5, 3.0, 9.5, 3.0, 3.0]
+    assert backend.index_cache.stats()["hits"] == 1
+    assert pipe.ops[1].join_stats.index_reused
+    assert pipe.ops[1].join_stats.build_side == "right"
+
+
+def test_replaced_frame_gets_a_fresh_index():
+    backend = InMemoryBackend()
+    pipe = _star(backend)
+    pipe.run()
+    pipe.rerun({"items": pd.DataFrame({"sku_id": [1, 2], "price": [1.0, 2.0]})})
+    gc.collect()
+    assert pipe.env["all"]["price"] == [1.0, 2.0, 2.0, 1.0, 1.0, 2.0, 1.0, 2.0, 2.0]
+    # only the index of the live items frame is left
+    assert backend.index_cache.stats()["entries"] == 1
+
+
+def test_rerun_drops_indexes_of_a_frame_changed_in_place():
+    backend = InMemoryBackend()
+    pipe = _star(backend)
+    pipe.run()
+    items = pipe.env["items"]
+    items["sku_id"] = [2, 1]
+    out = pipe.rerun({"items": items})
+    assert out["price"] == [3.0, 9.5, 9.5, 3.0, 3.0, 9.5, 3.0, 9.5, 9.5]
+    fresh = _star(InMemoryBackend())
+    fresh.env["items"]["sku_id"] = [2, 1]
+    assert fresh.run().to_dict() == out.to_dict()
+
+
+def test_memory_cap_is_respected():
+    backend = InMemoryBackend(index_cache_bytes=16)
+    _star(backend).run()
+    assert backend.index_cache.stats() == {
+        "hits": 0,
+        "misses": 2,
+        "entries": 0,
+        "bytes": 0,
+    }
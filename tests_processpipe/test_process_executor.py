@@ -0,0 +1,41 @@
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.codec import decode_frame, encode_frame
+
+
+def test_codec_round_trip():
+    df = pd.DataFrame(
+        {
+            "i": [1, None, 3],
+            "f": [0.5, 1.5, None],
+            "b": [True, False, None],
+            "s": ["a", None, "ü"],
+            "o": [(1, 2), None, "x"],
+        }
+    )
+    assert_frame_equal(decode_frame(encode_frame(df)), df)
+
+
+def _pipe(**kwargs):
+    orders = pd.DataFrame({"cust_id": [1, 1, 2], "amount": [10, 40, 200]})
+    customers = pd.DataFrame({"cust_id": [1, 2], "region": ["east", "west"]})
+    return (
+        ProcessPipe(**kwargs)
+        .add_dataframe("orders", orders)
+        .add_dataframe("customers", customers)
+        .filter("orders", predicate="amount > 20", output="big")
+        .cast("customers", casts={"cust_id": int}, output="cust")
+        .join("big", "cust", on="cust_id", output="joined")
+        .aggregate(
+            "joined", groupby="region", agg_map={"amount": "sum"}, output="totals"
+        )
+    )
+
+
+def test_process_executor_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    expected = _pipe().run()
+    result = _pipe(max_workers=2, executor="process").run()
+    assert_frame_equal(result, expected)
@@ -0,0 +1,63 @@
+import json
+
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe, RunHook
+
+
+def _pipe(**kwargs):
+    orders = pd.DataFrame({"cust_id": [1, 1, 2, 3], "amount": [10, 40, 200, 5]})
+    return (
+        ProcessPipe(**kwargs)
+        .add_dataframe("orders", orders)
+        .filter("orders", predicate="amount > 9", output="big")
+        .aggregate("big", groupby="cust_id", agg_map={"amount": "sum"}, output="tot")
+    )
+
+
+def test_report_has_one_row_per_operator(tmp_path):
+    pipe = _pipe(profile_memory=True)
+    assert pipe.last_run_report() is None
+    pipe.run()
+    report = pipe.last_run_report()
+    rows = {s.output: s for s in report.stats}
+    assert list(rows) == ["big", "tot"]
+    assert (rows["big"].rows_in, rows["big"].rows_out) == (4, 3)
+    assert (rows["tot"].rows_in, rows["tot"].rows_out) == (3, 2)
+    assert all(s.wall_time >= 0 and s.peak_bytes is not None for s in report.stats)
+    assert "rows/s" in str(report)
+
+    path = tmp_path / "report.json"
+    report.to_json(str(path))
+    data = json.loads(path.read_text())
+    assert [r["operator"] for r in data["operators"]] == [
+        "FilterOperator",
+        "AggregationOperator",
+    ]
+
+
+def test_memory_is_not_measured_by_default():
+    pipe = _pipe()
+    pipe.run()
+    assert all(s.peak_bytes is None for s in pipe.last_run_report().stats)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_hooks_see_every_operator(executor, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    events = []
+
+    class Recorder(RunHook):
+        def on_run_start(self, pipe, ops):
+            events.append("start")
+
+        def on_operator_end(self, stats):
+            events.append((stats.output, stats.rows_out))
+
+        def on_run_end(self, pipe):
+            events.append("end")
+
+    pipe = _pipe(max_workers=2, executor=executor).add_hook(Recorder())
+    pipe.run()
+    assert events == ["start", ("big", 3), ("tot", 2), "end"]
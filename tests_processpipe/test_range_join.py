@@ -0,0 +1,100 @@
+import random
+
+import pandas as pd
+import pytest
+
+from processpipe import JoinOperator
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+
+
+def _join(left, right, on, conditions, how="inner"):
+    op = JoinOperator("l", "r", on, conditions=conditions, how=how)
+    return op, op.execute(InMemoryBackend(), {"l": left, "r": right})
+
+
+def _brute(left, right, test):
+    return [
+        (lrow, rrow) for lrow in left._rows for rrow in right._rows if test(lrow, rrow)
+    ]
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, ColumnarFrame])
+def test_band_join_matches_nested_loop(frame):
+    events = frame({"ts": [1, 5, 9, 12, None], "e": list("abcde")})
+    bands = frame({"lo": [0, 4, 8, 8], "hi": [5, 10, 20, None], "b": list("wxyz")})
+    op, out = _join(
+        events, bands, [("ts", "lo"), ("ts", "hi")], ["gte", "lt"], how="left"
+    )
+    expected = _brute(
+        pd.DataFrame({"ts": [1, 5, 9, 12], "e": list("abcd")}),
+        pd.DataFrame({"lo": [0, 4, 8], "hi": [5, 10, 20], "b": list("wxy")}),
+        lambda l, r: r["lo"] <= l["ts"] < r["hi"],
+    )
+    assert list(zip(out["e"], out["b"])) == [
+        (l["e"], r["b"]) for l, r in expected
+    ] + [("e", None)]
+    # the range bound cut the candidates below the full cross product
+    assert op.join_stats.candidate_pairs < 4 * 4
+
+
+def test_window_join_looks_only_at_pairs_inside_the_window():
+    rng = random.Random(3)
+    n = 3000
+    events = pd.DataFrame(
+        {"sym": [i % 3 for i in range(n)], "t": [rng.randrange(n) for _ in range(n)]}
+    )
+    starts = [rng.randrange(n) for _ in range(n)]
+    prices = pd.DataFrame(
+        {
+            "sym": [i % 3 for i in range(n)],
+            "lo": starts,
+            "hi": [s + rng.randrange(1, 4) for s in starts],
+            "px": list(range(n)),
+        }
+    )
+    op, out = _join(
+        events,
+        prices,
+        [("sym", "sym"), ("t", "lo"), ("t", "hi")],
+        ["eq", "gte", "lt"],
+    )
+    by_sym = {}
+    for r in prices._rows:
+        by_sym.setdefault(r["sym"], []).append(r)
+    expected = [
+        (e["t"], r["px"])
+        for e in events._rows
+        for r in by_sym[e["sym"]]
+        if r["lo"] <= e["t"] < r["hi"]
+    ]
+    assert list(zip(out["t"], out["px"])) == expected
+    assert op.join_stats.candidate_pairs == len(expected) < 2 * n
+
+
+def test_equality_prefix_with_range():
+    trades = pd.DataFrame({"sym": ["A", "B", "A"], "t": [3, 3, 7]})
+    quotes = pd.DataFrame({"sym": ["A", "A", "B", "A"], "qt": [1, 4, 2, 6]})
+    _, out = _join(trades, quotes, [("sym", "sym"), ("t", "qt")], ["eq", "gt"])
+    assert list(zip(out["t"], out["qt"])) == [(3, 1), (3, 2), (7, 1), (7, 4), (7, 6)]
+
+
+def test_asof_picks_nearest_preceding():
+    trades = pd.DataFrame({"sym": ["A", "B", "A", "A"], "t": [3, 3, 7, 0]})
+    quotes = pd.DataFrame(
+        {
+            "sym": ["A", "A", "B", "A", "A"],
+            "qt": [1, 4, 2, 6, 6],
+            "px": [10, 11, 20, 12, 13],
+        }
+    )
+    _, out = _join(
+        trades, quotes, [("sym", "sym"), ("t", "qt")], ["eq", "gte"], how="asof"
+    )
+    # ties on the nearest key resolve to the last quote, like pandas.merge_asof
+    assert out["px"] == [10, 20, 13, None]
+
+
+def test_asof_requires_a_range_condition():
+    with pytest.raises(ValueError):
+        _join(pd.DataFrame({"k": [1]}), pd.DataFrame({"k": [1]}), "k", None, "asof")
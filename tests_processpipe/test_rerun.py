@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe
+
+
+def _pipe():
+    orders = pd.DataFrame({"cust_id": [1, 1, 2], "amount": [10, 40, 200]})
+    customers = pd.DataFrame({"cust_id": [1, 2], "region": ["east", "west"]})
+    return (
+        ProcessPipe()
+        .add_dataframe("orders", orders)
+        .add_dataframe("customers", customers)
+        .cast("customers", casts={"cust_id": int}, output="cust")
+        .filter("orders", predicate="amount > 20", output="big")
+        .join("big", "cust", on="cust_id", output="joined")
+        .aggregate(
+            "joined", groupby="region", agg_map={"amount": "sum"}, output="totals"
+        )
+    )
+
+
+def test_rerun_recomputes_only_dirty_subgraph():
+    pipe = _pipe()
+    pipe.run()
+    cust = pipe.env["cust"]
+    new_orders = pd.DataFrame({"cust_id": [1, 2], "amount": [70, 5]})
+    result = pipe.rerun(changed={"orders": new_orders})
+    assert pipe.env["cust"] is cust
+    assert result.to_dict() == {"region": ["east"], "amount": [70]}
+
+
+def test_rerun_recomputes_evicted_inputs():
+    pipe = _pipe()
+    pipe.run(keep=[])
+    assert "cust" not in pipe.env
+    new_orders = pd.DataFrame({"cust_id": [2], "amount": [90]})
+    result = pipe.rerun(changed={"orders": new_orders})
+    assert result.to_dict() == {"region": ["west"], "amount": [90]}
+
+
+def test_rerun_rejects_unknown_sources():
+    pipe = _pipe()
+    pipe.run()
+    with pytest.raises(KeyError):
+        pipe.rerun(changed={"big": pd.DataFrame({"x": [1]})})
@@ -0,0 +1,103 @@
+import random
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe, RollingAggOperator
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+
+
+def _run(df, *args, **kwargs):
+    op = RollingAggOperator("events", *args, **kwargs)
+    return op.execute(InMemoryBackend(), {"events": df})[op.output_col]
+
+
+def _naive(values, window, agg):
+    out = []
+    for i in range(len(values)):
+        vals = [v for v in values[max(0, i - window + 1) : i + 1] if v is not None]
+        if agg == "count":
+            out.append(len(vals))
+        elif not vals:
+            out.append(None)
+        elif agg == "sum":
+            out.append(sum(vals))
+        elif agg == "mean":
+            out.append(sum(vals) / len(vals))
+        else:
+            out.append({"min": min, "max": max}[agg](vals))
+    return out
+
+
+@pytest.mark.parametrize("agg", ["sum", "mean", "count", "min", "max"])
+@pytest.mark.parametrize("window", [1, 3, 50])
+def test_row_windows_match_naive_recomputation(agg, window):
+    rng = random.Random(window)
+    values = [rng.choice([None, *range(-5, 6)]) for _ in range(200)]
+    out = _run(pd.DataFrame({"x": values}), "x", window, agg)
+    assert out == _naive(values, window, agg)
+
+
+def test_partitions_and_order_keep_input_row_order():
+    df = pd.DataFrame(
+        {
+            "cust": ["a", "b", "a", "b", "a"],
+            "seq": [3, 1, 1, 2, 2],
+            "amount": [30, 1, 10, 2, 20],
+        }
+    )
+    out = _run(df, "amount", 2, "sum", partition_by="cust", order_by="seq")
+    assert out == [50, 1, 10, 3, 30]
+    # the default column name is unchanged
+    op = RollingAggOperator("events", "amount", 2, "max")
+    out = op.execute(InMemoryBackend(), {"events": df})
+    assert out["amount_max2"] == [30, 30, 10, 10, 20]
+
+
+def test_time_windows():
+    day = datetime(2024, 1, 1)
+    times = [day + timedelta(days=d) for d in (0, 1, 6, 7, 7)]
+    times.insert(3, None)
+    df = pd.DataFrame({"ts": times, "amount": [1, 2, 4, 100, 8, 16]})
+    # (t - 7 days, t]: the first event drops out on day 7
+    out = _run(df, "amount", "7d", "sum", order_by="ts")
+    assert out == [1, 3, 7, None, 14, 30]
+    out = _run(df, "amount", timedelta(days=7), "count", order_by="ts")
+    assert out == [1, 2, 3, None, 3, 4]
+    op = RollingAggOperator("e", "amount", timedelta(days=7), "sum", order_by="ts")
+    assert (op.window, op.output_col) == ("7d", "amount_sum7d")
+    assert RollingAggOperator("e", "x", "90m", "sum", order_by="ts").window == "90m"
+    assert RollingAggOperator("e", "x", "1.5h", "sum", order_by="ts").window == "90m"
+    epoch = pd.DataFrame({"ts": [0, 3600, 7200], "amount": [1, 2, 4]})
+    assert _run(epoch, "amount", "1h", "min", order_by="ts") == [1, 2, 4]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        RollingAggOperator("e", "x", "7d", "sum")
+    with pytest.raises(ValueError):
+        RollingAggOperator("e", "x", "7 fortnights", "sum", order_by="ts")
+    with pytest.raises(ValueError):
+        RollingAggOperator("e", "x", 0, "sum")
+    with pytest.raises(ValueError):
+        RollingAggOperator("e", "x", 3, "median")
+
+
+def test_plan_options_reach_the_operator():
+    df = pd.DataFrame({"k": [1, 1, 2], "x": [1, 2, 3]})
+    plan = {
+        "dataframes": {"df": df},
+        "operations": [
+            {
+                "type": "rolling_agg",
+                "source": "df",
+                "on": "x",
+                "window": 2,
+                "agg": "sum",
+                "partition_by": "k",
+                "output_col": "running",
+            }
+        ],
+    }
+    assert ProcessPipe.build_pipe(plan).run()["running"] == [1, 3, 3]
@@ -0,0 +1,169 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe, RunHook
+from processpipe.processpipe_pkg.core import runtime_filter
+from processpipe.processpipe_pkg.core.bloom import BloomFilter
+from processpipe.processpipe_pkg.core.runtime_filter import (
+    KeyFilter,
+    plan_runtime_filters,
+)
+
+
+def _pipe(how="inner", **kwargs):
+    facts = pd.DataFrame(
+        {
+            "cid": [1, 2, 3, 4, 5, 6, 7, 8, 1, 2],
+            "amount": ["5", "7", "1", "9", "3", "8", "2", "6", "4", "5"],
+        }
+    )
+    customers = pd.DataFrame(
+        {"id": [1, 2, 3, 4], "region": ["east", "west", "east", "north"]}
+    )
+    return (
+        ProcessPipe(**kwargs)
+        .add_dataframe("facts", facts)
+        .add_dataframe("customers", customers)
+        .filter("customers", predicate="region == 'east'", output="east")
+        .cast("facts", casts={"amount": int}, output="typed")
+        .rename("typed", columns={"cid": "customer"}, output="renamed")
+        .filter("renamed", predicate="amount > 1", output="big")
+        .join("big", "east", on=[("customer", "id")], how=how, output="joined")
+    )
+
+
+@pytest.mark.parametrize("how", ["inner", "semi", "left", "anti", "right", "outer"])
+def test_same_result_with_and_without_filters(how):
+    expected = _pipe(how).run()
+    assert _pipe(how, runtime_filters=True).run().to_dict() == expected.to_dict()
+
+
+def test_filter_reaches_the_head_of_the_probe_chain():
+    pipe = _pipe(runtime_filters=True)
+    out = pipe.run()
+    assert out["amount"] == [5, 4]
+    report = pipe.last_run_report().to_dicts()
+    rows = {s["output"]: (s["rows_in"], s["rows_out"]) for s in report}
+    # the cast only sees the three fact rows of east customers
+    assert rows["typed"] == (10, 3)
+    assert rows["big"] == (3, 2)
+    # intermediates feeding the join are partial
+    assert pipe.env["renamed"]["customer"] == [1, 3, 1]
+
+
+def test_right_join_keeps_unmatched_right_rows():
+    def pipe(how, **kwargs):
+        return (
+            ProcessPipe(**kwargs)
+            .add_dataframe("l", pd.DataFrame({"k": [1, 2]}))
+            .add_dataframe("r", pd.DataFrame({"k": [1, 3, 4]}))
+            .filter("r", predicate="k > 0", output="rf")
+            .join("l", "rf", on=[("k", "k")], how=how, output="j")
+        )
+
+    out = pipe("right", runtime_filters=True).run()
+    assert sorted(out["k"]) == [1, 3, 4]
+    # only a chain on the left input is ever filtered; outer joins never are
+    assert plan_runtime_filters(pipe("right").ops, pipe("right").ops, ()) == []
+    outer = _pipe("outer")
+    assert plan_runtime_filters(outer.ops, outer.ops, ()) == []
+    right = _pipe("right")
+    plans = plan_runtime_filters(right.ops, right.ops, ())
+    assert [(p.build, p.source) for p in plans] == [("east", "facts")]
+
+
+def test_chain_stops_at_key_changes_and_shared_frames():
+    pipe = (
+        _pipe()
+        .cast("facts", casts={"cid": str}, output="keys_as_text")
+        .join("keys_as_text", "customers", on=[("cid", "id")], output="text_join")
+    )
+    plans = {p.join: p for p in plan_runtime_filters(pipe.ops, pipe.ops, ())}
+    assert plans["joined"].chain == ["typed", "renamed", "big"]
+    assert plans["joined"].source == "facts"
+    assert plans["joined"].columns == ["cid"]
+    assert "text_join" not in plans
+    # a frame read elsewhere (or requested by the caller) is never filtered
+    pipe.filter("renamed", predicate="amount > 8", output="huge")
+    plans = plan_runtime_filters(pipe.ops, pipe.ops, ())
+    assert [p.chain for p in plans] == [["big"]]
+    assert plan_runtime_filters(pipe.ops, pipe.ops, ["big"]) == []
+
+
+def test_rerun_refilters_when_the_build_side_changes():
+    pipe = _pipe(runtime_filters=True)
+    pipe.run()
+    customers = pd.DataFrame({"id": [5, 6], "region": ["east", "east"]})
+    out = pipe.rerun({"customers": customers})
+    assert out["customer"] == [5, 6]
+    assert out["amount"] == [3, 8]
+
+
+def test_filters_do_not_outlive_their_run():
+    class FailOnce(RunHook):
+        def on_operator_start(self, op):
+            if op.output == "typed" and not failed:
+                failed.append(op)
+                raise RuntimeError("boom")
+
+    failed = []
+    pipe = _pipe(runtime_filters=True).add_hook(FailOnce())
+    with pytest.raises(RuntimeError):
+        pipe.run()
+    pipe.runtime_filters = False
+    pipe.run()
+    assert len(pipe.env["typed"]["amount"]) == 10
+
+
+def test_concurrent_runs_filter_independently(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    async def both(pipe):
+        return await asyncio.gather(pipe.arun(), pipe.arun())
+
+    expected = _pipe().run()
+    for out in asyncio.run(both(_pipe(runtime_filters=True, max_workers=2))):
+        assert out.to_dict() == expected.to_dict()
+
+
+def test_parallel_run_waits_for_the_build_side(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    expected = _pipe().run()
+    out = _pipe(runtime_filters=True, max_workers=3).run()
+    assert out.to_dict() == expected.to_dict()
+
+
+def test_large_builds_use_a_bloom_filter(monkeypatch):
+    monkeypatch.setattr(runtime_filter, "EXACT_LIMIT", 1)
+    expected = _pipe().run()
+    assert _pipe(runtime_filters=True).run().to_dict() == expected.to_dict()
+
+
+def test_key_set_stops_growing_at_the_limit(monkeypatch):
+    sizes = []
+    from_keys = BloomFilter.from_keys.__func__
+
+    def record(cls, keys, capacity, fp_rate=0.01):
+        sizes.append(len(keys))
+        return from_keys(cls, keys, capacity, fp_rate)
+
+    monkeypatch.setattr(runtime_filter, "EXACT_LIMIT", 3)
+    monkeypatch.setattr(BloomFilter, "from_keys", classmethod(record))
+    plan = plan_runtime_filters(_pipe().ops, _pipe().ops, ())[0]
+    build = pd.DataFrame({"id": list(range(100))})
+    keys = KeyFilter.build(plan, build).keys
+    assert sizes == [4]
+    assert isinstance(keys, BloomFilter)
+    assert all(k in keys for k in range(100))
+    small = KeyFilter.build(plan, pd.DataFrame({"id": [1, 2, 2, 3, 3]})).keys
+    assert small == {1, 2, 3}
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter.from_keys(range(0, 20000, 2), 10000, fp_rate=0.01)
+    assert all(k in bloom for k in range(0, 20000, 2))
+    false_hits = sum(k in bloom for k in range(1, 20000, 2))
+    assert false_hits < 300
+    assert ("a", 1) not in BloomFilter(10)
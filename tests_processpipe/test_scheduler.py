@@ -0,0 +1,67 @@
+import time
+
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.scheduler import critical_path
+from processpipe.processpipe_pkg.decorators import op
+
+finished = []
+
+
+@op()
+def slow(a):
+    time.sleep(0.3)
+    finished.append("slow")
+    return a
+
+
+@op()
+def cheap(b):
+    finished.append("cheap")
+    return b
+
+
+@op()
+def after_cheap(cheap):
+    finished.append("after_cheap")
+    return cheap
+
+
+def test_ready_operators_do_not_wait_for_slow_siblings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    finished.clear()
+    frame = pd.DataFrame({"id": [1]})
+    pipe = (
+        ProcessPipe(max_workers=2)
+        .add_dataframe("a", frame)
+        .add_dataframe("b", frame)
+        ._append(slow())
+        ._append(cheap())
+        ._append(after_cheap())
+    )
+    pipe.run()
+    assert finished.index("after_cheap") < finished.index("slow")
+
+
+def test_critical_path_prefers_longer_chains():
+    pipe = (
+        ProcessPipe()
+        .add_dataframe("a", pd.DataFrame({"x": [1]}))
+        .filter("a", predicate="x > 0", output="short")
+        .filter("a", predicate="x > 0", output="long1")
+        .filter("long1", predicate="x > 0", output="long2")
+    )
+    depth = critical_path(pipe.ops)
+    assert depth == {"short": 1, "long1": 2, "long2": 1}
+
+
+def test_cycle_is_reported():
+    pipe = (
+        ProcessPipe()
+        .filter("y", predicate="x > 0", output="x")
+        .filter("x", predicate="x > 0", output="y")
+    )
+    with pytest.raises(ValueError):
+        pipe.run()
@@ -0,0 +1,122 @@
+import random
+
+import pandas as pd
+import pytest
+
+from processpipe import AggregationOperator, PartitionAggOperator
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.sketches import (
+    CountMinSketch,
+    HyperLogLog,
+    KLLSketch,
+)
+
+
+def test_hyperloglog_accuracy_and_merge():
+    small = HyperLogLog()
+    small.update([1, 2, 2, "x", None])
+    assert small.estimate() == 4  # exact below 128 distinct values
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(range(60_000))
+    right.update(range(40_000, 100_000))
+    assert abs(left.estimate() - 60_000) < 0.05 * 60_000
+    left.merge(right)
+    assert abs(left.estimate() - 100_000) < 0.05 * 100_000
+    assert left.nbytes == 4096
+    with pytest.raises(ValueError, match="precision"):
+        left.merge(HyperLogLog(precision=10))
+    right._seed += 1
+    with pytest.raises(ValueError, match="hash seeds"):
+        left.merge(right)
+
+
+def test_kll_quantiles_within_rank_error():
+    values = list(range(100_000))
+    random.Random(2).shuffle(values)
+    a, b = KLLSketch(), KLLSketch()
+    a.update(values[:50_000])
+    b.update(values[50_000:])
+    a.merge(b)
+    assert a.n == 100_000
+    assert sum(map(len, a._levels)) < 3 * a.k + 64
+    for q in (0.01, 0.5, 0.9, 0.99):
+        assert abs(a.quantile(q) - q * 100_000) < 0.02 * 100_000
+    exact = KLLSketch()
+    exact.update([5, 1, 4, 2, 3])
+    assert [exact.quantile(q) for q in (0, 0.5, 1)] == [1, 3, 5]
+    assert KLLSketch().quantile(0.5) is None
+
+
+def test_count_min_heavy_hitters():
+    rng = random.Random(4)
+    stream = [rng.randrange(5) for _ in range(20_000)]
+    stream += [rng.randrange(10_000) for _ in range(20_000)]
+    sketch = CountMinSketch(k=5)
+    for start in range(0, len(stream), 5000):
+        other = CountMinSketch(k=5)
+        other.update(stream[start : start + 5000])
+        sketch.merge(other)
+    counts = {}
+    for v in stream:
+        counts[v] = counts.get(v, 0) + 1
+    assert sorted(v for v, _ in sketch.top()) == [0, 1, 2, 3, 4]
+    for value in (0, 7, 9_999):
+        true = counts.get(value, 0)
+        assert true <= sketch.count(value) <= true + 0.005 * len(stream)
+    small = CountMinSketch()
+    small.update(["a", "b", "a"])
+    assert small.top(1) == [("a", 2)]
+
+
+def test_sketch_aggregates_in_agg_map():
+    rng = random.Random(6)
+    n = 30_000
+    df = pd.DataFrame(
+        {
+            "site": [i % 2 for i in range(n)],
+            "day": [i % 3 for i in range(n)],
+            "user": [rng.randrange(5000) for _ in range(n)],
+            "latency": [rng.random() for _ in range(n)],
+        }
+    )
+    op = AggregationOperator(
+        "t",
+        ["site", "day"],
+        {
+            "users": ("user", "approx_count_distinct"),
+            "latency": ["approx_median", "approx_p99"],
+            "user": "approx_top_k",
+        },
+        rollup=True,
+    )
+    out = op.execute(InMemoryBackend(), {"t": df})
+    total = out._rows[-1]
+    assert total["grouping_id"] == 3
+    assert abs(total["users"] - 5000) < 0.05 * 5000
+    assert abs(total["latency_approx_median"] - 0.5) < 0.03
+    assert abs(total["latency_approx_p99"] - 0.99) < 0.03
+    assert len(total["user"]) == 10
+    part = PartitionAggOperator("t", ["site"], {"user": "approx_count_distinct"})
+    sizes = part.execute(InMemoryBackend(), {"t": df})["user_approx_count_distinct"]
+    seen = [set(), set()]
+    for user, site in zip(df["user"], df["site"]):
+        seen[site].add(user)
+    for size, site in zip(sizes, df["site"]):
+        assert abs(size - len(seen[site])) < 0.05 * len(seen[site])
+
+
+def test_unknown_partition_aggregate_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported aggregation"):
+        PartitionAggOperator("t", ["a"], {"b": "approx_mode"})
+
+
+def test_count_min_top_k_finds_heavy_hitters_in_noise():
+    rng = random.Random(8)
+    heavy = [rng.randrange(10**9) for _ in range(10)]
+    stream = [rng.choice(heavy) for _ in range(20_000)]
+    stream += [rng.randrange(10**9) for _ in range(80_000)]
+    rng.shuffle(stream)
+    sketch = CountMinSketch()
+    for start in range(0, len(stream), 10_000):
+        sketch.update(stream[start : start + 10_000])
+    assert sorted(v for v, _ in sketch.top()) == sorted(heavy)
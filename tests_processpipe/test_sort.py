@@ -0,0 +1,77 @@
+import random
+
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe, SortOperator
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+
+
+def _frame(frame=pd.DataFrame, size=500):
+    rng = random.Random(3)
+    return frame(
+        {
+            "a": [rng.choice([None, 1, 2, 3]) for _ in range(size)],
+            "b": [rng.choice([None, "x", "y", "z"]) for _ in range(size)],
+            "i": list(range(size)),
+        }
+    )
+
+
+def _sort(df, by, **kwargs):
+    return SortOperator("t", by, **kwargs).execute(InMemoryBackend(), {"t": df})
+
+
+def _reference(df, by, ascending, nulls_first=False):
+    rows = list(df._rows)
+    for col, asc in reversed(list(zip(by, ascending))):
+        present = sorted(
+            (r for r in rows if r[col] is not None),
+            key=lambda r: r[col],
+            reverse=not asc,
+        )
+        missing = [r for r in rows if r[col] is None]
+        rows = missing + present if nulls_first else present + missing
+    return [r["i"] for r in rows]
+
+
+@pytest.mark.parametrize("ascending", [True, False, [True, False], [False, True]])
+@pytest.mark.parametrize("na_position", ["last", "first"])
+def test_directions_and_null_placement(ascending, na_position):
+    df = _frame()
+    out = _sort(df, ["a", "b"], ascending=ascending, na_position=na_position)
+    flags = ascending if isinstance(ascending, list) else [ascending] * 2
+    assert out["i"] == _reference(df, ["a", "b"], flags, na_position == "first")
+    assert out.columns == ["a", "b", "i"]
+
+
+def test_columnar_input_stays_columnar():
+    df = _frame(ColumnarFrame)
+    out = _sort(df, "a", ascending=False)
+    assert isinstance(out, ColumnarFrame)
+    assert out["i"] == _reference(df, ["a"], [False])
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        SortOperator("t", ["a", "b"], ascending=[True])
+    with pytest.raises(ValueError):
+        SortOperator("t", "a", na_position="middle")
+
+
+def test_plan_options_reach_the_operator():
+    df = pd.DataFrame({"x": [2, None, 1, 3]})
+    plan = {
+        "dataframes": {"df": df},
+        "operations": [
+            {
+                "type": "sort",
+                "source": "df",
+                "by": "x",
+                "ascending": False,
+                "na_position": "first",
+            }
+        ],
+    }
+    assert ProcessPipe.build_pipe(plan).run()["x"] == [None, 3, 2, 1]
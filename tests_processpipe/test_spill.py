@@ -0,0 +1,65 @@
+import os
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from processpipe import ProcessPipe
+from processpipe.processpipe_pkg.core.spill import SpillingEnv
+
+
+def _pipe(**kwargs):
+    orders = pd.DataFrame(
+        {"cust_id": [1, 1, 2, 3], "amount": [10.5, 40.0, 200.0, None]}
+    )
+    return (
+        ProcessPipe(**kwargs)
+        .add_dataframe("orders", orders)
+        .fill_na("orders", value=0.0, output="filled")
+        .filter("filled", predicate="amount > 20", output="big")
+        .group_size("filled", groupby="cust_id", output="sized")
+        .join("big", "sized", on="cust_id", output="joined")
+    )
+
+
+def test_spilled_frames_reload_transparently(tmp_path):
+    expected = _pipe().run()
+    pipe = _pipe(spill_enabled=True, spill_budget=1, spill_dir=str(tmp_path))
+    result = pipe.run()
+    assert_frame_equal(result, expected)
+    assert set(pipe.env.spilled) == {"filled", "big", "sized"}
+    assert len(os.listdir(pipe.env.directory)) == 3
+    assert pipe.env["filled"]["amount"] == [10.5, 40.0, 200.0, 0.0]
+
+
+def test_large_budget_keeps_frames_resident(tmp_path):
+    pipe = _pipe(spill_enabled=True, spill_dir=str(tmp_path))
+    pipe.run()
+    assert pipe.env.spilled == []
+
+
+def test_sources_are_never_spilled(tmp_path):
+    pipe = (
+        ProcessPipe(spill_enabled=True, spill_budget=1, spill_dir=str(tmp_path))
+        .add_dataframe("orders", pd.DataFrame({"cust_id": [1, 2], "amount": [5, 9]}))
+        .add_dataframe("customers", pd.DataFrame({"cust_id": [1, 2]}))
+        .join("orders", "customers", on="cust_id", output="joined")
+        .sort("joined", by="amount", output="sorted")
+    )
+    assert os.listdir(pipe.env.directory) == []
+    pipe.run()
+    assert pipe.env.spilled == ["joined"]
+    assert len(os.listdir(pipe.env.directory)) == 1
+
+
+def test_respill_after_delete_keeps_other_files(tmp_path):
+    env = SpillingEnv(budget=1, directory=str(tmp_path))
+    frames = {n: pd.DataFrame({"v": [i]}) for i, n in enumerate("abcd")}
+    for name in "abc":
+        env[name] = frames[name]
+    env["d"] = frames["d"]
+    assert set(env.spilled) == {"a", "b", "c"}
+    del env["a"]
+    env["e"] = pd.DataFrame({"v": [9]})
+    assert set(env.spilled) == {"b", "c", "d"}
+    for name in "bcd":
+        assert_frame_equal(env[name], frames[name])
@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from processpipe import ProcessPipe
+
+
+def _pipe():
+    orders = pd.DataFrame({"cust_id": [1, 1, 2], "amount": [10, 40, 200]})
+    return (
+        ProcessPipe()
+        .add_dataframe("orders", orders)
+        .aggregate(
+            "orders", groupby="cust_id", agg_map={"amount": "mean"}, output="cust_avg"
+        )
+        .filter("orders", predicate="amount > 20", output="big")
+        .sort("big", by="amount", ascending=False, output="report")
+    )
+
+
+def test_run_only_computes_target_ancestors():
+    pipe = _pipe()
+    result = pipe.run(targets=["cust_avg"])
+    assert result.to_dict() == {"cust_id": [1, 2], "amount": [25.0, 200.0]}
+    assert "big" not in pipe.env and "report" not in pipe.env
+
+
+def test_targets_survive_eviction():
+    pipe = _pipe()
+    pipe.run(targets=["big", "report"], keep=[])
+    assert {"big", "report"} <= set(pipe.env)
+
+
+def test_unknown_target_raises():
+    with pytest.raises(KeyError):
+        _pipe().run(targets=["nope"])
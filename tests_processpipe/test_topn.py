@@ -0,0 +1,91 @@
+import random
+
+import pandas as pd
+import pytest
+
+from processpipe import TopNOperator
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+from processpipe.processpipe_pkg.operators.topn import TopNAccumulator
+
+
+def _frame(frame=pd.DataFrame, size=300):
+    rng = random.Random(7)
+    return frame(
+        {
+            "g": [rng.choice("abc") for _ in range(size)],
+            "m": [rng.choice([None, *range(10)]) for _ in range(size)],
+            "s": [rng.choice(["x", "y", "z"]) for _ in range(size)],
+            "i": list(range(size)),
+        }
+    )
+
+
+def _reference(df, n, metrics, largest, group_keys=()):
+    """Stable sort per group, nulls last, then slice."""
+    groups = {}
+    for row in df._rows:
+        groups.setdefault(tuple(row[k] for k in group_keys), []).append(row)
+    out = []
+    for rows in groups.values():
+        for col, big in reversed(list(zip(metrics, largest))):
+            present = [r for r in rows if r[col] is not None]
+            present.sort(key=lambda r: r[col], reverse=big)
+            rows = present + [r for r in rows if r[col] is None]
+        out.extend(r["i"] for r in rows[:n])
+    return out
+
+
+def _top(df, n, **kwargs):
+    return TopNOperator("t", n, **kwargs).execute(InMemoryBackend(), {"t": df})
+
+
+@pytest.mark.parametrize(
+    "metric,largest",
+    [("m", True), ("m", False), (["s", "m"], True), (["s", "m"], [False, True])],
+)
+@pytest.mark.parametrize("groups", [(), ("g",)])
+def test_matches_a_stable_sort(metric, largest, groups):
+    df = _frame()
+    metrics = metric if isinstance(metric, list) else [metric]
+    flags = largest if isinstance(largest, list) else [largest] * len(metrics)
+    out = _top(
+        df,
+        7,
+        metric=metric,
+        largest=largest,
+        per_group=bool(groups),
+        group_keys=list(groups),
+    )
+    assert out["i"] == _reference(df, 7, metrics, flags, groups)
+
+
+def test_nulls_rank_last_and_columnar_frames_stay_columnar():
+    df = ColumnarFrame({"m": [None, 3, None, 1], "i": [0, 1, 2, 3]})
+    out = _top(df, 3, metric="m")
+    assert isinstance(out, ColumnarFrame)
+    assert out.to_dict() == {"m": [3, 1, None], "i": [1, 3, 0]}
+    assert _top(df, 0, metric="m").shape[0] == 0
+
+
+def test_largest_must_match_metrics():
+    with pytest.raises(ValueError):
+        _top(_frame(), 3, metric=["m", "s"], largest=[True, False, True])
+
+
+def test_accumulator_over_chunks_matches_operator():
+    df = _frame()
+    acc = TopNAccumulator(4, ["s", "m"], largest=[False, True], group_keys=["g"])
+    rows = df._rows
+    for start in range(0, len(rows), 64):
+        acc.add(pd.DataFrame([dict(r) for r in rows[start : start + 64]]))
+        assert all(len(held) <= 4 for held in acc._held.values())
+    expected = _top(
+        df,
+        4,
+        metric=["s", "m"],
+        largest=[False, True],
+        per_group=True,
+        group_keys=["g"],
+    )
+    assert acc.result().to_dict() == expected.to_dict()
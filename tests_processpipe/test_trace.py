@@ -0,0 +1,31 @@
+import json
+
+import pandas as pd
+
+from processpipe import ProcessPipe
+
+
+def test_run_writes_one_span_per_operator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    left = pd.DataFrame({"k": [1, 2, 3], "v": [5, 6, 7]})
+    pipe = (
+        ProcessPipe(max_workers=2)
+        .add_dataframe("left", left)
+        .filter("left", predicate="v > 5", output="a")
+        .filter("left", predicate="v > 6", output="b")
+        .union("a", "b", output="both")
+    )
+    pipe.run(trace="run.json")
+
+    events = json.loads((tmp_path / "run.json").read_text())["traceEvents"]
+    spans = {e["args"]["output"]: e for e in events if e.get("cat") == "operator"}
+    assert set(spans) == {"a", "b", "both"}
+    assert spans["both"]["args"]["inputs"] == ["a", "b"]
+    assert spans["both"]["args"]["rows_out"] == 3
+    for span in spans.values():
+        assert span["ph"] == "X" and span["dur"] >= 0
+        assert {"pid", "tid", "ts"} <= set(span)
+    # dependants start after their inputs finished
+    end_a = spans["a"]["ts"] + spans["a"]["dur"]
+    assert spans["both"]["ts"] >= end_a - 1
+    assert any(e["ph"] == "M" for e in events)
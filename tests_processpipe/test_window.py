@@ -0,0 +1,112 @@
+import pandas as pd
+import pytest
+
+from processpipe import WindowOperator, load_plan
+from processpipe.processpipe_pkg.core.backend import InMemoryBackend
+from processpipe.processpipe_pkg.core.frame import ColumnarFrame
+
+
+def _sessions(frame=pd.DataFrame):
+    return frame(
+        {
+            "user": ["a", "b", "a", "a", "b", "a"],
+            "ts": [3, 1, 1, 2, 2, 2],
+            "spend": [5, 1, None, 4, 7, 2],
+        }
+    )
+
+
+def _window(df, functions, **kwargs):
+    op = WindowOperator("t", functions, **kwargs)
+    return op.execute(InMemoryBackend(), {"t": df})
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, ColumnarFrame])
+def test_functions_share_one_pass(frame):
+    out = _window(
+        _sessions(frame),
+        {
+            "rn": "row_number",
+            "rk": "rank",
+            "drk": "dense_rank",
+            "prk": "percent_rank",
+            "prev": {"func": "lag", "column": "spend"},
+            "next": {"func": "lead", "column": "ts", "default": -1},
+            "total": {"func": "cumsum", "column": "spend"},
+            "low": {"func": "cummin", "column": "spend"},
+            "high": {"func": "cummax", "column": "spend"},
+        },
+        partition_by="user",
+        order_by="ts",
+    )
+    # rows keep input order; user "a" in ts order is rows 2, 3, 5, 0
+    assert out["ts"] == [3, 1, 1, 2, 2, 2]
+    assert out["rn"] == [4, 1, 1, 2, 2, 3]
+    assert out["rk"] == [4, 1, 1, 2, 2, 2]
+    assert out["drk"] == [3, 1, 1, 2, 2, 2]
+    assert out["prk"] == [1.0, 0.0, 0.0, 1 / 3, 1.0, 1 / 3]
+    assert out["prev"] == [2, None, None, None, 1, 4]
+    assert out["next"] == [-1, 2, 2, 2, -1, 3]
+    assert out["total"] == [11, 1, None, 4, 8, 6]
+    assert out["low"] == [2, 1, None, 4, 1, 2]
+    assert out["high"] == [5, 1, None, 4, 7, 4]
+
+
+def test_descending_order_and_offsets():
+    out = _window(
+        _sessions(),
+        {
+            "rn": "row_number",
+            "prev2": {"func": "lag", "column": "ts", "offset": 2, "default": 0},
+        },
+        order_by=["user", "ts"],
+        ascending=[True, False],
+    )
+    # order: a3 a2 a2 a1 b2 b1
+    assert out["rn"] == [1, 6, 4, 2, 5, 3]
+    assert out["prev2"] == [0, 1, 2, 0, 2, 3]
+
+
+def test_without_order_all_rows_are_peers():
+    out = _window(_sessions(), {"rk": "rank", "rn": "row_number"})
+    assert out["rk"] == [1] * 6
+    assert out["rn"] == [1, 2, 3, 4, 5, 6]
+
+
+def test_null_order_values_go_last():
+    df = pd.DataFrame({"x": [None, 2, 1]})
+    out = _window(df, {"rn": "row_number"}, order_by="x")
+    assert out["rn"] == [3, 2, 1]
+    out = _window(df, {"rn": "row_number"}, order_by="x", na_position="first")
+    assert out["rn"] == [1, 3, 2]
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="Unsupported window function"):
+        WindowOperator("t", {"x": "ntile"})
+    with pytest.raises(ValueError, match="needs a column"):
+        WindowOperator("t", {"x": "lag"})
+    with pytest.raises(ValueError, match="ascending"):
+        WindowOperator("t", {"x": "rank"}, order_by="a", ascending=[True, False])
+
+
+def test_yaml_plan(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "plan.yaml"
+    path.write_text(
+        """
+dataframes:
+  clicks: {user: [a, a, b], ts: [2, 1, 1]}
+operations:
+  - type: window
+    source: clicks
+    partition_by: user
+    order_by: ts
+    functions:
+      n: row_number
+      prev_ts: {func: lag, column: ts}
+"""
+    )
+    out = load_plan(path).run()
+    assert out["n"] == [2, 1, 1]
+    assert out["prev_ts"] == [1, None, None]